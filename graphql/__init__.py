@@ -31,6 +31,7 @@ from .graphql import (
 # Create and operate on GraphQL type definitions and schema.
 from .type import (  # no import order
     GraphQLSchema,
+    SchemaView,
 
     # Definitions
     GraphQLScalarType,
@@ -152,6 +153,16 @@ from .utils.base import (
     # Build a GraphQLSchema from a parsed GraphQL Schema language AST.
     build_ast_schema,
 
+    # Snapshot a GraphQLSchema, and restore it without building it again.
+    get_schema_snapshot,
+    build_schema_from_snapshot,
+    dump_schema_snapshot,
+    load_schema_snapshot,
+
+    # Fingerprint the structure of a GraphQLSchema, for cache keys.
+    get_schema_fingerprint,
+    get_type_fingerprints,
+
     # Extends an existing GraphQLSchema from a parsed GraphQL Schema
     # language AST.
     extend_schema,
@@ -216,6 +227,7 @@ __all__ = (
     'GraphQLObjectType',
     'GraphQLScalarType',
     'GraphQLSchema',
+    'SchemaView',
     'GraphQLString',
     'GraphQLUnionType',
     'GraphQLDirective',
@@ -268,10 +280,16 @@ __all__ = (
     'ast_from_value',
     'build_ast_schema',
     'build_client_schema',
+    'build_schema_from_snapshot',
+    'dump_schema_snapshot',
+    'get_schema_snapshot',
+    'get_type_fingerprints',
+    'load_schema_snapshot',
     'concat_ast',
     'do_types_overlap',
     'extend_schema',
     'get_operation_ast',
+    'get_schema_fingerprint',
     'introspection_query',
     'is_equal_type',
     'is_type_sub_type_of',
@@ -21,6 +21,10 @@ single level of the query. These include:
 from .executor import execute, subscribe
 from .base import ExecutionResult, ResolveInfo
 from .middleware import middlewares, MiddlewareManager
+from .coalescing import ExecutionCoalescer
+from .introspection_cache import IntrospectionCache
+from .subscription_hub import SubscriptionHub
+from .event_window import EventWindow
 
 
 __all__ = [
@@ -29,5 +33,9 @@ __all__ = [
     'ExecutionResult',
     'ResolveInfo',
     'MiddlewareManager',
-    'middlewares'
+    'middlewares',
+    'ExecutionCoalescer',
+    'IntrospectionCache',
+    'SubscriptionHub',
+    'EventWindow',
 ]
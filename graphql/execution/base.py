@@ -22,9 +22,11 @@ class ExecutionContext(object):
     and the fragments defined in the query document"""
 
     __slots__ = 'schema', 'fragments', 'root_value', 'operation', 'variable_values', 'errors', 'context_value', \
-                'argument_values_cache', 'executor', 'middleware', 'allow_subscriptions', '_subfields_cache'
+                'argument_values_cache', 'executor', 'middleware', 'allow_subscriptions', '_subfields_cache', \
+                'event_window'
 
-    def __init__(self, schema, document_ast, root_value, context_value, variable_values, operation_name, executor, middleware, allow_subscriptions):
+    def __init__(self, schema, document_ast, root_value, context_value, variable_values, operation_name, executor, middleware, allow_subscriptions,
+                 event_window=None):
         """Constructs a ExecutionContext object from the arguments passed
         to execute, which we will pass throughout the other execution
         methods."""
@@ -74,6 +76,7 @@ class ExecutionContext(object):
         self.middleware = middleware
         self.allow_subscriptions = allow_subscriptions
         self._subfields_cache = {}
+        self.event_window = event_window
 
     def get_field_resolver(self, field_resolver):
         if not self.middleware:
@@ -333,6 +336,10 @@ def get_field_def(schema, parent_type, field_name):
     are allowed, like on a Union. __schema could get automatically
     added to the query type, but that would require mutating type
     definitions, which would cause issues."""
+    field_defs = schema.get_field_defs(parent_type)
+    if field_defs is not None:
+        return field_defs.get(field_name)
+
     if field_name == '__schema' and schema.get_query_type() == parent_type:
         return SchemaMetaFieldDef
     elif field_name == '__type' and schema.get_query_type() == parent_type:
@@ -0,0 +1,166 @@
+from threading import Event, Lock
+
+from promise import Promise, is_thenable
+from six import string_types
+
+from ..utils.get_operation_ast import get_operation_ast
+from .executor import execute
+
+
+def default_coalescing_key(schema, document_ast, root_value, context_value, variable_values, operation_name):
+    """Coalesces operations on the same schema with the same document, variables
+    and operation name.
+
+    The root and context values are left out, as most servers build a new
+    context for each request. If resolvers depend on them, for example on
+    the current user, provide a `key_fn` that includes the parts they
+    depend on, or that returns `None` for such operations."""
+    loc = document_ast.loc
+    if loc and loc.source:
+        document_key = loc.source.body
+    else:
+        # The document is referenced by the in flight execution, so its
+        # id can't be reused while the key is alive.
+        document_key = id(document_ast)
+
+    return id(schema), document_key, freeze_value(variable_values), operation_name
+
+
+def get_options_key(options):
+    """Returns a hashable key for the execution options, such as `middleware`
+    or `executor`, compared by identity."""
+    return tuple(sorted((name, get_identity_key(value)) for name, value in options.items()))
+
+
+def get_identity_key(value):
+    """Returns a hashable key for a value compared by identity. The value must
+    be kept alive for as long as the key is used, so its id isn't reused."""
+    if value is None or isinstance(value, bool):
+        return value
+    return id(value)
+
+
+def freeze_value(value):
+    """Converts variable values into an equivalent hashable value."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze_value(item)) for key, item in value.items()))
+
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(item) for item in value)
+
+    if value is None or isinstance(value, (string_types, bool, int, float)):
+        return value
+
+    hash(value)
+    return value
+
+
+class InFlight(object):
+    __slots__ = 'event', 'result', 'error', 'inputs', 'promises'
+
+    def __init__(self, inputs):
+        self.event = Event()
+        self.result = None
+        self.error = None
+        # Keeps the values whose ids are part of the key alive.
+        self.inputs = inputs
+        # The promises of followers that came before the leader's result.
+        self.promises = []
+
+
+class ExecutionCoalescer(object):
+    """Shares one execution between concurrent callers of identical operations.
+
+    While an operation is in flight, every other call with the same key
+    waits for it and receives the very same `ExecutionResult`. Calls with
+    `return_promise=True` don't block: they receive the Promise of the
+    first call, or one that follows it. Mutations and subscriptions are
+    never coalesced, nor are calls with different execution options, such
+    as `middleware`, `executor` or `return_promise`.
+
+    Example:
+
+        coalescer = ExecutionCoalescer()
+        result = graphql(schema, query, coalescer=coalescer)
+
+    `key_fn` receives `(schema, document_ast, root_value, context_value,
+    variable_values, operation_name)` and must return a hashable key, or
+    `None` to execute the operation without coalescing.
+    """
+
+    def __init__(self, key_fn=None):
+        self.key_fn = key_fn or default_coalescing_key
+        self.in_flight = {}
+        self.lock = Lock()
+        self.coalesced = 0
+
+    def get_key(self, schema, document_ast, root_value, context_value, variable_values, operation_name):
+        operation = get_operation_ast(document_ast, operation_name)
+        if not operation or operation.operation != 'query':
+            return None
+
+        try:
+            key = self.key_fn(schema, document_ast, root_value, context_value, variable_values, operation_name)
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def execute(self, schema, document_ast, root_value=None, context_value=None,
+                variable_values=None, operation_name=None, **options):
+        key = self.get_key(schema, document_ast, root_value, context_value, variable_values, operation_name)
+        if key is None:
+            return execute(schema, document_ast, root_value, context_value,
+                           variable_values=variable_values, operation_name=operation_name, **options)
+
+        # The options change how the operation is executed and what is
+        # returned, so only calls with the same options are coalesced.
+        key = key, get_options_key(options)
+
+        with self.lock:
+            in_flight = self.in_flight.get(key)
+            is_leader = in_flight is None
+            if is_leader:
+                in_flight = self.in_flight[key] = InFlight((schema, document_ast, root_value, context_value, options))
+            else:
+                self.coalesced += 1
+                if options.get('return_promise') and not in_flight.event.is_set():
+                    # Chain on the leader instead of blocking the caller.
+                    promise = Promise()
+                    in_flight.promises.append(promise)
+                    return promise
+
+        if not is_leader:
+            in_flight.event.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.result
+
+        is_async = False
+        try:
+            result = execute(schema, document_ast, root_value, context_value,
+                             variable_values=variable_values, operation_name=operation_name, **options)
+            in_flight.result = result
+            if is_thenable(result):
+                # Followers share the promise until it's settled.
+                is_async = True
+                Promise.resolve(result).done(lambda _: self.release(key), lambda _: self.release(key))
+            return result
+        except Exception as e:
+            in_flight.error = e
+            raise
+        finally:
+            if not is_async:
+                self.release(key)
+            with self.lock:
+                in_flight.event.set()
+                promises, in_flight.promises = in_flight.promises, None
+            for promise in promises:
+                if in_flight.error is not None:
+                    promise.do_reject(in_flight.error)
+                else:
+                    promise.do_resolve(in_flight.result)
+
+    def release(self, key):
+        with self.lock:
+            self.in_flight.pop(key, None)
@@ -0,0 +1,216 @@
+import sys
+from threading import Lock
+
+from promise import Promise
+
+PENDING = 0
+FULFILLED = 1
+REJECTED = 2
+
+# Deferreds may be settled from the threads of an executor, so their state
+# and callbacks, and the counters of joins, are updated with this lock held.
+# Callbacks are always called without it.
+_lock = Lock()
+
+
+class Deferred(object):
+    """A minimal continuation used internally by the executor.
+
+    Unlike `promise.Promise`, callbacks are invoked synchronously as soon as
+    the value is settled, and joins over lists and dicts (`Deferred.all`,
+    `Deferred.for_dict`) are implemented with a simple counter instead of
+    allocating an intermediate promise per item.
+
+    Deferreds never leave the executor: they are converted to a `Promise`
+    with `to_promise` at the public boundary.
+    """
+
+    __slots__ = '_state', '_value', '_traceback', '_callbacks'
+
+    def __init__(self):
+        self._state = PENDING
+        self._value = None
+        self._traceback = None
+        self._callbacks = None
+
+    @classmethod
+    def resolved(cls, value):
+        deferred = cls()
+        deferred._state = FULFILLED
+        deferred._value = value
+        return deferred
+
+    @classmethod
+    def rejected(cls, error, traceback=None):
+        deferred = cls()
+        deferred._state = REJECTED
+        deferred._value = error
+        deferred._traceback = traceback
+        return deferred
+
+    @classmethod
+    def from_thenable(cls, thenable):
+        """Adopts the eventual value of any thenable (Promise, Future, coroutine...)."""
+        if isinstance(thenable, Deferred):
+            return thenable
+
+        if not isinstance(thenable, Promise):
+            thenable = Promise.resolve(thenable)
+
+        deferred = cls()
+        thenable.done(deferred.resolve, deferred.reject)
+        return deferred
+
+    @property
+    def is_pending(self):
+        return self._state == PENDING
+
+    @property
+    def is_fulfilled(self):
+        return self._state == FULFILLED
+
+    @property
+    def is_rejected(self):
+        return self._state == REJECTED
+
+    @property
+    def value(self):
+        return self._value
+
+    def resolve(self, value):
+        if self._state != PENDING:
+            return
+
+        if isinstance(value, Deferred):
+            value._add_callbacks(self.resolve, self.reject)
+            return
+
+        with _lock:
+            if self._state != PENDING:
+                return
+            self._state = FULFILLED
+            self._value = value
+            callbacks, self._callbacks = self._callbacks, None
+
+        if callbacks:
+            for on_resolve, _ in callbacks:
+                on_resolve(value)
+
+    def reject(self, error, traceback=None):
+        if self._state != PENDING:
+            return
+
+        traceback = traceback or getattr(error, 'stack', None)
+        with _lock:
+            if self._state != PENDING:
+                return
+            self._state = REJECTED
+            self._value = error
+            self._traceback = traceback
+            callbacks, self._callbacks = self._callbacks, None
+
+        if callbacks:
+            for _, on_reject in callbacks:
+                on_reject(error, traceback)
+
+    def then(self, on_resolve=None, on_reject=None):
+        deferred = Deferred()
+
+        def fulfilled(value):
+            if on_resolve is None:
+                deferred.resolve(value)
+                return
+            try:
+                deferred.resolve(on_resolve(value))
+            except Exception as e:
+                deferred.reject(e, sys.exc_info()[2])
+
+        def rejected(error, traceback=None):
+            if on_reject is None:
+                deferred.reject(error, traceback)
+                return
+            try:
+                deferred.resolve(on_reject(error))
+            except Exception as e:
+                deferred.reject(e, sys.exc_info()[2])
+
+        self._add_callbacks(fulfilled, rejected)
+        return deferred
+
+    def catch(self, on_reject):
+        return self.then(None, on_reject)
+
+    def to_promise(self):
+        if self._state == FULFILLED:
+            return Promise.resolve(self._value)
+
+        promise = Promise()
+
+        def on_reject(error, traceback=None):
+            promise.do_reject(error, traceback=traceback)
+
+        self._add_callbacks(promise.do_resolve, on_reject)
+        return promise
+
+    def _add_callbacks(self, on_resolve, on_reject):
+        if self._state == PENDING:
+            with _lock:
+                if self._state == PENDING:
+                    if self._callbacks is None:
+                        self._callbacks = [(on_resolve, on_reject)]
+                    else:
+                        self._callbacks.append((on_resolve, on_reject))
+                    return
+
+        if self._state == FULFILLED:
+            on_resolve(self._value)
+        else:
+            on_reject(self._value, self._traceback)
+
+    @classmethod
+    def all(cls, values):
+        """Joins a list in which some items are Deferreds into a Deferred list.
+
+        Resolved items are written back into `values`, which is then used as
+        the resolved value."""
+        return _join(values, range(len(values)))
+
+    @classmethod
+    def for_dict(cls, values):
+        """Joins a dict in which some values are Deferreds into a Deferred dict.
+
+        Like `Deferred.all`, resolved values are written back into `values`,
+        so the key order (and mapping type) is preserved."""
+        return _join(values, values.keys())
+
+
+def _join(values, keys):
+    deferred = Deferred()
+    pending = [0]
+
+    def on_reject(error, traceback=None):
+        deferred.reject(error, traceback)
+
+    def make_on_resolve(key):
+        def on_resolve(value):
+            values[key] = value
+            with _lock:
+                pending[0] -= 1
+                is_done = not pending[0]
+            if is_done:
+                deferred.resolve(values)
+
+        return on_resolve
+
+    waiting = [(key, values[key]) for key in keys if isinstance(values[key], Deferred)]
+    pending[0] = len(waiting)
+    if not waiting:
+        deferred.resolve(values)
+        return deferred
+
+    for key, value in waiting:
+        value._add_callbacks(make_on_resolve(key), on_reject)
+        if deferred._state == REJECTED:
+            break
+
+    return deferred
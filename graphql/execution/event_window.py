@@ -0,0 +1,63 @@
+from ..pyutils.ordereddict import OrderedDict
+
+
+class EventWindow(object):
+    """Coalesces the source events of a subscription before they are completed.
+
+    Events are grouped into windows that close after `count` events or `time`
+    seconds, whichever comes first. The events of a window are then reduced
+    to:
+
+    - the latest event, by default;
+    - the latest event for each `key(event)`, if a `key` is given;
+
+    and completed one by one, or, with `batch=True`, delivered together as a
+    single result whose field value is the list of completed events (in this
+    case all the events of the window are kept unless a `key` is given).
+
+    Example:
+
+        # At most one result every 100ms, with the latest price of each symbol.
+        subscribe(schema, ast, event_window=EventWindow(
+            time=0.1, key=lambda tick: tick.symbol, batch=True))
+    """
+
+    __slots__ = 'count', 'time', 'key', 'batch'
+
+    def __init__(self, count=None, time=None, key=None, batch=False):
+        assert count or time, 'EventWindow must be bounded by a count or a time.'
+        if key is not None:
+            assert callable(key), 'EventWindow key must be a function.'
+
+        self.count = count
+        self.time = time
+        self.key = key
+        self.batch = batch
+
+    def coalesce(self, events):
+        if self.key is None:
+            return list(events) if self.batch else list(events[-1:])
+
+        latest = OrderedDict()
+        for event in events:
+            key = self.key(event)
+            # Keep the coalesced events in the order they were last seen.
+            latest.pop(key, None)
+            latest[key] = event
+        return list(latest.values())
+
+    def apply_to_observable(self, observable):
+        """Returns an Observable of the coalesced events, as lists if `batch` is set."""
+        from rx import Observable
+
+        if self.count and self.time:
+            windows = observable.buffer_with_time_or_count(int(self.time * 1000), self.count)
+        elif self.count:
+            windows = observable.buffer_with_count(self.count)
+        else:
+            windows = observable.buffer_with_time(int(self.time * 1000))
+
+        coalesced = windows.filter(bool).map(self.coalesce)
+        if self.batch:
+            return coalesced
+        return coalesced.flat_map(Observable.from_)
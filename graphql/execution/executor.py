@@ -2,10 +2,9 @@ import collections
 import functools
 import logging
 import sys
-from rx import Observable
 
 from six import string_types
-from promise import Promise, promise_for_dict, is_thenable
+from promise import Promise, is_thenable
 
 from ..error import GraphQLError, GraphQLLocatedError
 from ..pyutils.default_ordered_dict import DefaultOrderedDict
@@ -17,20 +16,54 @@ from ..type import (GraphQLEnumType, GraphQLInterfaceType, GraphQLList,
 from .base import (ExecutionContext, ExecutionResult, ResolveInfo,
                    collect_fields, default_resolve_fn, get_field_def,
                    get_operation_root_type, SubscriberExecutionContext)
+from .deferred import Deferred
 from .executors.sync import SyncExecutor
 from .middleware import MiddlewareManager
 
+try:
+    from rx import Observable
+except ImportError:
+    # RxPY is only needed for subscriptions that return Observables.
+    class Observable(object):
+        pass
+
+try:
+    from .executors.asyncio_iterators import (BufferedAsyncIterator, MapAsyncIterator,
+                                              MergedAsyncIterator, WindowedAsyncIterator,
+                                              is_async_iterable)
+except Exception:
+    def is_async_iterable(obj):
+        return False
+
 logger = logging.getLogger(__name__)
 
 
 def subscribe(*args, **kwargs):
+    """Executes a subscription operation.
+
+    Subscription resolvers may return an Observable, in which case an
+    Observable of `ExecutionResult`s is returned, or an async iterable (such
+    as an async generator), in which case an async iterator is returned.
+
+    For async iterables, `buffer_size` bounds the results buffered for a
+    slow consumer and `overflow_policy` (see `OverflowPolicy`) decides what
+    to do when that buffer is full. Without a `buffer_size`, the source is
+    only pulled when the consumer asks for the next result.
+
+    An `event_window` (see `EventWindow`) coalesces or batches the source
+    events before they are completed."""
     allow_subscriptions = kwargs.pop('allow_subscriptions', True)
-    return execute(*args, allow_subscriptions=allow_subscriptions, **kwargs)
+    buffer_size = kwargs.pop('buffer_size', None)
+    overflow_policy = kwargs.pop('overflow_policy', None)
+    result = execute(*args, allow_subscriptions=allow_subscriptions, **kwargs)
+    if buffer_size and is_async_iterable(result):
+        return BufferedAsyncIterator(result, buffer_size, overflow_policy)
+    return result
 
 
 def execute(schema, document_ast, root_value=None, context_value=None,
             variable_values=None, operation_name=None, executor=None,
-            return_promise=False, middleware=None, allow_subscriptions=False):
+            return_promise=False, middleware=None, allow_subscriptions=False, event_window=None):
     assert schema, 'Must provide schema'
     assert isinstance(schema, GraphQLSchema), (
         'Schema must be an instance of GraphQLSchema. Also ensure that there are ' +
@@ -58,18 +91,22 @@ def execute(schema, document_ast, root_value=None, context_value=None,
         operation_name,
         executor,
         middleware,
-        allow_subscriptions
+        allow_subscriptions,
+        event_window
     )
 
     def executor(v):
-        return execute_operation(context, context.operation, root_value)
+        data = execute_operation(context, context.operation, root_value)
+        if isinstance(data, Deferred):
+            return data.to_promise()
+        return data
 
     def on_rejected(error):
         context.errors.append(error)
         return None
 
     def on_resolve(data):
-        if isinstance(data, Observable):
+        if isinstance(data, Observable) or is_async_iterable(data):
             return data
 
         if not context.errors:
@@ -124,12 +161,12 @@ def execute_fields_serially(exe_context, parent_type, source_value, fields):
         if result is Undefined:
             return results
 
-        if is_thenable(result):
+        if isinstance(result, Deferred):
             def collect_result(resolved_result):
                 results[response_name] = resolved_result
                 return results
 
-            return result.then(collect_result, None)
+            return result.then(collect_result)
 
         results[response_name] = result
         return results
@@ -137,7 +174,7 @@ def execute_fields_serially(exe_context, parent_type, source_value, fields):
     def execute_field(prev_promise, response_name):
         return prev_promise.then(lambda results: execute_field_callback(results, response_name))
 
-    return functools.reduce(execute_field, fields.keys(), Promise.resolve(collections.OrderedDict()))
+    return functools.reduce(execute_field, fields.keys(), Deferred.resolved(collections.OrderedDict()))
 
 
 def execute_fields(exe_context, parent_type, source_value, fields, info):
@@ -151,16 +188,20 @@ def execute_fields(exe_context, parent_type, source_value, fields, info):
             continue
 
         final_results[response_name] = result
-        if is_thenable(result):
+        if isinstance(result, Deferred):
             contains_promise = True
 
     if not contains_promise:
         return final_results
 
-    return promise_for_dict(final_results)
+    return Deferred.for_dict(final_results)
 
 
 def subscribe_fields(exe_context, parent_type, source_value, fields):
+    """Subscribes to every root field, merging their events into one stream.
+
+    All the fields share the same execution context, and each event produces
+    an `ExecutionResult` with the data of the field it was emitted for."""
     exe_context = SubscriberExecutionContext(exe_context)
 
     def on_error(error):
@@ -174,27 +215,41 @@ def subscribe_fields(exe_context, parent_type, source_value, fields):
         exe_context.reset()
         return result
 
-    observables = []
-
-    # assert len(fields) == 1, "Can only subscribe one element at a time."
-
-    for response_name, field_asts in fields.items():
+    def map_stream(response_name, stream):
+        if is_async_iterable(stream):
+            def catch_async_error(error):
+                exe_context.errors.append(error)
+                return map_result({response_name: None})
 
-        result = subscribe_field(exe_context, parent_type, source_value, field_asts)
-        if result is Undefined:
-            continue
+            return MapAsyncIterator(stream, lambda data: map_result({response_name: data}), catch_async_error)
 
         def catch_error(error):
             exe_context.errors.append(error)
             return Observable.just(None)
 
         # Map observable results
-        observable = result.catch_exception(catch_error).map(
+        return stream.catch_exception(catch_error).map(
             lambda data: map_result({response_name: data}))
-        return observable
-        observables.append(observable)
 
-    return Observable.merge(observables)
+    streams = []
+    for response_name, field_asts in fields.items():
+        result = subscribe_field(exe_context, parent_type, source_value, field_asts)
+        if result is Undefined:
+            continue
+
+        streams.append(map_stream(response_name, result))
+
+    if len(streams) == 1:
+        return streams[0]
+
+    if streams and all(is_async_iterable(stream) for stream in streams):
+        return MergedAsyncIterator(streams)
+
+    if any(is_async_iterable(stream) for stream in streams):
+        from .executors.asyncio_utils import asyncgen_to_observable
+        streams = [asyncgen_to_observable(stream) if is_async_iterable(stream) else stream for stream in streams]
+
+    return Observable.merge(streams)
 
 
 def resolve_field(exe_context, parent_type, source, field_asts, parent_info):
@@ -294,17 +349,34 @@ def subscribe_field(exe_context, parent_type, source, field_asts):
     if isinstance(result, Exception):
         raise result
 
+    def complete_event(value):
+        completed = complete_value_catching_error(exe_context, return_type, field_asts, info, value)
+        if isinstance(completed, Deferred):
+            return completed.to_promise()
+        return completed
+
+    def complete_batch(values):
+        completed = [complete_value_catching_error(exe_context, return_type, field_asts, info, value)
+                     for value in values]
+        if any(isinstance(item, Deferred) for item in completed):
+            return Deferred.all(completed).to_promise()
+        return completed
+
+    event_window = exe_context.event_window
+    complete = complete_batch if event_window and event_window.batch else complete_event
+
+    if is_async_iterable(result):
+        if event_window:
+            result = WindowedAsyncIterator(result, event_window)
+        return MapAsyncIterator(result, complete)
+
     if not isinstance(result, Observable):
         raise GraphQLError(
             'Subscription must return Async Iterable or Observable. Received: {}'.format(repr(result)))
 
-    return result.map(functools.partial(
-        complete_value_catching_error,
-        exe_context,
-        return_type,
-        field_asts,
-        info,
-    ))
+    if event_window:
+        result = event_window.apply_to_observable(result)
+    return result.map(complete)
 
 
 def resolve_or_error(resolve_fn, source, info, args, executor):
@@ -328,7 +400,7 @@ def complete_value_catching_error(exe_context, return_type, field_asts, info, re
     # resolving a null value for this field if one is encountered.
     try:
         completed = complete_value(exe_context, return_type, field_asts, info, result)
-        if is_thenable(completed):
+        if isinstance(completed, Deferred):
             def handle_error(error):
                 traceback = completed._traceback
                 exe_context.report_error(error, traceback)
@@ -365,7 +437,10 @@ def complete_value(exe_context, return_type, field_asts, info, result):
     # If field type is NonNull, complete for inner type, and throw field error
     # if result is null.
     if is_thenable(result):
-        return Promise.resolve(result).then(
+        def on_reject(error):
+            raise GraphQLLocatedError(field_asts, original_error=error)
+
+        return Deferred.from_thenable(result).then(
             lambda resolved: complete_value(
                 exe_context,
                 return_type,
@@ -373,8 +448,7 @@ def complete_value(exe_context, return_type, field_asts, info, result):
                 info,
                 resolved
             ),
-            lambda error: Promise.rejected(
-                GraphQLLocatedError(field_asts, original_error=error))
+            on_reject
         )
 
     # print return_type, type(result)
@@ -424,13 +498,13 @@ def complete_list_value(exe_context, return_type, field_asts, info, result):
     for item in result:
         info.path = path + [index]
         completed_item = complete_value_catching_error(exe_context, item_type, field_asts, info, item)
-        if not contains_promise and is_thenable(completed_item):
+        if not contains_promise and isinstance(completed_item, Deferred):
             contains_promise = True
 
         completed_results.append(completed_item)
         index += 1
 
-    return Promise.all(completed_results) if contains_promise else completed_results
+    return Deferred.all(completed_results) if contains_promise else completed_results
 
 
 def complete_leaf_value(return_type, result):
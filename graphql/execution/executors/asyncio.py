@@ -28,13 +28,6 @@ except ImportError:
             raise TypeError(
                 'A Future, a coroutine or an awaitable is required')
 
-try:
-    from .asyncio_utils import asyncgen_to_observable, isasyncgen
-except Exception:
-    def isasyncgen(obj): False
-
-    def asyncgen_to_observable(asyncgen): pass
-
 
 class AsyncioExecutor(object):
 
@@ -58,6 +51,4 @@ class AsyncioExecutor(object):
             future = ensure_future(result, loop=self.loop)
             self.futures.append(future)
             return Promise.resolve(future)
-        elif isasyncgen(result):
-            return asyncgen_to_observable(result)
         return result
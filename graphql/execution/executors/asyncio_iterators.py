@@ -0,0 +1,402 @@
+from asyncio import (FIRST_COMPLETED, CancelledError, ensure_future,
+                     get_event_loop, wait)
+from collections import deque
+
+from promise import Promise, is_thenable
+
+
+class OverflowPolicy(object):
+    # Discard the oldest buffered item to make room for the new one.
+    DROP_OLDEST = 'DROP_OLDEST'
+    # Replace the newest buffered item, so only the latest value is kept.
+    COALESCE_LATEST = 'COALESCE_LATEST'
+    # End the subscription with a `SubscriptionOverflowError`.
+    DISCONNECT = 'DISCONNECT'
+
+
+class SubscriptionOverflowError(Exception):
+    pass
+
+
+def is_async_iterable(obj):
+    return hasattr(obj, '__aiter__')
+
+
+async def close_async_iterator(iterator):
+    aclose = getattr(iterator, 'aclose', None)
+    if aclose is not None:
+        await aclose()
+
+
+class MapAsyncIterator(object):
+    """Maps the items of an async iterable with `fn`, awaiting the mapped
+    value if it's thenable (as it is when completion resolves asynchronously).
+
+    If the source raises, `on_error` is called with the exception and its
+    return value is yielded as the last item."""
+
+    def __init__(self, source, fn, on_error=None):
+        self.iterator = source.__aiter__()
+        self.fn = fn
+        self.on_error = on_error
+        self.is_closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.is_closed:
+            raise StopAsyncIteration
+
+        try:
+            value = await self.iterator.__anext__()
+        except StopAsyncIteration:
+            self.is_closed = True
+            raise
+        except CancelledError:
+            raise
+        except Exception as e:
+            await self.aclose()
+            if self.on_error is None:
+                raise
+            value = self.on_error(e)
+        else:
+            value = self.fn(value)
+
+        if is_thenable(value):
+            value = await Promise.resolve(value)
+        return value
+
+    async def aclose(self):
+        if not self.is_closed:
+            self.is_closed = True
+            await close_async_iterator(self.iterator)
+
+
+async def next_item(iterator):
+    return await iterator.__anext__()
+
+
+class MergedAsyncIterator(object):
+    """Yields the items of several async iterables as soon as any of them
+    produces one, ending once all of them are exhausted."""
+
+    def __init__(self, sources, loop=None):
+        self.iterators = [source.__aiter__() for source in sources]
+        self.loop = loop or get_event_loop()
+        self.pending = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.pending is None:
+            self.pending = {
+                ensure_future(next_item(iterator), loop=self.loop): iterator
+                for iterator in self.iterators
+            }
+
+        while self.pending:
+            done, _ = await wait(self.pending, return_when=FIRST_COMPLETED)
+            # Only one item is consumed at a time, the other completed futures
+            # stay pending and are returned by the following calls.
+            future = next(iter(done))
+            iterator = self.pending.pop(future)
+            try:
+                item = future.result()
+            except StopAsyncIteration:
+                continue
+
+            self.pending[ensure_future(next_item(iterator), loop=self.loop)] = iterator
+            return item
+
+        raise StopAsyncIteration
+
+    async def aclose(self):
+        pending, self.pending = self.pending, {}
+        if pending:
+            for future in pending:
+                future.cancel()
+            await wait(pending)
+        for iterator in self.iterators:
+            await close_async_iterator(iterator)
+
+
+class WindowedAsyncIterator(object):
+    """Groups the items of an async iterable using an `EventWindow`.
+
+    A window opens with its first item, so no empty windows are produced.
+    Coalesced items are yielded one by one, or as lists if the window is
+    batched."""
+
+    def __init__(self, source, window, loop=None):
+        self.iterator = source.__aiter__()
+        self.window = window
+        self.loop = loop or get_event_loop()
+        self.next = None
+        self.ready = deque()
+        self.is_done = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.ready:
+            if self.is_done:
+                raise StopAsyncIteration
+
+            events = await self.read_window()
+            if events:
+                events = self.window.coalesce(events)
+                if self.window.batch:
+                    self.ready.append(events)
+                else:
+                    self.ready.extend(events)
+
+        return self.ready.popleft()
+
+    async def read_window(self):
+        events = []
+        deadline = None
+        count = self.window.count
+        while not count or len(events) < count:
+            if self.next is None:
+                self.next = ensure_future(next_item(self.iterator), loop=self.loop)
+
+            timeout = None
+            if deadline is not None:
+                timeout = deadline - self.loop.time()
+                if timeout <= 0:
+                    break
+
+            # The pending item is kept across windows instead of being
+            # cancelled, which would close an async generator source.
+            done, _ = await wait([self.next], timeout=timeout)
+            if not done:
+                break
+
+            future, self.next = self.next, None
+            try:
+                events.append(future.result())
+            except StopAsyncIteration:
+                self.is_done = True
+                break
+
+            if deadline is None and self.window.time:
+                deadline = self.loop.time() + self.window.time
+
+        return events
+
+    async def aclose(self):
+        self.is_done = True
+        self.ready.clear()
+        if self.next is not None:
+            self.next.cancel()
+            await wait([self.next])
+            self.next = None
+        await close_async_iterator(self.iterator)
+
+
+class BufferedAsyncIterator(object):
+    """Eagerly consumes an async iterable into a bounded buffer.
+
+    The source is pulled by a background task as fast as it produces, so a
+    slow consumer never stalls it. When the buffer holds `max_size` items,
+    `overflow_policy` decides what happens to the next one."""
+
+    def __init__(self, source, max_size, overflow_policy=None, loop=None):
+        assert max_size > 0, 'Subscription buffers must hold at least one item.'
+        self.iterator = source.__aiter__()
+        self.max_size = max_size
+        self.overflow_policy = overflow_policy or OverflowPolicy.DROP_OLDEST
+        self.loop = loop or get_event_loop()
+        self.buffer = deque()
+        self.dropped = 0
+        self.error = None
+        self.is_done = False
+        self.pump = None
+        self.waiter = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.pump is None:
+            self.pump = ensure_future(self.fill_buffer(), loop=self.loop)
+
+        while not self.buffer:
+            if self.is_done:
+                if self.error is not None:
+                    error, self.error = self.error, None
+                    raise error
+                raise StopAsyncIteration
+
+            self.waiter = self.loop.create_future()
+            await self.waiter
+
+        return self.buffer.popleft()
+
+    async def fill_buffer(self):
+        try:
+            async for item in self.iterator:
+                self.push(item)
+                if self.is_done:
+                    break
+        except Exception as e:
+            if not self.is_done:
+                self.error = e
+        finally:
+            self.is_done = True
+            self.wake_up()
+            await close_async_iterator(self.iterator)
+
+    def push(self, item):
+        if len(self.buffer) >= self.max_size:
+            self.dropped += 1
+            if self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+                self.buffer.popleft()
+            elif self.overflow_policy == OverflowPolicy.COALESCE_LATEST:
+                self.buffer.pop()
+            else:
+                self.buffer.clear()
+                self.error = SubscriptionOverflowError(
+                    'Subscription buffer of {} items overflowed.'.format(self.max_size))
+                self.is_done = True
+                self.wake_up()
+                return
+
+        self.buffer.append(item)
+        self.wake_up()
+
+    def wake_up(self):
+        waiter = self.waiter
+        if waiter is not None and not waiter.done():
+            self.waiter = None
+            waiter.set_result(None)
+
+    async def aclose(self):
+        self.is_done = True
+        self.buffer.clear()
+        if self.pump is None:
+            await close_async_iterator(self.iterator)
+        elif not self.pump.done():
+            # The pump closes the source once it's cancelled.
+            self.pump.cancel()
+            try:
+                await self.pump
+            except CancelledError:
+                pass
+        self.wake_up()
+
+
+class SharedAsyncIterator(object):
+    """Shares the items of an async iterable between several consumers.
+
+    Each consumer, returned by `share()`, gets the items produced after it
+    joined. The source is pulled by a background task from the first call
+    to `__anext__` on, and closed once the last consumer is closed, after
+    which `on_close` is called."""
+
+    def __init__(self, source, on_close=None, loop=None):
+        self.iterator = source.__aiter__()
+        self.on_close = on_close
+        self.loop = loop or get_event_loop()
+        self.consumers = []
+        self.pump = None
+        self.is_closed = False
+
+    def share(self):
+        consumer = SharedAsyncIteratorConsumer(self)
+        self.consumers.append(consumer)
+        return consumer
+
+    def start(self):
+        if self.pump is None:
+            self.pump = ensure_future(self.broadcast(), loop=self.loop)
+
+    async def broadcast(self):
+        error = None
+        try:
+            async for item in self.iterator:
+                for consumer in list(self.consumers):
+                    consumer.push(item)
+        except Exception as e:
+            error = e
+        finally:
+            for consumer in list(self.consumers):
+                consumer.finish(error)
+            await close_async_iterator(self.iterator)
+            self.close_group()
+
+    async def remove(self, consumer):
+        if consumer in self.consumers:
+            self.consumers.remove(consumer)
+        if self.consumers or self.is_closed:
+            return
+
+        if self.pump is None:
+            await close_async_iterator(self.iterator)
+            self.close_group()
+        elif not self.pump.done():
+            # The pump closes the source once it's cancelled.
+            self.pump.cancel()
+            try:
+                await self.pump
+            except CancelledError:
+                pass
+
+    def close_group(self):
+        if not self.is_closed:
+            self.is_closed = True
+            if self.on_close is not None:
+                self.on_close()
+
+
+class SharedAsyncIteratorConsumer(object):
+    """A consumer of a `SharedAsyncIterator`, with its own queue of items."""
+
+    def __init__(self, shared):
+        self.shared = shared
+        self.queue = deque()
+        self.error = None
+        self.is_done = False
+        self.waiter = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        self.shared.start()
+        while not self.queue:
+            if self.is_done:
+                if self.error is not None:
+                    error, self.error = self.error, None
+                    raise error
+                raise StopAsyncIteration
+
+            self.waiter = self.shared.loop.create_future()
+            await self.waiter
+
+        return self.queue.popleft()
+
+    def push(self, item):
+        self.queue.append(item)
+        self.wake_up()
+
+    def finish(self, error=None):
+        self.is_done = True
+        self.error = error
+        self.wake_up()
+
+    def wake_up(self):
+        waiter = self.waiter
+        if waiter is not None and not waiter.done():
+            self.waiter = None
+            waiter.set_result(None)
+
+    async def aclose(self):
+        if not self.is_done:
+            self.is_done = True
+            self.queue.clear()
+            self.wake_up()
+        await self.shared.remove(self)
@@ -121,6 +121,10 @@ class AsyncgenObservable(ObservableBase):
 
 
 def asyncgen_to_observable(asyncgen):
+    """Adapts an async generator to an Rx Observable.
+
+    `subscribe` returns async iterators for async generator resolvers; this
+    is the optional adapter for consumers that still expect Observables."""
     def emit(observer):
         ensure_future(iterate_asyncgen(asyncgen, observer))
     return AsyncgenObservable(emit, asyncgen)
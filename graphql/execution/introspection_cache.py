@@ -0,0 +1,130 @@
+from threading import Lock
+
+from promise import Promise, is_thenable
+
+from ..language import ast
+from ..pyutils.ordereddict import OrderedDict
+from ..utils.get_operation_ast import get_operation_ast
+from ..utils.schema_fingerprint import get_schema_fingerprint
+from ..validation.validation_cache import get_document_key
+from .base import ExecutionResult
+from .coalescing import freeze_value
+from .executor import execute
+
+INTROSPECTION_FIELDS = frozenset(['__schema', '__type', '__typename'])
+
+
+def is_introspection_selection_set(selection_set, fragments, visited_fragments):
+    for selection in selection_set.selections:
+        if isinstance(selection, ast.Field):
+            if selection.name.value not in INTROSPECTION_FIELDS:
+                return False
+        elif isinstance(selection, ast.InlineFragment):
+            if not is_introspection_selection_set(selection.selection_set, fragments, visited_fragments):
+                return False
+        elif selection.name.value not in visited_fragments:
+            visited_fragments.add(selection.name.value)
+            fragment = fragments.get(selection.name.value)
+            if not fragment or not is_introspection_selection_set(fragment.selection_set, fragments, visited_fragments):
+                return False
+
+    return True
+
+
+class IntrospectionCache(object):
+    """Caches the results of introspection queries.
+
+    A query that only selects `__schema`, `__type` and `__typename` at its
+    root, such as `introspection_query`, only depends on the structure of
+    the schema. Its result is kept, keyed by the schema fingerprint, the
+    document, the variables and the operation name, in a bounded LRU.
+    Cached results are shared between requests, and must be treated as
+    immutable.
+
+    The fingerprint of a schema is computed once and kept for the life of
+    the schema object, so a schema must not be changed once it has been
+    introspected: changes belong in a new schema, such as the one returned
+    by `extend_schema`, which has its own fingerprint.
+
+    Example:
+
+        introspection_cache = IntrospectionCache()
+        graphql(schema, introspection_query, introspection_cache=introspection_cache)
+    """
+
+    def __init__(self, max_size=100):
+        assert max_size > 0, 'IntrospectionCache must hold at least one result.'
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+        self.results = OrderedDict()
+
+    def accepts(self, document_ast, operation_name=None):
+        """Returns whether the operation is an introspection query."""
+        operation = get_operation_ast(document_ast, operation_name)
+        if not operation or operation.operation != 'query':
+            return False
+
+        fragments = {
+            definition.name.value: definition for definition in document_ast.definitions
+            if isinstance(definition, ast.FragmentDefinition)
+        }
+        return is_introspection_selection_set(operation.selection_set, fragments, set())
+
+    def get_key(self, schema, document_ast, variable_values, operation_name):
+        if not self.accepts(document_ast, operation_name):
+            return None
+
+        try:
+            key = (get_schema_fingerprint(schema), get_document_key(document_ast),
+                   freeze_value(variable_values or {}), operation_name)
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def execute(self, schema, document_ast, root_value=None, context_value=None,
+                variable_values=None, operation_name=None, execute_fn=execute, **options):
+        """Executes an operation, returning the cached result of introspection
+        queries. The other operations, and introspection queries missing
+        from the cache, are executed by `execute_fn`, such as the `execute`
+        method of an ExecutionCoalescer."""
+        # Middleware may change the results, so they are not cached.
+        key = None if options.get('middleware') else self.get_key(
+            schema, document_ast, variable_values, operation_name)
+        if key is None:
+            return execute_fn(schema, document_ast, root_value, context_value,
+                              variable_values=variable_values, operation_name=operation_name, **options)
+
+        return_promise = options.get('return_promise', False)
+        with self.lock:
+            data = self.results.pop(key, None)
+            if data is not None:
+                # Re-insert the result so it's the most recently used.
+                self.results[key] = data
+                self.hits += 1
+                result = ExecutionResult(data=data)
+                return Promise.resolve(result) if return_promise else result
+            self.misses += 1
+
+        result = execute_fn(schema, document_ast, root_value, context_value,
+                            variable_values=variable_values, operation_name=operation_name, **options)
+        if is_thenable(result):
+            return Promise.resolve(result).then(lambda result: self.store(key, result))
+        return self.store(key, result)
+
+    def store(self, key, result):
+        # Results with errors, such as an unknown type variable, are not cached.
+        if not result.errors and result.data is not None:
+            with self.lock:
+                self.results[key] = result.data
+                while len(self.results) > self.max_size:
+                    self.results.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self.lock:
+            self.results.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,98 @@
+from threading import Lock
+
+from .coalescing import (default_coalescing_key, get_identity_key,
+                         get_options_key)
+from .executor import is_async_iterable, subscribe
+
+
+def is_observable(value):
+    # RxPY is optional: without it, no resolver can return an Observable.
+    try:
+        from rx import Observable
+    except ImportError:
+        return False
+    return isinstance(value, Observable)
+
+
+def default_subscription_key(schema, document_ast, root_value, context_value, variable_values, operation_name):
+    """Like `default_coalescing_key`, but also requires the very same root and
+    context values: a shared subscription runs with the values of its first
+    subscriber for as long as it lasts."""
+    return (default_coalescing_key(schema, document_ast, root_value, context_value, variable_values, operation_name),
+            get_identity_key(root_value), get_identity_key(context_value))
+
+
+class SubscriptionHub(object):
+    """Groups identical subscriptions so that each event is completed once.
+
+    Subscribers with the same key (by default the schema, document,
+    variables and operation name, and the very same root and context
+    values) and the same options, such as `middleware`, share a single
+    subscription: the subscribe resolver runs once for the group, every
+    event is completed once, and the same `ExecutionResult` is broadcast
+    to all members. The group is torn down when its last member
+    unsubscribes.
+
+    Subscriptions returning an Observable share it. Those returning an
+    async iterable (with the asyncio executor) share one pipeline, read by
+    a background task, and each subscriber gets an async iterator of the
+    results produced after it subscribed. Subscriptions that fail are
+    returned to each subscriber on its own.
+
+    The resolvers of a group run with the values of the subscriber that
+    created it. A `key_fn` leaving out the context must only do so for
+    subscriptions whose results don't depend on it, and may return `None`
+    for subscriptions that must not be shared.
+    """
+
+    def __init__(self, key_fn=None):
+        self.key_fn = key_fn or default_subscription_key
+        self.groups = {}
+        self.lock = Lock()
+
+    def subscribe(self, schema, document_ast, root_value=None, context_value=None,
+                  variable_values=None, operation_name=None, **options):
+        try:
+            key = self.key_fn(schema, document_ast, root_value, context_value, variable_values, operation_name)
+            hash(key)
+        except TypeError:
+            key = None
+
+        if key is None:
+            return subscribe(schema, document_ast, root_value, context_value,
+                             variable_values=variable_values, operation_name=operation_name, **options)
+
+        # The options change how events are completed, so only subscribers
+        # with the same options share a group.
+        key = key, get_options_key(options)
+
+        with self.lock:
+            group = self.groups.get(key)
+            if group is not None:
+                return group[1]()
+
+            result = subscribe(schema, document_ast, root_value, context_value,
+                               variable_values=variable_values, operation_name=operation_name, **options)
+            if is_async_iterable(result):
+                from .executors.asyncio_iterators import SharedAsyncIterator
+
+                shared = SharedAsyncIterator(result, on_close=lambda: self.release(key, shared))
+                join = shared.share
+            elif is_observable(result):
+                shared = result.finally_action(lambda: self.release(key, shared)).share()
+
+                def join():
+                    return shared
+            else:
+                # Errors are reported to each subscriber on its own.
+                return result
+
+            # The group keeps the values whose ids are part of the key alive.
+            self.groups[key] = shared, join, (schema, document_ast, root_value, context_value, options)
+            return join()
+
+    def release(self, key, shared):
+        with self.lock:
+            group = self.groups.get(key)
+            if group is not None and group[0] is shared:
+                del self.groups[key]
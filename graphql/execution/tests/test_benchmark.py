@@ -85,3 +85,23 @@ def test_big_list_objecttypes_with_two_int_fields(benchmark):
     @benchmark
     def b():
         return execute(schema, ast)
+
+
+def test_introspection_query(benchmark):
+    from graphql import graphql, introspection_query
+
+    schema = GraphQLSchema(GraphQLObjectType('Query', {'allContainers': GraphQLField(GraphQLList(ContainerType))}))
+    result = benchmark(lambda: graphql(schema, introspection_query))
+    assert not result.errors
+
+
+def test_cached_introspection_query(benchmark):
+    from graphql import graphql, introspection_query
+    from graphql.execution import IntrospectionCache
+    from graphql.language.base import ParseCache
+    from graphql.validation import ValidationCache
+
+    schema = GraphQLSchema(GraphQLObjectType('Query', {'allContainers': GraphQLField(GraphQLList(ContainerType))}))
+    caches = dict(parse_cache=ParseCache(), validation_cache=ValidationCache(), introspection_cache=IntrospectionCache())
+    result = benchmark(lambda: graphql(schema, introspection_query, **caches))
+    assert not result.errors
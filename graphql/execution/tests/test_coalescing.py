@@ -0,0 +1,182 @@
+from threading import Event, Thread
+
+from graphql import graphql
+from graphql.execution import ExecutionCoalescer
+from graphql.language.parser import parse
+from graphql.type import (GraphQLArgument, GraphQLField, GraphQLObjectType,
+                          GraphQLSchema, GraphQLString)
+
+
+def make_schema(calls, release):
+    def resolve_hello(root, info, **args):
+        calls.append(args)
+        release.wait(5)
+        return 'Hello {}'.format(args.get('name'))
+
+    fields = {
+        'hello': GraphQLField(
+            GraphQLString,
+            args={'name': GraphQLArgument(GraphQLString)},
+            resolver=resolve_hello,
+        )
+    }
+    return GraphQLSchema(
+        query=GraphQLObjectType('Query', fields),
+        mutation=GraphQLObjectType('Mutation', fields),
+    )
+
+
+def run_concurrently(count, fn):
+    results = [None] * count
+
+    def run(index):
+        results[index] = fn(index)
+
+    threads = [Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def wait_for(threads):
+    for thread in threads:
+        thread.join(5)
+
+
+def wait_until(predicate):
+    event = Event()
+    for _ in range(500):
+        if predicate():
+            return
+        event.wait(0.01)
+
+
+def test_coalesces_identical_concurrent_queries():
+    calls, release = [], Event()
+    schema = make_schema(calls, release)
+    coalescer = ExecutionCoalescer()
+
+    threads, results = run_concurrently(5, lambda index: graphql(
+        schema, '{ hello(name: "world") }', coalescer=coalescer))
+    wait_until(lambda: coalescer.coalesced == 4)
+    release.set()
+    wait_for(threads)
+
+    assert len(calls) == 1
+    assert coalescer.coalesced == 4
+    assert results[0].data == {'hello': 'Hello world'}
+    assert all(result is results[0] for result in results)
+    assert not coalescer.in_flight
+
+
+def test_does_not_coalesce_different_variables():
+    calls, release = [], Event()
+    schema = make_schema(calls, release)
+    coalescer = ExecutionCoalescer()
+    release.set()
+    ast = parse('query Q($name: String) { hello(name: $name) }')
+
+    first = coalescer.execute(schema, ast, variable_values={'name': 'a'})
+    second = coalescer.execute(schema, ast, variable_values={'name': 'b'})
+
+    assert first.data == {'hello': 'Hello a'}
+    assert second.data == {'hello': 'Hello b'}
+    assert len(calls) == 2
+
+
+def test_never_coalesces_mutations():
+    calls, release = [], Event()
+    schema = make_schema(calls, release)
+    coalescer = ExecutionCoalescer()
+
+    threads, results = run_concurrently(3, lambda index: graphql(
+        schema, 'mutation { hello(name: "world") }', coalescer=coalescer))
+    wait_until(lambda: len(calls) == 3)
+    release.set()
+    wait_for(threads)
+
+    assert len(calls) == 3
+    assert coalescer.coalesced == 0
+
+
+def test_key_fn_can_include_the_context():
+    calls, release = [], Event()
+    schema = make_schema(calls, release)
+
+    def key_fn(schema, document_ast, root_value, context_value, variable_values, operation_name):
+        return context_value['user']
+
+    coalescer = ExecutionCoalescer(key_fn=key_fn)
+    contexts = [{'user': 1}, {'user': 2}, {'user': 1}]
+
+    threads, results = run_concurrently(3, lambda index: graphql(
+        schema, '{ hello }', context_value=contexts[index], coalescer=coalescer))
+    wait_until(lambda: len(calls) == 2 and coalescer.coalesced == 1)
+    release.set()
+    wait_for(threads)
+
+    assert len(calls) == 2
+    assert coalescer.coalesced == 1
+
+
+def test_key_fn_returning_none_skips_coalescing():
+    calls, release = [], Event()
+    schema = make_schema(calls, release)
+    release.set()
+    coalescer = ExecutionCoalescer(key_fn=lambda *args: None)
+
+    graphql(schema, '{ hello }', coalescer=coalescer)
+    graphql(schema, '{ hello }', coalescer=coalescer)
+
+    assert len(calls) == 2
+    assert not coalescer.in_flight
+
+
+def test_coalesces_different_contexts_but_not_different_options():
+    calls, release = [], Event()
+    schema = make_schema(calls, release)
+    coalescer = ExecutionCoalescer()
+    context = {'user': 1}
+
+    def upper_middleware(next, root, info, **args):
+        return next(root, info, **args).then(lambda value: value.upper())
+
+    options = [
+        {'context_value': context},
+        {'context_value': context},
+        {'context_value': {'user': 1}},
+        {'context_value': context, 'middleware': [upper_middleware]},
+    ]
+
+    threads, results = run_concurrently(4, lambda index: graphql(
+        schema, '{ hello(name: "world") }', coalescer=coalescer, **options[index]))
+    wait_until(lambda: len(calls) == 2 and coalescer.coalesced == 2)
+    release.set()
+    wait_for(threads)
+
+    assert len(calls) == 2
+    assert coalescer.coalesced == 2
+    assert [result.data for result in results] == [{'hello': 'Hello world'}] * 3 + [{'hello': 'HELLO WORLD'}]
+
+
+def test_promise_followers_do_not_block():
+    calls, release = [], Event()
+    schema = make_schema(calls, release)
+    coalescer = ExecutionCoalescer()
+    ast = parse('{ hello(name: "world") }')
+
+    threads, results = run_concurrently(1, lambda index: coalescer.execute(schema, ast, return_promise=True))
+    wait_until(lambda: calls)
+
+    # The leader is still executing, and the follower gets a pending promise.
+    promise = coalescer.execute(schema, ast, return_promise=True)
+    assert promise.is_pending
+    assert coalescer.coalesced == 1
+
+    release.set()
+    wait_for(threads)
+
+    assert promise.get() is results[0].get()
+    assert promise.get().data == {'hello': 'Hello world'}
+    assert len(calls) == 1
+    assert not coalescer.in_flight
@@ -0,0 +1,99 @@
+from collections import OrderedDict
+
+from promise import Promise
+
+from graphql.execution.deferred import Deferred
+
+
+def test_then_runs_synchronously_once_resolved():
+    d = Deferred()
+    calls = []
+    chained = d.then(lambda value: calls.append(value) or value + 1)
+    assert calls == []
+    assert chained.is_pending
+
+    d.resolve(1)
+    assert calls == [1]
+    assert chained.is_fulfilled
+    assert chained.value == 2
+
+
+def test_then_adopts_returned_deferred():
+    inner = Deferred()
+    chained = Deferred.resolved(None).then(lambda _: inner)
+    assert chained.is_pending
+
+    inner.resolve('done')
+    assert chained.value == 'done'
+
+
+def test_exception_in_callback_rejects():
+    error = Exception('boom')
+
+    def raise_error(value):
+        raise error
+
+    chained = Deferred.resolved(1).then(raise_error)
+    assert chained.is_rejected
+    assert chained.value is error
+    assert chained._traceback is not None
+
+
+def test_catch_recovers_from_rejection():
+    error = Exception('boom')
+    recovered = Deferred.rejected(error).then(lambda value: 'unreachable').catch(lambda e: str(e))
+    assert recovered.is_fulfilled
+    assert recovered.value == 'boom'
+
+
+def test_all_joins_list_in_place():
+    first, second = Deferred(), Deferred()
+    values = [first, 'sync', second]
+    joined = Deferred.all(values)
+    second.resolve(3)
+    assert joined.is_pending
+
+    first.resolve(1)
+    assert joined.is_fulfilled
+    assert joined.value == [1, 'sync', 3]
+
+
+def test_all_rejects_on_first_rejection():
+    first, second = Deferred(), Deferred()
+    joined = Deferred.all([first, second])
+    error = Exception('boom')
+    second.reject(error)
+    assert joined.is_rejected
+    assert joined.value is error
+
+    first.resolve(1)
+    assert joined.value is error
+
+
+def test_for_dict_keeps_key_order():
+    pending = Deferred()
+    values = OrderedDict([('a', pending), ('b', 2)])
+    joined = Deferred.for_dict(values)
+    pending.resolve(1)
+    assert list(joined.value.items()) == [('a', 1), ('b', 2)]
+
+
+def test_from_thenable_adopts_promise():
+    promise = Promise()
+    deferred = Deferred.from_thenable(promise)
+    assert deferred.is_pending
+
+    promise.do_resolve('value')
+    assert deferred.value == 'value'
+
+
+def test_to_promise():
+    deferred = Deferred()
+    promise = deferred.to_promise()
+    deferred.resolve('value')
+    assert promise.get() == 'value'
+
+    error = Exception('boom')
+    rejected = Deferred.rejected(error).to_promise()
+    assert rejected.is_rejected
+    assert rejected.reason is error
@@ -0,0 +1,109 @@
+from collections import OrderedDict, namedtuple
+
+from pytest import raises
+from rx.subjects import Subject
+
+from graphql import (GraphQLField, GraphQLFloat, GraphQLObjectType,
+                     GraphQLSchema, GraphQLString, parse, subscribe)
+from graphql.execution import EventWindow
+
+Tick = namedtuple('Tick', 'symbol,price')
+
+TickType = GraphQLObjectType(
+    name='Tick',
+    fields=OrderedDict([
+        ('symbol', GraphQLField(GraphQLString)),
+        ('price', GraphQLField(GraphQLFloat)),
+    ])
+)
+
+
+def make_schema(stream, completed):
+    def resolve_price(tick, info):
+        completed.append(tick)
+        return tick.price
+
+    return GraphQLSchema(
+        query=GraphQLObjectType('Query', {'a': GraphQLField(GraphQLString)}),
+        subscription=GraphQLObjectType('Subscription', {
+            'tick': GraphQLField(GraphQLObjectType(
+                name='PricedTick',
+                fields=OrderedDict([
+                    ('symbol', GraphQLField(GraphQLString)),
+                    ('price', GraphQLField(GraphQLFloat, resolver=resolve_price)),
+                ])
+            ), resolver=lambda root, info: stream),
+        })
+    )
+
+
+document = parse('subscription { tick { symbol price } }')
+
+
+def send(stream, *ticks):
+    for symbol, price in ticks:
+        stream.on_next(Tick(symbol, price))
+
+
+def test_window_must_be_bounded():
+    with raises(AssertionError) as excinfo:
+        EventWindow()
+    assert str(excinfo.value) == 'EventWindow must be bounded by a count or a time.'
+
+
+def test_coalesce():
+    events = [Tick('A', 1), Tick('B', 2), Tick('A', 3)]
+    by_symbol = lambda tick: tick.symbol
+
+    assert EventWindow(count=3).coalesce(events) == [Tick('A', 3)]
+    assert EventWindow(count=3, batch=True).coalesce(events) == events
+    assert EventWindow(count=3, key=by_symbol).coalesce(events) == [Tick('B', 2), Tick('A', 3)]
+    assert EventWindow(count=3, key=by_symbol, batch=True).coalesce(events) == [Tick('B', 2), Tick('A', 3)]
+
+
+def test_completes_only_the_latest_event_of_each_window():
+    stream, completed = Subject(), []
+    result = subscribe(make_schema(stream, completed), document, event_window=EventWindow(count=3))
+
+    payload = []
+    result.subscribe(payload.append)
+    send(stream, ('A', 1), ('B', 2), ('A', 3), ('B', 4))
+    stream.on_completed()
+
+    assert [r.data for r in payload] == [
+        {'tick': {'symbol': 'A', 'price': 3}},
+        {'tick': {'symbol': 'B', 'price': 4}},
+    ]
+    assert completed == [Tick('A', 3), Tick('B', 4)]
+
+
+def test_keeps_the_latest_event_per_key():
+    stream, completed = Subject(), []
+    window = EventWindow(count=3, key=lambda tick: tick.symbol)
+    result = subscribe(make_schema(stream, completed), document, event_window=window)
+
+    payload = []
+    result.subscribe(payload.append)
+    send(stream, ('A', 1), ('B', 2), ('A', 3))
+
+    assert [r.data for r in payload] == [
+        {'tick': {'symbol': 'B', 'price': 2}},
+        {'tick': {'symbol': 'A', 'price': 3}},
+    ]
+
+
+def test_batches_events_into_a_single_payload():
+    stream, completed = Subject(), []
+    window = EventWindow(count=3, key=lambda tick: tick.symbol, batch=True)
+    result = subscribe(make_schema(stream, completed), document, event_window=window)
+
+    payload = []
+    result.subscribe(payload.append)
+    send(stream, ('A', 1), ('B', 2), ('A', 3))
+
+    assert len(payload) == 1
+    assert payload[0].data == {'tick': [
+        {'symbol': 'B', 'price': 2},
+        {'symbol': 'A', 'price': 3},
+    ]}
+    assert len(completed) == 2
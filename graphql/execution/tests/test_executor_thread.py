@@ -220,3 +220,21 @@ def test_synchronous_error_nulls_out_error_subtrees():
 
 def test_evaluates_mutations_serially():
     assert_evaluate_mutations_serially(executor=ThreadExecutor())
+
+
+def test_joins_many_list_items_resolved_in_threads():
+    # The items are resolved by the threads of the executor, which settle
+    # the join over the list concurrently.
+    Item = GraphQLObjectType('Item', {
+        'value': GraphQLField(GraphQLInt, resolver=lambda item, info: item),
+    })
+    Query = GraphQLObjectType('Query', {
+        'items': GraphQLField(GraphQLList(Item), resolver=lambda root, info: list(range(500))),
+    })
+    schema = GraphQLSchema(query=Query)
+    ast = parse('{ items { value } }')
+
+    for _ in range(5):
+        result = execute(schema, ast, executor=ThreadExecutor())
+        assert not result.errors
+        assert result.data == {'items': [{'value': i} for i in range(500)]}
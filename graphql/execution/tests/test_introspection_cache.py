@@ -0,0 +1,149 @@
+from graphql import graphql
+from graphql.execution import ExecutionCoalescer, IntrospectionCache
+from graphql.language.parser import parse
+from graphql.type import (GraphQLArgument, GraphQLEnumType, GraphQLEnumValue,
+                          GraphQLField, GraphQLObjectType, GraphQLSchema,
+                          GraphQLString)
+from graphql.utils.introspection_query import introspection_query
+
+
+def make_schema(calls, description=None):
+    def resolve_hello(root, info, **args):
+        calls.append(args)
+        return 'Hello'
+
+    return GraphQLSchema(
+        query=GraphQLObjectType('Query', {
+            'hello': GraphQLField(
+                GraphQLString,
+                args={'name': GraphQLArgument(GraphQLString)},
+                resolver=resolve_hello,
+                description=description,
+            ),
+        }),
+        mutation=GraphQLObjectType('Mutation', {'hello': GraphQLField(GraphQLString)}),
+    )
+
+
+def test_reuses_introspection_results():
+    cache = IntrospectionCache()
+    schema = make_schema([])
+    result = graphql(schema, introspection_query, introspection_cache=cache)
+
+    assert not result.errors
+    for _ in range(2):
+        assert graphql(schema, introspection_query, introspection_cache=cache).data == result.data
+    assert cache.hits == 2
+    assert cache.misses == 1
+
+
+def test_only_caches_introspection_queries():
+    cache = IntrospectionCache()
+    calls = []
+    schema = make_schema(calls)
+
+    for _ in range(2):
+        assert graphql(schema, '{ hello __typename }', introspection_cache=cache).data == {
+            'hello': 'Hello', '__typename': 'Query'
+        }
+        assert graphql(schema, 'mutation { __typename }', introspection_cache=cache).data == {
+            '__typename': 'Mutation'
+        }
+    assert len(calls) == 2
+    assert cache.hits == cache.misses == 0
+
+    assert not cache.accepts(parse('{ ...F } fragment F on Query { hello }'))
+    assert cache.accepts(parse('{ ... on Query { ...F } } fragment F on Query { __type(name: "Query") { name } }'))
+
+
+def test_keys_by_variables_and_operation_name():
+    cache = IntrospectionCache()
+    schema = make_schema([])
+    query = '''
+      query A($name: String!) { __type(name: $name) { name } }
+      query B { __schema { queryType { name } } }
+    '''
+
+    assert graphql(schema, query, variable_values={'name': 'Query'}, operation_name='A',
+                   introspection_cache=cache).data == {'__type': {'name': 'Query'}}
+    assert graphql(schema, query, variable_values={'name': 'Mutation'}, operation_name='A',
+                   introspection_cache=cache).data == {'__type': {'name': 'Mutation'}}
+    assert graphql(schema, query, operation_name='B', introspection_cache=cache).data == {
+        '__schema': {'queryType': {'name': 'Query'}}
+    }
+    assert cache.misses == 3
+
+
+def test_results_are_keyed_by_schema_structure():
+    cache = IntrospectionCache()
+    query = '{ __type(name: "Query") { fields { description } } }'
+
+    assert graphql(make_schema([]), query, introspection_cache=cache).data == {
+        '__type': {'fields': [{'description': None}]}
+    }
+    assert graphql(make_schema([]), query, introspection_cache=cache).data == {
+        '__type': {'fields': [{'description': None}]}
+    }
+    assert graphql(make_schema([], 'Greets'), query, introspection_cache=cache).data == {
+        '__type': {'fields': [{'description': 'Greets'}]}
+    }
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_does_not_cache_with_middleware():
+    cache = IntrospectionCache()
+    schema = make_schema([])
+
+    def hide_names(next, root, info, **args):
+        return 'hidden' if info.field_name == 'name' else next(root, info, **args)
+
+    for _ in range(2):
+        result = graphql(schema, '{ __schema { queryType { name } } }', middleware=[hide_names],
+                         introspection_cache=cache)
+        assert result.data == {'__schema': {'queryType': {'name': 'hidden'}}}
+    assert len(cache.results) == 0
+
+
+def test_returns_promises():
+    cache = IntrospectionCache()
+    schema = make_schema([])
+
+    for _ in range(2):
+        result = graphql(schema, '{ __typename }', return_promise=True, introspection_cache=cache).get()
+        assert result.data == {'__typename': 'Query'}
+    assert cache.hits == 1
+
+
+def test_does_not_cache_schemas_without_fingerprint():
+    cache = IntrospectionCache()
+    color = GraphQLEnumType('Color', {'RED': GraphQLEnumValue(object())})
+    schema = GraphQLSchema(GraphQLObjectType('Query', {'color': GraphQLField(color)}))
+
+    for _ in range(2):
+        result = graphql(schema, '{ __type(name: "Color") { name } }', introspection_cache=cache)
+        assert result.data == {'__type': {'name': 'Color'}}
+    assert cache.hits == cache.misses == 0
+
+
+def test_runs_other_operations_with_the_coalescer():
+    accepted = []
+    keyed = []
+
+    class RecordingCache(IntrospectionCache):
+        def accepts(self, document_ast, operation_name=None):
+            accepted.append(operation_name)
+            return super(RecordingCache, self).accepts(document_ast, operation_name)
+
+    def key_fn(schema, document_ast, root_value, context_value, variable_values, operation_name):
+        keyed.append(operation_name)
+        return None
+
+    cache = RecordingCache()
+    schema = make_schema([])
+    result = graphql(schema, 'query Q { hello }', operation_name='Q',
+                     introspection_cache=cache, coalescer=ExecutionCoalescer(key_fn))
+
+    assert result.data == {'hello': 'Hello'}
+    assert accepted == ['Q']
+    assert keyed == ['Q']
@@ -393,3 +393,63 @@ def test_event_order_is_correct_for_multiple_publishes():
     print(payload)
     assert payload[0].data == expected_payload1
     assert payload[1].data == expected_payload2
+
+
+def test_merges_multiple_root_fields_into_one_stream():
+    SubscriptionTypeMultiple = GraphQLObjectType(
+        name='Subscription',
+        fields=OrderedDict([
+            ('importantEmail', GraphQLField(EmailEventType)),
+            ('nonImportantEmail', GraphQLField(EmailEventType)),
+        ])
+    )
+    test_schema = GraphQLSchema(
+        query=QueryType,
+        subscription=SubscriptionTypeMultiple
+    )
+
+    important, non_important = Subject(), Subject()
+
+    class Root(object):
+        @staticmethod
+        def importantEmail():
+            return important
+
+        @staticmethod
+        def nonImportantEmail():
+            return non_important
+
+    subscription = subscribe(test_schema, parse('''
+        subscription {
+          importantEmail {
+            email {
+              subject
+            }
+          }
+          nonImportantEmail {
+            email {
+              subject
+            }
+          }
+        }
+    '''), root_value=Root)
+
+    payload = []
+    subscription.subscribe(payload.append)
+
+    def email(subject):
+        return Email(from_='yuzhi@graphql.org', subject=subject, message='', unread=True), None
+
+    important.on_next(email('Important'))
+    non_important.on_next(email('Not important'))
+    non_important.on_error(Exception('Unsubscribed'))
+    important.on_next(email('Important 2'))
+
+    assert [result.data for result in payload] == [
+        {'importantEmail': {'email': {'subject': 'Important'}}},
+        {'nonImportantEmail': {'email': {'subject': 'Not important'}}},
+        {'nonImportantEmail': None},
+        {'importantEmail': {'email': {'subject': 'Important 2'}}},
+    ]
+    assert [str(e) for e in payload[2].errors] == ['Unsubscribed']
+    assert not payload[3].errors
@@ -0,0 +1,145 @@
+import os
+import subprocess
+import sys
+
+from rx.subjects import Subject
+
+import graphql
+from graphql import parse
+from graphql.execution import SubscriptionHub
+from graphql.execution.executors.sync import SyncExecutor
+
+from .test_subscribe import Email, email_schema_with_resolvers
+
+document = parse('''
+    subscription {
+      importantEmail {
+        email {
+          from
+          subject
+        }
+      }
+    }
+''')
+
+
+def make_schema(stream, calls):
+    def resolve_important_email(root, info):
+        calls.append(info)
+        return stream
+
+    return email_schema_with_resolvers(resolve_important_email)
+
+
+def send(stream, subject):
+    email = Email(from_='yuzhi@graphql.org', subject=subject, message='', unread=True)
+    stream.on_next((email, None))
+
+
+def test_shares_completed_results_between_identical_subscriptions():
+    stream, calls = Subject(), []
+    schema = make_schema(stream, calls)
+    hub = SubscriptionHub()
+
+    payload1, payload2 = [], []
+    hub.subscribe(schema, document).subscribe(payload1.append)
+    hub.subscribe(schema, document).subscribe(payload2.append)
+    send(stream, 'Hello')
+
+    assert len(calls) == 1
+    assert len(payload1) == 1
+    assert payload1[0] is payload2[0]
+    assert payload1[0].data == {
+        'importantEmail': {
+            'email': {
+                'from': 'yuzhi@graphql.org',
+                'subject': 'Hello',
+            }
+        }
+    }
+
+
+def test_groups_subscriptions_by_variables():
+    stream, calls = Subject(), []
+    schema = make_schema(stream, calls)
+    hub = SubscriptionHub()
+
+    hub.subscribe(schema, document, variable_values={'a': 1}).subscribe(lambda _: None)
+    hub.subscribe(schema, document, variable_values={'a': 2}).subscribe(lambda _: None)
+
+    assert len(calls) == 2
+    assert len(hub.groups) == 2
+
+
+def test_removes_group_when_last_subscriber_leaves():
+    stream, calls = Subject(), []
+    schema = make_schema(stream, calls)
+    hub = SubscriptionHub()
+
+    payload = []
+    first = hub.subscribe(schema, document).subscribe(payload.append)
+    second = hub.subscribe(schema, document).subscribe(payload.append)
+    first.dispose()
+    assert len(hub.groups) == 1
+
+    send(stream, 'Hello')
+    assert len(payload) == 1
+
+    second.dispose()
+    assert not hub.groups
+
+    hub.subscribe(schema, document).subscribe(payload.append)
+    assert len(calls) == 2
+
+
+def test_removes_group_when_stream_completes():
+    stream, calls = Subject(), []
+    schema = make_schema(stream, calls)
+    hub = SubscriptionHub()
+
+    hub.subscribe(schema, document).subscribe(lambda _: None)
+    stream.on_completed()
+    assert not hub.groups
+
+
+def test_key_fn_returning_none_skips_sharing():
+    stream, calls = Subject(), []
+    schema = make_schema(stream, calls)
+    hub = SubscriptionHub(key_fn=lambda *args: None)
+
+    hub.subscribe(schema, document).subscribe(lambda _: None)
+    hub.subscribe(schema, document).subscribe(lambda _: None)
+
+    assert len(calls) == 2
+    assert not hub.groups
+
+
+def test_does_not_share_between_contexts_or_executors():
+    stream, calls = Subject(), []
+    schema = make_schema(stream, calls)
+    hub = SubscriptionHub()
+    context = {'user': 1}
+
+    hub.subscribe(schema, document, context_value=context).subscribe(lambda _: None)
+    hub.subscribe(schema, document, context_value=context).subscribe(lambda _: None)
+    hub.subscribe(schema, document, context_value={'user': 2}).subscribe(lambda _: None)
+    hub.subscribe(schema, document, context_value=context, executor=SyncExecutor()).subscribe(lambda _: None)
+
+    assert len(calls) == 3
+    assert len(hub.groups) == 3
+
+
+def test_graphql_can_be_imported_without_rx():
+    # RxPY is an optional dependency, blocked here as if it wasn't installed.
+    code = (
+        'import sys; '
+        'sys.modules["rx"] = None; '
+        'from graphql import GraphQLField, GraphQLObjectType, GraphQLSchema, GraphQLString, graphql; '
+        'from graphql.execution import SubscriptionHub; '
+        'schema = GraphQLSchema(GraphQLObjectType("Query", {"a": GraphQLField(GraphQLString, resolver=lambda *_: "a")})); '
+        'print(dict(graphql(schema, "{ a }").data))'
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(graphql.__file__)))
+    output = subprocess.check_output([sys.executable, '-c', code], env=env)
+
+    assert output.decode('utf-8').strip() == "{'a': 'a'}"
@@ -1,3 +1,5 @@
+from functools import partial
+
 from .execution import ExecutionResult, execute
 from .language.ast import Document
 from .language.parser import parse
@@ -28,6 +30,21 @@ from promise import promisify
 #    The name of the operation to use if requestString contains multiple
 #    possible operations. Can be omitted if requestString contains only
 #    one operation.
+# coalescer:
+#    An optional ExecutionCoalescer, used to share the execution of identical
+#    concurrent queries.
+# parse_cache:
+#    An optional ParseCache, used to reuse the Document of a request string
+#    that was already parsed.
+# validation_cache:
+#    An optional ValidationCache, used to reuse the validation errors of a
+#    document that was already validated against the schema.
+# introspection_cache:
+#    An optional IntrospectionCache, used to reuse the results of queries
+#    that only introspect the schema.
+# max_validation_errors:
+#    The number of validation errors after which validation stops, so that
+#    invalid documents are rejected early.
 
 
 def graphql(*args, **kwargs):
@@ -40,20 +57,26 @@ def graphql(*args, **kwargs):
 
 def execute_graphql(schema, request_string='', root_value=None, context_value=None,
                     variable_values=None, operation_name=None, executor=None,
-                    return_promise=False, middleware=None, allow_subscriptions=False):
+                    return_promise=False, middleware=None, allow_subscriptions=False, coalescer=None,
+                    parse_cache=None, validation_cache=None, max_validation_errors=None, introspection_cache=None):
     try:
         if isinstance(request_string, Document):
             ast = request_string
         else:
             source = Source(request_string, 'GraphQL request')
-            ast = parse(source)
-        validation_errors = validate(schema, ast)
+            ast = (parse_cache.parse if parse_cache is not None else parse)(source)
+        validation_errors = (validation_cache.validate if validation_cache is not None else validate)(
+            schema, ast, max_errors=max_validation_errors)
         if validation_errors:
             return ExecutionResult(
                 errors=validation_errors,
                 invalid=True,
             )
-        return execute(
+        execute_fn = coalescer.execute if coalescer else execute
+        if introspection_cache is not None:
+            # The cache executes the other operations with execute_fn.
+            execute_fn = partial(introspection_cache.execute, execute_fn=execute_fn)
+        return execute_fn(
             schema,
             ast,
             root_value,
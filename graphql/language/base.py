@@ -1,5 +1,6 @@
 from .lexer import Lexer
 from .location import get_location
+from .parse_cache import ParseCache
 from .parser import parse, parse_value
 from .printer import print_ast
 from .source import Source
@@ -10,6 +11,7 @@ __all__ = [
     'get_location',
     'parse',
     'parse_value',
+    'ParseCache',
     'print_ast',
     'Source',
     'BREAK',
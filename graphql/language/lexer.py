@@ -1,4 +1,5 @@
 import json
+import re
 
 from six import unichr
 
@@ -113,21 +114,48 @@ def char_code_at(s, pos):
     return None
 
 
-PUNCT_CODE_TO_KIND = {
-    ord('!'): TokenKind.BANG,
-    ord('$'): TokenKind.DOLLAR,
-    ord('('): TokenKind.PAREN_L,
-    ord(')'): TokenKind.PAREN_R,
-    ord(':'): TokenKind.COLON,
-    ord('='): TokenKind.EQUALS,
-    ord('@'): TokenKind.AT,
-    ord('['): TokenKind.BRACKET_L,
-    ord(']'): TokenKind.BRACKET_R,
-    ord('{'): TokenKind.BRACE_L,
-    ord('|'): TokenKind.PIPE,
-    ord('}'): TokenKind.BRACE_R,
+PUNCT_CHAR_TO_KIND = {
+    u'!': TokenKind.BANG,
+    u'$': TokenKind.DOLLAR,
+    u'(': TokenKind.PAREN_L,
+    u')': TokenKind.PAREN_R,
+    u':': TokenKind.COLON,
+    u'=': TokenKind.EQUALS,
+    u'@': TokenKind.AT,
+    u'[': TokenKind.BRACKET_L,
+    u']': TokenKind.BRACKET_R,
+    u'{': TokenKind.BRACE_L,
+    u'|': TokenKind.PIPE,
+    u'}': TokenKind.BRACE_R,
 }
 
+NAME_START_CHARS = frozenset(u'_ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')
+NUMBER_START_CHARS = frozenset(u'-0123456789')
+
+# The scanners below match whole runs of characters at once with
+# precompiled patterns (`pattern.match(body, position)`), instead of
+# looking at the body one character code at a time. Anything they don't
+# accept is handed to the character level code, which reports the error.
+
+# BOM, white space, line terminators, commas and comments.
+IGNORED = re.compile(u'(?:[\ufeff\t \n\r,]+|#[^\x00-\x08\x0a-\x1f]*)*')
+
+NAME = re.compile(u'[_A-Za-z][_0-9A-Za-z]*')
+
+# Only matches when the number is followed by a character that can't be
+# part of it, so `1.`, `1.0e` or `01` fall back to `read_number_slow`.
+NUMBER = re.compile(
+    u'-?(?:0|[1-9][0-9]*)(\\.[0-9]+)?([eE][+-]?[0-9]+)?(?![.0-9eE])'
+)
+
+DIGITS = re.compile(u'[0-9]+')
+
+# Characters a string can hold as they are: anything but the quote, the
+# backslash, line terminators and control characters other than tab.
+STRING_CHARS = re.compile(u'[^"\\\\\x00-\x08\x0a-\x1f]*')
+
+HEX_CHAR_CODE = re.compile(u'[0-9A-Fa-f]{4}')
+
 
 def print_char_code(code):
     if code is None:
@@ -146,80 +174,48 @@ def read_token(source, from_position):
     token, then lexes punctuators immediately or calls the appropriate
     helper fucntion for more complicated tokens."""
     body = source.body
-    body_length = len(body)
 
     position = position_after_whitespace(body, from_position)
 
-    if position >= body_length:
+    if position >= len(body):
         return Token(TokenKind.EOF, position, position)
 
-    code = char_code_at(body, position)
-
-    if code < 0x0020 and code not in (0x0009, 0x000A, 0x000D):
-        raise GraphQLSyntaxError(
-            source, position,
-            u'Invalid character {}.'.format(print_char_code(code))
-        )
+    char = body[position]
 
-    kind = PUNCT_CODE_TO_KIND.get(code)
+    kind = PUNCT_CHAR_TO_KIND.get(char)
     if kind is not None:
         return Token(kind, position, position + 1)
 
-    if code == 46:  # .
-        if char_code_at(body, position + 1) == char_code_at(body, position + 2) == 46:
-            return Token(TokenKind.SPREAD, position, position + 3)
-
-    elif 65 <= code <= 90 or code == 95 or 97 <= code <= 122:
-        # A-Z, _, a-z
+    if char in NAME_START_CHARS:
         return read_name(source, position)
 
-    elif code == 45 or 48 <= code <= 57:  # -, 0-9
-        return read_number(source, position, code)
+    elif char in NUMBER_START_CHARS:
+        return read_number(source, position, ord(char))
 
-    elif code == 34:  # "
+    elif char == u'"':
         return read_string(source, position)
 
+    elif char == u'.':
+        if body.startswith(u'...', position):
+            return Token(TokenKind.SPREAD, position, position + 3)
+
+    code = ord(char)
+    if code < 0x0020:
+        raise GraphQLSyntaxError(
+            source, position,
+            u'Invalid character {}.'.format(print_char_code(code))
+        )
+
     raise GraphQLSyntaxError(
         source, position,
         u'Unexpected character {}.'.format(print_char_code(code)))
 
 
-ignored_whitespace_characters = frozenset([
-    # BOM
-    0xFEFF,
-    # White Space
-    0x0009,  # tab
-    0x0020,  # space
-    # Line Terminator
-    0x000A,  # new line
-    0x000D,  # carriage return
-    # Comma
-    0x002C
-])
-
-
 def position_after_whitespace(body, start_position):
     """Reads from body starting at start_position until it finds a
     non-whitespace or commented character, then returns the position of
     that character for lexing."""
-    body_length = len(body)
-    position = start_position
-    while position < body_length:
-        code = char_code_at(body, position)
-        if code in ignored_whitespace_characters:
-            position += 1
-
-        elif code == 35:  # #, skip comments
-            position += 1
-            while position < body_length:
-                code = char_code_at(body, position)
-                if not (code is not None and (code > 0x001F or code == 0x0009) and code not in (0x000A, 0x000D)):
-                    break
-
-                position += 1
-        else:
-            break
-    return position
+    return IGNORED.match(body, start_position).end()
 
 
 def read_number(source, start, first_code):
@@ -228,6 +224,23 @@ def read_number(source, start, first_code):
 
     Int:   -?(0|[1-9][0-9]*)
     Float: -?(0|[1-9][0-9]*)(\.[0-9]+)?((E|e)(+|-)?[0-9]+)?"""
+    body = source.body
+    match = NUMBER.match(body, start)
+    if match is None:
+        return read_number_slow(source, start, first_code)
+
+    end = match.end()
+    return Token(
+        TokenKind.FLOAT if match.group(1) or match.group(2) else TokenKind.INT,
+        start,
+        end,
+        body[start:end]
+    )
+
+
+def read_number_slow(source, start, first_code):
+    """Reads a number token the way the spec describes it, part by part,
+    so that an invalid number is reported at the offending character."""
     code = first_code
     body = source.body
     position = start
@@ -248,15 +261,13 @@ def read_number(source, start, first_code):
                 u'Invalid number, unexpected digit after 0: {}.'.format(print_char_code(code))
             )
     else:
-        position = read_digits(source, position, code)
+        position = read_digits(source, position)
         code = char_code_at(body, position)
 
     if code == 46:  # .
         is_float = True
 
-        position += 1
-        code = char_code_at(body, position)
-        position = read_digits(source, position, code)
+        position = read_digits(source, position + 1)
         code = char_code_at(body, position)
 
     if code in (69, 101):  # E e
@@ -265,9 +276,8 @@ def read_number(source, start, first_code):
         code = char_code_at(body, position)
         if code in (43, 45):  # + -
             position += 1
-            code = char_code_at(body, position)
 
-        position = read_digits(source, position, code)
+        position = read_digits(source, position)
 
     return Token(
         TokenKind.FLOAT if is_float else TokenKind.INT,
@@ -277,37 +287,29 @@ def read_number(source, start, first_code):
     )
 
 
-def read_digits(source, start, first_code):
-    body = source.body
-    position = start
-    code = first_code
-
-    if code is not None and 48 <= code <= 57:  # 0 - 9
-        while True:
-            position += 1
-            code = char_code_at(body, position)
-
-            if not (code is not None and 48 <= code <= 57):
-                break
-
-        return position
+def read_digits(source, start):
+    match = DIGITS.match(source.body, start)
+    if match is not None:
+        return match.end()
 
     raise GraphQLSyntaxError(
         source,
-        position,
-        u'Invalid number, expected digit but got: {}.'.format(print_char_code(code))
+        start,
+        u'Invalid number, expected digit but got: {}.'.format(
+            print_char_code(char_code_at(source.body, start))
+        )
     )
 
 
-ESCAPED_CHAR_CODES = {
-    34: '"',
-    47: '/',
-    92: '\\',
-    98: '\b',
-    102: '\f',
-    110: '\n',
-    114: '\r',
-    116: '\t',
+ESCAPED_CHARS = {
+    u'"': u'"',
+    u'/': u'/',
+    u'\\': u'\\',
+    u'b': u'\b',
+    u'f': u'\f',
+    u'n': u'\n',
+    u'r': u'\r',
+    u't': u'\t',
 }
 
 
@@ -320,100 +322,58 @@ def read_string(source, start):
     body_length = len(body)
 
     position = start + 1
-    chunk_start = position
-    code = 0
     value = []
     append = value.append
 
-    while position < body_length:
-        code = char_code_at(body, position)
-        if not (
-            code is not None and
-            code not in (
-                # LineTerminator
-                0x000A, 0x000D,
-                # Quote
-                34
-            )
-        ):
+    while True:
+        chunk_end = STRING_CHARS.match(body, position).end()
+        append(body[position:chunk_end])
+        position = chunk_end
+
+        if position >= body_length:
             break
 
-        if code < 0x0020 and code != 0x0009:
+        char = body[position]
+        if char == u'"':
+            return Token(TokenKind.STRING, start, position + 1, u''.join(value))
+
+        if char != u'\\':
+            if char in u'\n\r':
+                break
+
             raise GraphQLSyntaxError(
                 source,
                 position,
-                u'Invalid character within String: {}.'.format(print_char_code(code))
+                u'Invalid character within String: {}.'.format(print_char_code(ord(char)))
             )
 
         position += 1
-        if code == 92:  # \
-            append(body[chunk_start:position - 1])
-
-            code = char_code_at(body, position)
-            escaped = ESCAPED_CHAR_CODES.get(code)
-            if escaped is not None:
-                append(escaped)
-
-            elif code == 117:  # u
-                char_code = uni_char_code(
-                    char_code_at(body, position + 1) or 0,
-                    char_code_at(body, position + 2) or 0,
-                    char_code_at(body, position + 3) or 0,
-                    char_code_at(body, position + 4) or 0,
-                )
+        if position >= body_length:
+            break
 
-                if char_code < 0:
-                    raise GraphQLSyntaxError(
-                        source, position,
-                        u'Invalid character escape sequence: \\u{}.'.format(body[position + 1: position + 5])
-                    )
+        char = body[position]
+        escaped = ESCAPED_CHARS.get(char)
+        if escaped is not None:
+            append(escaped)
 
-                append(unichr(char_code))
-                position += 4
-            else:
+        elif char == u'u':
+            if not HEX_CHAR_CODE.match(body, position + 1):
                 raise GraphQLSyntaxError(
                     source, position,
-                    u'Invalid character escape sequence: \\{}.'.format(unichr(code))
+                    u'Invalid character escape sequence: \\u{}.'.format(body[position + 1: position + 5])
                 )
 
-            position += 1
-            chunk_start = position
-
-    if code != 34:  # Quote (")
-        raise GraphQLSyntaxError(source, position, 'Unterminated string')
-
-    append(body[chunk_start:position])
-    return Token(TokenKind.STRING, start, position + 1, u''.join(value))
-
-
-def uni_char_code(a, b, c, d):
-    """Converts four hexidecimal chars to the integer that the
-    string represents. For example, uniCharCode('0','0','0','f')
-    will return 15, and uniCharCode('0','0','f','f') returns 255.
-
-    Returns a negative number on error, if a char was invalid.
-
-    This is implemented by noting that char2hex() returns -1 on error,
-    which means the result of ORing the char2hex() will also be negative.
-    """
-    return (char2hex(a) << 12 | char2hex(b) << 8 |
-            char2hex(c) << 4 | char2hex(d))
-
+            append(unichr(int(body[position + 1: position + 5], 16)))
+            position += 4
+        else:
+            raise GraphQLSyntaxError(
+                source, position,
+                u'Invalid character escape sequence: \\{}.'.format(char)
+            )
 
-def char2hex(a):
-    """Converts a hex character to its integer value.
-    '0' becomes 0, '9' becomes 9
-    'A' becomes 10, 'F' becomes 15
-    'a' becomes 10, 'f' becomes 15
+        position += 1
 
-    Returns -1 on error."""
-    if 48 <= a <= 57:  # 0-9
-        return a - 48
-    elif 65 <= a <= 70:  # A-F
-        return a - 55
-    elif 97 <= a <= 102:  # a-f
-        return a - 87
-    return -1
+    raise GraphQLSyntaxError(source, position, 'Unterminated string')
 
 
 def read_name(source, position):
@@ -421,19 +381,5 @@ def read_name(source, position):
 
     [_A-Za-z][_0-9A-Za-z]*"""
     body = source.body
-    body_length = len(body)
-    end = position + 1
-
-    while end != body_length:
-        code = char_code_at(body, end)
-        if not (code is not None and (
-            code == 95 or  # _
-            48 <= code <= 57 or  # 0-9
-            65 <= code <= 90 or  # A-Z
-            97 <= code <= 122  # a-z
-        )):
-            break
-
-        end += 1
-
+    end = NAME.match(body, position).end()
     return Token(TokenKind.NAME, position, end, body[position:end])
@@ -0,0 +1,78 @@
+from threading import Lock, local
+
+from ..pyutils.ordereddict import OrderedDict
+from .parser import parse
+from .source import Source
+
+__all__ = ['ParseCache']
+
+
+class ParseCache(object):
+    """A bounded LRU cache of parsed documents.
+
+    Documents are keyed by the source body, its name and the parse options,
+    so repeated requests with the same query string are parsed only once.
+    Syntax errors are not cached, they are raised on every call.
+
+    By default the cache is `shared` between threads, and a cached Document
+    may be handed to several requests at the same time: documents returned
+    by the cache must be treated as immutable. Use `shared=False` to keep a
+    separate cache per thread instead, at the cost of parsing each query
+    once per thread.
+
+    Example:
+
+        parse_cache = ParseCache(max_size=500)
+        graphql(schema, request_string, parse_cache=parse_cache)
+    """
+
+    def __init__(self, max_size=1000, shared=True):
+        assert max_size > 0, 'ParseCache must hold at least one document.'
+        self.max_size = max_size
+        self.shared = shared
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+        self.local = None if shared else local()
+        self._documents = OrderedDict()
+
+    @property
+    def documents(self):
+        if self.shared:
+            return self._documents
+        documents = getattr(self.local, 'documents', None)
+        if documents is None:
+            documents = self.local.documents = OrderedDict()
+        return documents
+
+    def parse(self, source, **options):
+        if not isinstance(source, Source):
+            source = Source(source)
+
+        key = (source.body, source.name, tuple(sorted(options.items())))
+        documents = self.documents
+        with self.lock:
+            document = documents.pop(key, None)
+            if document is not None:
+                # Re-insert the document so it's the most recently used.
+                documents[key] = document
+                self.hits += 1
+                return document
+            self.misses += 1
+
+        document = parse(source, **options)
+
+        with self.lock:
+            documents[key] = document
+            while len(documents) > self.max_size:
+                documents.popitem(last=False)
+        return document
+
+    def clear(self):
+        with self.lock:
+            self.documents.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self.documents)
@@ -219,3 +219,33 @@ def test_lex_reports_useful_information_for_dashes_in_names():
         lexer.next_token()
 
     assert u'Syntax Error GraphQL (1:3) Invalid number, expected digit but got: "b".' in excinfo.value.message
+
+
+def test_skips_comments_with_unicode_and_tabs():
+    assert lex_one(u'#\u00e9\t comment\r\nfoo') == Token(TokenKind.NAME, 13, 16, 'foo')
+
+
+def test_lexes_tokens_followed_by_other_tokens():
+    lexer = Lexer(Source(u'1.5...-0,abc_123"s\\u00e9"[0e1]'))
+    tokens = []
+    token = lexer.next_token()
+    while token.kind != TokenKind.EOF:
+        tokens.append(token)
+        token = lexer.next_token()
+
+    assert tokens == [
+        Token(TokenKind.FLOAT, 0, 3, '1.5'),
+        Token(TokenKind.SPREAD, 3, 6),
+        Token(TokenKind.INT, 6, 8, '-0'),
+        Token(TokenKind.NAME, 9, 16, 'abc_123'),
+        Token(TokenKind.STRING, 16, 25, u's\u00e9'),
+        Token(TokenKind.BRACKET_L, 25, 26),
+        Token(TokenKind.FLOAT, 26, 29, '0e1'),
+        Token(TokenKind.BRACKET_R, 29, 30),
+    ]
+
+
+def test_lex_reports_unterminated_escape_at_end_of_string():
+    with raises(GraphQLSyntaxError) as excinfo:
+        lex_one(u'"escape \\')
+    assert u'Syntax Error GraphQL (1:10) Unterminated string' in excinfo.value.message
@@ -0,0 +1,94 @@
+from pytest import raises
+
+from graphql import graphql
+from graphql.error import GraphQLSyntaxError
+from graphql.language.base import ParseCache, Source
+from graphql.language.printer import print_ast
+from graphql.type import (GraphQLField, GraphQLObjectType, GraphQLSchema,
+                          GraphQLString)
+
+
+def test_reuses_parsed_documents():
+    cache = ParseCache()
+    document = cache.parse('{ a }')
+
+    assert cache.parse('{ a }') is document
+    assert cache.parse(Source('{ a }')) is document
+    assert cache.hits == 2
+    assert cache.misses == 1
+    assert print_ast(document) == '{\n  a\n}\n'
+
+
+def test_keys_by_source_name_and_options():
+    cache = ParseCache()
+    document = cache.parse('{ a }')
+
+    assert cache.parse(Source('{ a }', 'Other')) is not document
+    assert cache.parse('{ a }', no_location=True) is not document
+    assert cache.parse('{ a }', no_location=True).loc is None
+    assert cache.misses == 3
+    assert len(cache) == 3
+
+
+def test_evicts_least_recently_used_documents():
+    cache = ParseCache(max_size=2)
+    a = cache.parse('{ a }')
+    cache.parse('{ b }')
+    assert cache.parse('{ a }') is a
+    cache.parse('{ c }')
+
+    assert len(cache) == 2
+    assert cache.parse('{ a }') is a
+    cache.parse('{ b }')
+    assert cache.misses == 4
+
+
+def test_does_not_cache_syntax_errors():
+    cache = ParseCache()
+    for _ in range(2):
+        with raises(GraphQLSyntaxError):
+            cache.parse('{ a')
+
+    assert cache.misses == 2
+    assert len(cache) == 0
+
+
+def test_clear():
+    cache = ParseCache()
+    cache.parse('{ a }')
+    cache.parse('{ a }')
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.hits == cache.misses == 0
+
+
+def test_unshared_caches_are_per_thread():
+    from threading import Thread
+
+    cache = ParseCache(shared=False)
+    document = cache.parse('{ a }')
+    documents = []
+    thread = Thread(target=lambda: documents.append(cache.parse('{ a }')))
+    thread.start()
+    thread.join()
+
+    assert documents[0] is not document
+    assert cache.parse('{ a }') is document
+    assert cache.misses == 2
+    assert cache.hits == 1
+
+
+def test_graphql_uses_the_parse_cache():
+    schema = GraphQLSchema(GraphQLObjectType('Query', {
+        'a': GraphQLField(GraphQLString, resolver=lambda *_: 'a'),
+    }))
+    cache = ParseCache()
+
+    for _ in range(3):
+        result = graphql(schema, '{ a }', parse_cache=cache)
+        assert not result.errors
+        assert result.data == {'a': 'a'}
+
+    assert cache.hits == 2
+    assert cache.misses == 1
@@ -667,6 +667,39 @@ def test_visits_in_pararell_allows_skipping_different_subtrees():
     ]
 
 
+def test_visits_in_pararell_dispatches_nodes_by_type():
+    visited = []
+    ast = parse('{ a { x }, b { y } }')
+
+    class FieldVisitor(Visitor):
+
+        def enter_Field(self, node, *args):
+            visited.append(['field', 'enter', node.name.value])
+            if node.name.value == 'a':
+                return False
+
+        def leave_Field(self, node, *args):
+            visited.append(['field', 'leave', node.name.value])
+
+    class NameVisitor(Visitor):
+
+        def enter_Name(self, node, *args):
+            visited.append(['name', 'enter', node.value])
+
+    visit(ast, ParallelVisitor([FieldVisitor(), NameVisitor()]))
+    assert visited == [
+        ['field', 'enter', 'a'],
+        ['name', 'enter', 'a'],
+        ['name', 'enter', 'x'],
+        ['field', 'enter', 'b'],
+        ['name', 'enter', 'b'],
+        ['field', 'enter', 'y'],
+        ['name', 'enter', 'y'],
+        ['field', 'leave', 'y'],
+        ['field', 'leave', 'b'],
+    ]
+
+
 def test_visits_in_pararell_allows_early_exit_while_visiting():
     visited = []
     ast = parse('{ a, b { x }, c }')
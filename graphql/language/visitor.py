@@ -174,33 +174,83 @@ class Visitor(object):
 
 
 class ParallelVisitor(Visitor):
-    __slots__ = 'skipping', 'visitors'
+    """Visits with several visitors at once.
+
+    The visitors that handle each node type are looked up once per type, so
+    a node is only dispatched to the visitors that care about it."""
+    __slots__ = 'skipping', 'visitors', 'skipped', 'enter_handlers', 'leave_handlers'
 
     def __init__(self, visitors):
         self.visitors = visitors
         self.skipping = [None] * len(visitors)
+        # Indexes of the visitors skipping the subtree of a node, by node id.
+        self.skipped = {}
+        self.enter_handlers = {}
+        self.leave_handlers = {}
 
-    def enter(self, node, key, parent, path, ancestors):
+    def get_handlers(self, node_type, leaving):
+        handlers = []
         for i, visitor in enumerate(self.visitors):
-            if not self.skipping[i]:
-                result = visitor.enter(node, key, parent, path, ancestors)
+            cls = type(visitor)
+            if leaving:
+                dispatches = isinstance(visitor, Visitor) and cls.leave == Visitor.leave
+                get_handler = getattr(cls, '_get_leave_handler', None)
+            else:
+                dispatches = isinstance(visitor, Visitor) and cls.enter == Visitor.enter
+                get_handler = getattr(cls, '_get_enter_handler', None)
+
+            if not dispatches:
+                # The visitor handles every node by itself.
+                handlers.append((i, visitor.leave if leaving else visitor.enter))
+                continue
+
+            method = get_handler(node_type)
+            if method is not None:
+                handlers.append((i, method.__get__(visitor, cls)))
+
+        return handlers
+
+    def enter(self, node, key, parent, path, ancestors):
+        node_type = type(node)
+        handlers = self.enter_handlers.get(node_type)
+        if handlers is None:
+            handlers = self.enter_handlers[node_type] = self.get_handlers(node_type, False)
+
+        skipping = self.skipping
+        for i, handler in handlers:
+            if not skipping[i]:
+                result = handler(node, key, parent, path, ancestors)
                 if result is False:
-                    self.skipping[i] = node
+                    skipping[i] = node
+                    self.skipped.setdefault(id(node), []).append(i)
                 elif result is BREAK:
-                    self.skipping[i] = BREAK
+                    skipping[i] = BREAK
                 elif result is not None:
                     return result
 
     def leave(self, node, key, parent, path, ancestors):
-        for i, visitor in enumerate(self.visitors):
-            if not self.skipping[i]:
-                result = visitor.leave(node, key, parent, path, ancestors)
+        node_type = type(node)
+        handlers = self.leave_handlers.get(node_type)
+        if handlers is None:
+            handlers = self.leave_handlers[node_type] = self.get_handlers(node_type, True)
+
+        skipping = self.skipping
+        result = None
+        for i, handler in handlers:
+            if not skipping[i]:
+                result = handler(node, key, parent, path, ancestors)
                 if result is BREAK:
-                    self.skipping[i] = BREAK
+                    skipping[i] = BREAK
                 elif result is not None and result is not False:
-                    return result
-            elif self.skipping[i] == node:
-                self.skipping[i] = REMOVE
+                    break
+        else:
+            result = None
+
+        if self.skipped:
+            for i in self.skipped.pop(id(node), ()):
+                skipping[i] = None
+
+        return result
 
 
 class TypeInfoVisitor(Visitor):
@@ -0,0 +1,16 @@
+class FrozenDict(dict):
+    """A dict that can't be changed once created.
+
+    Lookups are those of dict, so it's as fast to read."""
+    __slots__ = ()
+
+    def _not_supported(self, *args, **kwargs):
+        raise TypeError("'{}' object does not support changes.".format(type(self).__name__))
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _not_supported
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    def copy(self):
+        return type(self)(self)
@@ -0,0 +1,39 @@
+import copy
+import pickle
+
+from pytest import raises
+
+from graphql.pyutils.frozen_dict import FrozenDict
+
+
+def test_reads_like_a_dict():
+    d = FrozenDict([('a', 1), ('b', 2)])
+    assert d == {'a': 1, 'b': 2}
+    assert d['a'] == 1
+    assert d.get('c') is None
+    assert 'b' in d
+
+
+def test_can_not_be_changed():
+    d = FrozenDict(a=1)
+    for change in [
+        lambda: d.__setitem__('a', 2),
+        lambda: d.__delitem__('a'),
+        lambda: d.update(a=2),
+        lambda: d.setdefault('b', 2),
+        lambda: d.pop('a'),
+        lambda: d.popitem(),
+        lambda: d.clear(),
+    ]:
+        with raises(TypeError) as excinfo:
+            change()
+        assert str(excinfo.value) == "'FrozenDict' object does not support changes."
+
+    assert d == {'a': 1}
+
+
+def test_can_be_copied_and_pickled():
+    d = FrozenDict(a=[1])
+    for copied in [d.copy(), copy.copy(d), copy.deepcopy(d), pickle.loads(pickle.dumps(d))]:
+        assert isinstance(copied, FrozenDict)
+        assert copied == d
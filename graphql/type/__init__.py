@@ -45,6 +45,7 @@ from .scalars import (  # no import order
     GraphQLID,
 )
 from .schema import GraphQLSchema
+from .schema_view import SchemaView
 
 from .introspection import (
     # "Enum" of Type Kinds
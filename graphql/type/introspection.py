@@ -217,7 +217,7 @@ class TypeFieldResolvers(object):
         if isinstance(type, (GraphQLObjectType, GraphQLInterfaceType)):
             fields = []
             include_deprecated = includeDeprecated
-            for field_name, field in type.fields.items():
+            for field_name, field in info.schema.get_fields(type).items():
                 if field.deprecation_reason and not include_deprecated:
                     continue
                 fields.append(Field(
@@ -233,7 +233,7 @@ class TypeFieldResolvers(object):
     @staticmethod
     def interfaces(type, info):
         if isinstance(type, GraphQLObjectType):
-            return type.interfaces
+            return info.schema.get_interfaces(type)
 
     @staticmethod
     def possible_types(type, info, **args):
@@ -1,9 +1,13 @@
 from collections import Iterable
 
-from .definition import GraphQLObjectType
+from ..pyutils.frozen_dict import FrozenDict
+from ..utils.resolver_kind import get_resolver_kind
+from .definition import (GraphQLInterfaceType, GraphQLObjectType,
+                         GraphQLUnionType)
 from .directives import GraphQLDirective, specified_directives
-from .introspection import IntrospectionSchema
-from .typemap import GraphQLTypeMap
+from .introspection import (IntrospectionSchema, SchemaMetaFieldDef,
+                            TypeMetaFieldDef, TypeNameMetaFieldDef)
+from .typemap import GraphQLLazyTypeMap, GraphQLTypeMap
 
 
 class GraphQLSchema(object):
@@ -29,10 +33,23 @@ class GraphQLSchema(object):
           ...
           directives=specified_directives.extend([MyCustomerDirective]),
       )
+
+    Note: `assume_valid=True` skips the checks of the types, such as unique
+    type names and correct interface implementations. Only use it with types
+    known to be valid, for example those restored from a schema snapshot.
+
+    With `lazy=True`, the types are only checked, and their fields resolved,
+    when validation or execution first uses them, which makes very large
+    schemas much faster to create. All the types that may be looked up by
+    name, or that implement an interface, should then be given as `types`.
+    Getting the whole type map, for example to introspect the schema, still
+    checks every type.
     """
-    __slots__ = '_query', '_mutation', '_subscription', '_type_map', '_directives', '_implementations', '_possible_type_map'
+    __slots__ = '_query', '_mutation', '_subscription', '_type_map', '_directives', '_implementations', '_possible_type_map', \
+        '_resolver_kinds', '_directive_map', '_field_defs', '_frozen', '__weakref__'
 
-    def __init__(self, query, mutation=None, subscription=None, directives=None, types=None):
+    def __init__(self, query, mutation=None, subscription=None, directives=None, types=None, assume_valid=False,
+                 lazy=False):
         assert isinstance(query, GraphQLObjectType), 'Schema query must be Object Type but got: {}.'.format(query)
         if mutation:
             assert isinstance(mutation, GraphQLObjectType), \
@@ -66,7 +83,64 @@ class GraphQLSchema(object):
         ]
         if types:
             initial_types += types
-        self._type_map = GraphQLTypeMap(initial_types)
+        self._resolver_kinds = {}
+        self._directive_map = None
+        self._frozen = False
+
+        if lazy:
+            self._type_map = GraphQLLazyTypeMap(initial_types)
+            # The fields of each type, by type, as they are first used.
+            self._field_defs = {}
+            return
+
+        self._type_map = GraphQLTypeMap(initial_types, assume_valid)
+
+        # Set by freeze().
+        self._field_defs = None
+
+    def freeze(self):
+        """Precomputes the lookups made by validation and execution, so they
+        never fall back to lazy computation: the possible types of every
+        abstract type, the directives by name, and the fields of every
+        composite type, meta fields included.
+
+        Call it once the schema is complete, for example before forking
+        workers so they share the precomputed structures. These are made
+        read-only, but the types and directives themselves must not be
+        changed afterwards either."""
+        if self._frozen:
+            return self
+
+        type_map = self.get_type_map()
+        type_map.freeze()
+        self._directives = tuple(self._directives)
+        self._directive_map = FrozenDict((directive.name, directive) for directive in self._directives)
+
+        field_defs = self._field_defs or {}
+        for type in type_map.values():
+            if type not in field_defs and isinstance(type, (GraphQLObjectType, GraphQLInterfaceType,
+                                                            GraphQLUnionType)):
+                field_defs[type] = self._make_field_defs(type)
+
+        self._field_defs = FrozenDict((type, FrozenDict(type_field_defs))
+                                      for type, type_field_defs in field_defs.items())
+        self._frozen = True
+        return self
+
+    def is_frozen(self):
+        return self._frozen
+
+    def _make_field_defs(self, type):
+        if isinstance(type, GraphQLUnionType):
+            field_defs = {}
+        else:
+            field_defs = dict(type.fields)
+
+        field_defs['__typename'] = TypeNameMetaFieldDef
+        if type is self._query:
+            field_defs['__schema'] = SchemaMetaFieldDef
+            field_defs['__type'] = TypeMetaFieldDef
+        return field_defs
 
     def get_query_type(self):
         return self._query
@@ -78,6 +152,8 @@ class GraphQLSchema(object):
         return self._subscription
 
     def get_type_map(self):
+        if not self._frozen and isinstance(self._type_map, GraphQLLazyTypeMap):
+            self._type_map.materialize()
         return self._type_map
 
     def get_type(self, name):
@@ -87,12 +163,49 @@ class GraphQLSchema(object):
         return self._directives
 
     def get_directive(self, name):
+        if self._directive_map is not None:
+            return self._directive_map.get(name)
+
         for directive in self.get_directives():
             if directive.name == name:
                 return directive
 
         return None
 
+    def get_field_defs(self, type):
+        """Returns the fields of a composite type by name, including the meta
+        fields it can be queried for, or None if the schema is neither frozen
+        nor lazy."""
+        field_defs = self._field_defs
+        if field_defs is None:
+            return None
+
+        type_field_defs = field_defs.get(type)
+        if type_field_defs is None and not self._frozen and \
+                isinstance(type, (GraphQLObjectType, GraphQLInterfaceType, GraphQLUnionType)) and \
+                type.name in self._type_map and self._type_map[type.name] is type:
+            # The first use of a type of a lazy schema.
+            self._type_map.check_type(type)
+            type_field_defs = field_defs[type] = self._make_field_defs(type)
+
+        return type_field_defs
+
+    def get_fields(self, type):
+        """Returns the fields of an object or interface type, in order."""
+        return type.fields
+
+    def get_interfaces(self, type):
+        """Returns the interfaces an object type implements."""
+        return type.interfaces
+
+    def get_resolver_kind(self, field_def):
+        """Returns the ResolverKind of the resolver of a field, classified the
+        first time it's asked for."""
+        kind = self._resolver_kinds.get(field_def)
+        if kind is None:
+            kind = self._resolver_kinds[field_def] = get_resolver_kind(field_def.resolver)
+        return kind
+
     def get_possible_types(self, abstract_type):
         return self._type_map.get_possible_types(abstract_type)
 
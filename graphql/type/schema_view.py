@@ -0,0 +1,181 @@
+from ..pyutils.frozen_dict import FrozenDict
+from ..pyutils.ordereddict import OrderedDict
+from .definition import (GraphQLInputObjectType, GraphQLInterfaceType,
+                         GraphQLObjectType, GraphQLUnionType, get_named_type)
+from .schema import GraphQLSchema
+
+
+class SchemaView(GraphQLSchema):
+    """Schema View
+
+    A view of a schema that hides some of its types and fields from
+    validation, execution and introspection, while sharing the type objects
+    of the schema, such as to serve several audiences from one schema.
+
+    What is visible is given either by `is_visible(type_name, field_name=None)`,
+    called for each type and for each field of object and interface types,
+    or by `hidden`, the names of the hidden types and fields as
+    `'Type'` and `'Type.field'`.
+
+    Example:
+
+        PublicSchema = SchemaView(MyAppSchema.freeze(), hidden=['AuditLog', 'User.email'])
+
+    Hiding a type also hides the fields and arguments using it. Object types
+    left without any field, unions left without any type and input objects
+    using a hidden type are hidden as well. Introspection types can't be
+    hidden, and the query type must stay visible.
+
+    So that the view is a valid schema, hiding a field of an interface hides
+    it on the types implementing the interface, and hiding a field that an
+    interface requires hides it on the interface too.
+
+    Visibility is computed once, when the view is created, so the schema
+    must be frozen (see `GraphQLSchema.freeze`) beforehand. The view doesn't
+    call the constructor of GraphQLSchema: it derives its lookups from those
+    of the schema rather than collecting and checking the types again.
+    """
+    __slots__ = '_schema', '_fields', '_interfaces'
+
+    def __init__(self, schema, is_visible=None, hidden=None):
+        assert isinstance(schema, GraphQLSchema), 'Must provide valid GraphQLSchema'
+        assert (is_visible is None) != (hidden is None), 'Must provide either is_visible or hidden, but not both.'
+        if hidden is not None:
+            hidden = frozenset(hidden)
+
+            def is_visible(type_name, field_name=None):
+                if field_name is None:
+                    return type_name not in hidden
+                return '{}.{}'.format(type_name, field_name) not in hidden
+
+        assert schema.is_frozen(), 'The schema must be frozen before creating a view of it.'
+        type_map = schema.get_type_map()
+        hidden_types = set(
+            name for name in type_map
+            if not name.startswith('__') and not is_visible(name)
+        )
+
+        # The fields the predicate hides, by type name.
+        hidden_fields = {}
+        for type in type_map.values():
+            if type.name not in hidden_types and isinstance(type, (GraphQLObjectType, GraphQLInterfaceType)) and \
+                    not type.name.startswith('__'):
+                hidden_fields[type.name] = set(
+                    field_name for field_name in type.fields
+                    if not is_visible(type.name, field_name)
+                )
+
+        # The fields hidden on an interface are hidden on its implementations.
+        for type in type_map.values():
+            if type.name in hidden_fields and isinstance(type, GraphQLObjectType):
+                for interface in type.interfaces:
+                    hidden_fields[type.name].update(hidden_fields.get(interface.name, ()))
+
+        # Hiding a type may leave other types empty, so they are hidden in
+        # turn, until nothing changes.
+        fields = {}
+        changed = True
+        while changed:
+            changed = False
+            for type in type_map.values():
+                if type.name in hidden_types:
+                    continue
+
+                if isinstance(type, (GraphQLObjectType, GraphQLInterfaceType)):
+                    fields[type] = visible_fields = OrderedDict(
+                        (field_name, field) for field_name, field in type.fields.items()
+                        if field_name not in hidden_fields.get(type.name, ()) and
+                        get_named_type(field.type).name not in hidden_types and
+                        not any(get_named_type(arg.type).name in hidden_types for arg in field.args.values())
+                    )
+                    is_empty = not visible_fields
+                elif isinstance(type, GraphQLUnionType):
+                    is_empty = all(possible_type.name in hidden_types for possible_type in type.types)
+                elif isinstance(type, GraphQLInputObjectType):
+                    is_empty = any(get_named_type(field.type).name in hidden_types for field in type.fields.values())
+                else:
+                    continue
+
+                if is_empty:
+                    hidden_types.add(type.name)
+                    changed = True
+
+            # An interface field hidden on one of its implementations is
+            # hidden on the interface.
+            for type in type_map.values():
+                if type.name in hidden_types or not isinstance(type, GraphQLObjectType):
+                    continue
+
+                for interface in type.interfaces:
+                    if interface.name in hidden_types:
+                        continue
+
+                    for field_name in fields[interface]:
+                        if field_name not in fields[type]:
+                            hidden_fields[interface.name].add(field_name)
+                            changed = True
+
+        query = schema.get_query_type()
+        assert query.name not in hidden_types, 'The query type "{}" must be visible.'.format(query)
+
+        mutation = schema.get_mutation_type()
+        subscription = schema.get_subscription_type()
+        self._schema = schema
+        self._query = query
+        self._mutation = mutation if mutation and mutation.name not in hidden_types else None
+        self._subscription = subscription if subscription and subscription.name not in hidden_types else None
+        self._directives = schema.get_directives()
+        self._directive_map = FrozenDict((directive.name, directive) for directive in self._directives)
+        self._type_map = OrderedDict((name, type) for name, type in type_map.items() if name not in hidden_types)
+
+        self._fields = fields = {type: type_fields for type, type_fields in fields.items()
+                                 if type.name not in hidden_types}
+        self._interfaces = {}
+        self._implementations = {}
+        self._field_defs = {}
+        for type in self._type_map.values():
+            if isinstance(type, GraphQLObjectType):
+                self._interfaces[type] = [
+                    interface for interface in type.interfaces if interface.name not in hidden_types
+                ]
+
+            if isinstance(type, (GraphQLInterfaceType, GraphQLUnionType)):
+                self._implementations[type.name] = tuple(
+                    possible_type for possible_type in schema.get_possible_types(type) or ()
+                    if possible_type.name not in hidden_types
+                )
+
+            if isinstance(type, (GraphQLObjectType, GraphQLInterfaceType, GraphQLUnionType)):
+                type_fields = fields.get(type, ())
+                self._field_defs[type] = FrozenDict(
+                    (field_name, field) for field_name, field in schema.get_field_defs(type).items()
+                    if field_name in type_fields or field_name.startswith('__')
+                )
+
+        self._possible_type_map = {
+            name: frozenset(possible_type.name for possible_type in possible_types)
+            for name, possible_types in self._implementations.items()
+        }
+
+        self._frozen = True
+
+    def get_schema(self):
+        return self._schema
+
+    def get_resolver_kind(self, field_def):
+        return self._schema.get_resolver_kind(field_def)
+
+    def get_field_defs(self, type):
+        return self._field_defs.get(type, {})
+
+    def get_fields(self, type):
+        return self._fields.get(type, {})
+
+    def get_interfaces(self, type):
+        return self._interfaces.get(type, [])
+
+    def get_possible_types(self, abstract_type):
+        return self._implementations.get(abstract_type.name, ())
+
+    def is_possible_type(self, abstract_type, possible_type):
+        return possible_type.name in self._possible_type_map.get(abstract_type.name, ())
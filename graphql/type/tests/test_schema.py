@@ -1,7 +1,10 @@
 from pytest import raises
 
-from ...type import (GraphQLField, GraphQLInterfaceType, GraphQLObjectType,
-                     GraphQLSchema, GraphQLString)
+from ...graphql import graphql
+from ...type import (GraphQLField, GraphQLInputObjectField,
+                     GraphQLInputObjectType, GraphQLInterfaceType,
+                     GraphQLObjectType, GraphQLSchema, GraphQLSkipDirective,
+                     GraphQLString, GraphQLUnionType)
 
 interface_type = GraphQLInterfaceType(
     name='Interface',
@@ -37,3 +40,158 @@ def test_throws_human_readable_error_if_schematypes_not_defined():
 
     assert str(exci.value) == ('Could not find possible implementing types for $Interface in schema. Check that '
                                'schema.types is defined and is an array ofall possible types in the schema.')
+
+
+
+def make_resolvable_schema():
+    named_type = GraphQLInterfaceType('Named', {'name': GraphQLField(GraphQLString)},
+                                      resolve_type=lambda *_: pet_type)
+    pet_type = GraphQLObjectType('Pet', {'name': GraphQLField(GraphQLString, resolver=lambda *_: 'Rex')},
+                                 interfaces=[named_type])
+    union_type = GraphQLUnionType('Union', [pet_type], resolve_type=lambda *_: pet_type)
+    return GraphQLSchema(
+        query=GraphQLObjectType('Query', {
+            'named': GraphQLField(named_type, resolver=lambda *_: {}),
+            'union': GraphQLField(union_type, resolver=lambda *_: {}),
+        }),
+        types=[pet_type]
+    )
+
+
+def test_freeze_precomputes_lookups():
+    frozen_schema = make_resolvable_schema()
+    named_type = frozen_schema.get_type('Named')
+    pet_type = frozen_schema.get_type('Pet')
+    union_type = frozen_schema.get_type('Union')
+
+    assert not frozen_schema.is_frozen()
+    assert frozen_schema.get_field_defs(pet_type) is None
+    assert frozen_schema.freeze() is frozen_schema
+    assert frozen_schema.is_frozen()
+
+    assert frozen_schema.is_possible_type(named_type, pet_type)
+    assert frozen_schema.is_possible_type(union_type, pet_type)
+    assert frozen_schema.get_directive('skip') is GraphQLSkipDirective
+    assert frozen_schema.get_directive('unknown') is None
+
+    query_field_defs = frozen_schema.get_field_defs(frozen_schema.get_query_type())
+    assert sorted(query_field_defs) == ['__schema', '__type', '__typename', 'named', 'union']
+    assert sorted(frozen_schema.get_field_defs(named_type)) == ['__typename', 'name']
+    assert sorted(frozen_schema.get_field_defs(union_type)) == ['__typename']
+
+
+def test_frozen_lookups_are_read_only():
+    frozen_schema = make_resolvable_schema().freeze()
+    pet_type = frozen_schema.get_type('Pet')
+
+    with raises(TypeError):
+        frozen_schema.get_field_defs(pet_type)['extra'] = GraphQLField(GraphQLString)
+    with raises(TypeError):
+        frozen_schema._directive_map['extra'] = GraphQLSkipDirective
+    with raises(TypeError):
+        frozen_schema._type_map._possible_type_map['Named'] = frozenset()
+    assert isinstance(frozen_schema.get_directives(), tuple)
+    assert isinstance(frozen_schema.get_possible_types(frozen_schema.get_type('Named')), tuple)
+
+
+def test_frozen_schema_executes_queries():
+    frozen_schema = make_resolvable_schema().freeze()
+    result = graphql(frozen_schema, '''
+      {
+        named { __typename name }
+        union { ... on Pet { name } }
+        __type(name: "Pet") { name }
+      }
+    ''')
+
+    assert not result.errors
+    assert result.data == {
+        'named': {'__typename': 'Pet', 'name': 'Rex'},
+        'union': {'name': 'Rex'},
+        '__type': {'name': 'Pet'},
+    }
+    assert graphql(frozen_schema, '{ named { unknown } }').invalid
+
+
+def test_assume_valid_collects_the_same_types():
+    query_type = make_resolvable_schema().get_query_type()
+    checked_schema = GraphQLSchema(query=query_type)
+    assumed_valid_schema = GraphQLSchema(query=query_type, assume_valid=True)
+
+    assert list(assumed_valid_schema.get_type_map()) == list(checked_schema.get_type_map())
+
+
+def test_checks_long_chains_of_types():
+    # More types than the recursion limit, each referring to the next one.
+    chain = []
+    for i in range(2000):
+        chain.append(GraphQLObjectType('T{}'.format(i), (lambda i: lambda: {
+            'next': GraphQLField(chain[i + 1] if i + 1 < len(chain) else GraphQLString),
+        })(i)))
+
+    schema = GraphQLSchema(query=GraphQLObjectType('Query', {'first': GraphQLField(chain[0])}))
+    assert len([name for name in schema.get_type_map() if name.startswith('T')]) == 2000
+
+
+def make_lazy_schema(resolved_fields):
+    def fields(name, field_map):
+        def get_fields():
+            resolved_fields.append(name)
+            return field_map()
+        return get_fields
+
+    named_type = GraphQLInterfaceType('Named', fields('Named', lambda: {'name': GraphQLField(GraphQLString)}),
+                                      resolve_type=lambda *_: pet_type)
+    pet_type = GraphQLObjectType('Pet', fields('Pet', lambda: {
+        'name': GraphQLField(GraphQLString, resolver=lambda *_: 'Rex'),
+        'owner': GraphQLField(owner_type),
+    }), interfaces=[named_type])
+    owner_type = GraphQLObjectType('Owner', fields('Owner', lambda: {
+        'name': GraphQLField(GraphQLString),
+        'invalid': GraphQLField(GraphQLInputObjectType('Input', {'a': GraphQLInputObjectField(GraphQLString)})),
+    }))
+    return GraphQLSchema(
+        query=GraphQLObjectType('Query', fields('Query', lambda: {
+            'named': GraphQLField(named_type, resolver=lambda *_: {}),
+        })),
+        types=[pet_type],
+        lazy=True
+    )
+
+
+def test_lazy_schema_checks_types_when_they_are_used():
+    resolved_fields = []
+    lazy_schema = make_lazy_schema(resolved_fields)
+    assert resolved_fields == []
+
+    result = graphql(lazy_schema, '{ named { name ... on Pet { name } } }')
+    assert not result.errors
+    assert result.data == {'named': {'name': 'Rex'}}
+    assert sorted(resolved_fields) == ['Named', 'Pet', 'Query']
+    assert lazy_schema.get_type('Pet').name == 'Pet'
+
+
+def test_lazy_schema_checks_every_type_for_the_type_map():
+    lazy_schema = make_lazy_schema([])
+
+    with raises(AssertionError) as excinfo:
+        lazy_schema.get_type_map()
+
+    assert str(excinfo.value) == 'Owner.invalid field type must be Output Type but got: Input.'
+
+
+def test_lazy_schema_checks_every_type_to_find_unknown_names():
+    lazy_schema = make_lazy_schema([])
+
+    with raises(AssertionError) as excinfo:
+        lazy_schema.get_type('Unknown')
+
+    assert str(excinfo.value) == 'Owner.invalid field type must be Output Type but got: Input.'
+
+
+def test_lazy_schema_introspection():
+    query = '{ __schema { types { name fields { name } } } }'
+    eager_schema = make_resolvable_schema()
+    lazy_schema = GraphQLSchema(query=eager_schema.get_query_type(), types=[eager_schema.get_type('Pet')], lazy=True)
+
+    assert graphql(lazy_schema, query).data == graphql(eager_schema, query).data
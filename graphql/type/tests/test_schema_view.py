@@ -0,0 +1,239 @@
+from collections import OrderedDict, namedtuple
+
+from pytest import raises
+
+from ...graphql import graphql
+from ...type import (GraphQLArgument, GraphQLEnumType, GraphQLEnumValue,
+                     GraphQLField, GraphQLInputObjectField,
+                     GraphQLInputObjectType, GraphQLInterfaceType,
+                     GraphQLList, GraphQLObjectType, GraphQLSchema,
+                     GraphQLString, GraphQLUnionType, SchemaView)
+from ...utils.schema_fingerprint import get_schema_fingerprint
+
+User = namedtuple('User', 'id name email')
+AuditLog = namedtuple('AuditLog', 'id action')
+
+alice = User('1', 'Alice', 'alice@example.com')
+log = AuditLog('2', 'LOGIN')
+
+
+def resolve_node_type(value, info):
+    return UserType if isinstance(value, User) else AuditLogType
+
+
+NodeType = GraphQLInterfaceType(
+    name='Node',
+    fields={
+        'id': GraphQLField(GraphQLString),
+    },
+    resolve_type=resolve_node_type,
+)
+
+UserType = GraphQLObjectType(
+    name='User',
+    interfaces=[NodeType],
+    fields=OrderedDict([
+        ('id', GraphQLField(GraphQLString)),
+        ('name', GraphQLField(GraphQLString)),
+        ('email', GraphQLField(GraphQLString)),
+    ])
+)
+
+AuditActionType = GraphQLEnumType(
+    name='AuditAction',
+    values={
+        'LOGIN': GraphQLEnumValue('LOGIN'),
+    }
+)
+
+AuditLogType = GraphQLObjectType(
+    name='AuditLog',
+    interfaces=[NodeType],
+    fields={
+        'id': GraphQLField(GraphQLString),
+        'action': GraphQLField(AuditActionType),
+    }
+)
+
+AuditFilterType = GraphQLInputObjectType(
+    name='AuditFilter',
+    fields={
+        'action': GraphQLInputObjectField(AuditActionType),
+    }
+)
+
+SearchResultType = GraphQLUnionType(
+    name='SearchResult',
+    types=[UserType, AuditLogType],
+    resolve_type=resolve_node_type,
+)
+
+QueryType = GraphQLObjectType(
+    name='Query',
+    fields={
+        'user': GraphQLField(UserType, resolver=lambda *_: alice),
+        'node': GraphQLField(NodeType, resolver=lambda *_: log),
+        'search': GraphQLField(GraphQLList(SearchResultType), resolver=lambda *_: [alice, log]),
+        'auditLogs': GraphQLField(
+            GraphQLList(AuditLogType),
+            args={
+                'filter': GraphQLArgument(AuditFilterType),
+            },
+            resolver=lambda *_, **__: [log],
+        ),
+    }
+)
+
+schema = GraphQLSchema(query=QueryType, types=[UserType, AuditLogType]).freeze()
+
+
+def test_hides_types_and_fields_from_validation():
+    view = SchemaView(schema, hidden=['AuditLog', 'AuditAction', 'User.email'])
+
+    result = graphql(view, '{ user { name email } }')
+    assert result.data is None
+    assert [error.message for error in result.errors] == [
+        'Cannot query field "email" on type "User".',
+    ]
+
+    result = graphql(view, '{ search { ... on AuditLog { action } } }')
+    assert [error.message for error in result.errors] == [
+        'Unknown type "AuditLog".',
+    ]
+
+    # The schema itself is unchanged.
+    result = graphql(schema, '{ user { name email } }')
+    assert not result.errors
+    assert result.data == {'user': {'name': 'Alice', 'email': 'alice@example.com'}}
+
+
+def test_executes_the_visible_fields():
+    view = SchemaView(schema, hidden=['User.email'])
+
+    result = graphql(view, '{ user { id name } search { ... on User { name } ... on AuditLog { action } } }')
+    assert not result.errors
+    assert result.data == {
+        'user': {'id': '1', 'name': 'Alice'},
+        'search': [{'name': 'Alice'}, {'action': 'LOGIN'}],
+    }
+
+
+def test_does_not_resolve_abstract_types_to_hidden_types():
+    view = SchemaView(schema, hidden=['AuditLog'])
+
+    result = graphql(view, '{ node { id } }')
+    assert result.data == {'node': None}
+    assert [error.message for error in result.errors] == [
+        'Runtime Object type "AuditLog" is not a possible type for "Node".',
+    ]
+
+
+def test_hides_types_and_fields_from_introspection():
+    view = SchemaView(schema, hidden=['AuditLog', 'AuditAction', 'User.email'])
+
+    result = graphql(view, '''
+      {
+        schema: __schema { types { name } }
+        user: __type(name: "User") { fields { name } interfaces { name } }
+        auditLog: __type(name: "AuditLog") { name }
+        node: __type(name: "Node") { possibleTypes { name } }
+        searchResult: __type(name: "SearchResult") { possibleTypes { name } }
+      }
+    ''')
+    assert not result.errors
+    type_names = [type['name'] for type in result.data['schema']['types']]
+    assert 'User' in type_names
+    for name in ['AuditLog', 'AuditAction', 'AuditFilter']:
+        assert name not in type_names
+
+    assert result.data['user'] == {
+        'fields': [{'name': 'id'}, {'name': 'name'}],
+        'interfaces': [{'name': 'Node'}],
+    }
+    assert result.data['auditLog'] is None
+    assert result.data['node'] == {'possibleTypes': [{'name': 'User'}]}
+    assert result.data['searchResult'] == {'possibleTypes': [{'name': 'User'}]}
+
+
+def test_hiding_a_type_hides_what_uses_it():
+    view = SchemaView(schema, hidden=['AuditAction'])
+
+    # The input object and the argument using the enum are hidden, and the
+    # audit log is left with its id.
+    assert view.get_type('AuditFilter') is None
+    assert 'auditLogs' not in view.get_fields(QueryType)
+    assert list(view.get_fields(AuditLogType)) == ['id']
+
+    view = SchemaView(schema, hidden=['AuditLog.id', 'AuditLog.action'])
+    assert view.get_type('AuditLog') is None
+    assert view.get_interfaces(UserType) == [NodeType]
+    assert view.get_possible_types(SearchResultType) == (UserType,)
+    assert not view.is_possible_type(NodeType, AuditLogType)
+
+
+def test_accepts_a_visibility_predicate():
+    def is_visible(type_name, field_name=None):
+        return field_name != 'email'
+
+    view = SchemaView(schema, is_visible=is_visible)
+    assert list(view.get_fields(UserType)) == ['id', 'name']
+    assert view.get_type('AuditLog') is AuditLogType
+    assert view.get_schema() is schema
+
+
+def test_shares_the_types_of_the_schema():
+    view = SchemaView(schema, hidden=['User.email'])
+
+    assert view.get_query_type() is QueryType
+    assert view.get_type('User') is UserType
+    assert 'email' in UserType.fields
+    assert view.get_resolver_kind(QueryType.fields['user']) == schema.get_resolver_kind(QueryType.fields['user'])
+
+
+def test_has_its_own_fingerprint():
+    view = SchemaView(schema, hidden=['User.email'])
+    assert get_schema_fingerprint(view) != get_schema_fingerprint(schema)
+    assert get_schema_fingerprint(view) == get_schema_fingerprint(SchemaView(schema, hidden=['User.email']))
+
+
+def test_requires_the_query_type_to_be_visible():
+    with raises(AssertionError) as exc_info:
+        SchemaView(schema, hidden=['Query'])
+
+    assert str(exc_info.value) == 'The query type "Query" must be visible.'
+
+
+def test_requires_either_a_predicate_or_hidden_names():
+    with raises(AssertionError) as exc_info:
+        SchemaView(schema)
+
+    assert str(exc_info.value) == 'Must provide either is_visible or hidden, but not both.'
+
+
+def test_hides_interface_fields_on_their_implementations():
+    view = SchemaView(schema, hidden=['Node.id'])
+
+    # The interface is left without fields, so it's hidden too.
+    assert view.get_type('Node') is None
+    assert list(view.get_fields(UserType)) == ['name', 'email']
+    assert list(view.get_fields(AuditLogType)) == ['action']
+    assert view.get_interfaces(UserType) == []
+
+
+def test_hides_interface_fields_hidden_on_an_implementation():
+    view = SchemaView(schema, hidden=['AuditLog.id'])
+
+    assert view.get_type('Node') is None
+    assert 'id' in view.get_fields(UserType)
+    assert 'node' not in view.get_fields(QueryType)
+
+    result = graphql(view, '{ user { id } search { ... on AuditLog { action } } }')
+    assert not result.errors
+    assert result.data == {'user': {'id': '1'}, 'search': [{}, {'action': 'LOGIN'}]}
+
+
+def test_requires_a_frozen_schema():
+    with raises(AssertionError) as exc_info:
+        SchemaView(GraphQLSchema(query=QueryType), hidden=['User.email'])
+
+    assert str(exc_info.value) == 'The schema must be frozen before creating a view of it.'
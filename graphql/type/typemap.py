@@ -1,6 +1,6 @@
-from collections import OrderedDict, Sequence, defaultdict
-from functools import reduce
+from collections import OrderedDict, Sequence
 
+from ..pyutils.frozen_dict import FrozenDict
 from ..utils.type_comparators import is_equal_type, is_type_sub_type_of
 from .definition import (GraphQLArgument, GraphQLField,
                          GraphQLInputObjectField, GraphQLInputObjectType,
@@ -11,10 +11,11 @@ from .definition import (GraphQLArgument, GraphQLField,
 
 class GraphQLTypeMap(OrderedDict):
 
-    def __init__(self, types):
+    def __init__(self, types, assume_valid=False):
         super(GraphQLTypeMap, self).__init__()
-        self.update(reduce(self.reducer, types, OrderedDict()))
-        self._possible_type_map = defaultdict(set)
+        self.update(self.collect_types(types, check=not assume_valid))
+        # The names of the possible types of each abstract type, by name.
+        self._possible_type_map = {}
 
         # Keep track of all implementations by interface name.
         self._implementations = {}
@@ -23,6 +24,9 @@ class GraphQLTypeMap(OrderedDict):
                 for interface in gql_type.interfaces:
                     self._implementations.setdefault(interface.name, []).append(gql_type)
 
+        if assume_valid:
+            return
+
         # Enforce correct interface implementations.
         for type in self.values():
             if isinstance(type, GraphQLObjectType):
@@ -36,17 +40,30 @@ class GraphQLTypeMap(OrderedDict):
         return self._implementations.get(abstract_type.name, None)
 
     def is_possible_type(self, abstract_type, possible_type):
-        possible_types = self.get_possible_types(abstract_type)
-        assert isinstance(possible_types, Sequence), (
-            'Could not find possible implementing types for ${} in ' +
-            'schema. Check that schema.types is defined and is an array of' +
-            'all possible types in the schema.'
-            ).format(abstract_type)
+        possible_type_names = self._possible_type_map.get(abstract_type.name)
+        if possible_type_names is None:
+            possible_types = self.get_possible_types(abstract_type)
+            assert isinstance(possible_types, Sequence), (
+                'Could not find possible implementing types for ${} in ' +
+                'schema. Check that schema.types is defined and is an array of' +
+                'all possible types in the schema.'
+                ).format(abstract_type)
+
+            possible_type_names = self._possible_type_map[abstract_type.name] = frozenset(
+                p.name for p in possible_types)
 
-        if not self._possible_type_map[abstract_type.name]:
-            self._possible_type_map[abstract_type.name].update([p.name for p in possible_types])
+        return possible_type.name in possible_type_names
 
-        return possible_type.name in self._possible_type_map[abstract_type.name]
+    def freeze(self):
+        """Computes the possible types of every abstract type up front, as
+        read-only structures."""
+        self._implementations = FrozenDict((name, tuple(types)) for name, types in self._implementations.items())
+        self._possible_type_map = FrozenDict(
+            (type.name, frozenset(p.name for p in self.get_possible_types(type)))
+            for type in self.values()
+            if isinstance(type, GraphQLUnionType) or (
+                isinstance(type, GraphQLInterfaceType) and type.name in self._implementations)
+        )
 
     @classmethod
     def reducer(cls, map, type):
@@ -66,46 +83,85 @@ class GraphQLTypeMap(OrderedDict):
         map[type.name] = type
 
         reduced_map = map
+        for referenced_type in cls.get_referenced_types(type, check=True):
+            reduced_map = cls.reducer(reduced_map, referenced_type)
 
+        return reduced_map
+
+    @staticmethod
+    def get_referenced_types(type, check=False):
+        """Returns the types a named type refers to, checking its fields and
+        their arguments along the way if `check` is set."""
+        referenced_types = []
         if isinstance(type, (GraphQLUnionType)):
-            for t in type.types:
-                reduced_map = cls.reducer(reduced_map, t)
+            referenced_types.extend(type.types)
 
         if isinstance(type, GraphQLObjectType):
-            for t in type.interfaces:
-                reduced_map = cls.reducer(reduced_map, t)
+            referenced_types.extend(type.interfaces)
 
         if isinstance(type, (GraphQLObjectType, GraphQLInterfaceType, GraphQLInputObjectType)):
             field_map = type.fields
             type_is_input = isinstance(type, GraphQLInputObjectType)
             for field_name, field in field_map.items():
                 if type_is_input:
-                    assert isinstance(field, GraphQLInputObjectField), (
-                        '{}.{} must be an instance of GraphQLInputObjectField.'.format(type, field_name)
-                    )
-                    assert is_input_type(field.type), (
-                        '{}.{} field type must be Input Type but got: {}.'.format(type, field_name, field.type)
-                    )
+                    if check:
+                        assert isinstance(field, GraphQLInputObjectField), (
+                            '{}.{} must be an instance of GraphQLInputObjectField.'.format(type, field_name)
+                        )
+                        assert is_input_type(field.type), (
+                            '{}.{} field type must be Input Type but got: {}.'.format(type, field_name, field.type)
+                        )
                 else:
-                    assert isinstance(field, (GraphQLField, GraphQLField)), (
-                        '{}.{} must be an instance of GraphQLField.'.format(type, field_name)
-                    )
-                    assert is_output_type(field.type), (
-                        '{}.{} field type must be Output Type but got: {}.'.format(type, field_name, field.type)
-                    )
-                    for arg_name, arg in field.args.items():
-                        assert isinstance(arg, (GraphQLArgument, GraphQLArgument)), (
-                            '{}.{}({}:) argument must be an instance of GraphQLArgument.'.format(type, field_name, arg_name)
+                    if check:
+                        assert isinstance(field, (GraphQLField, GraphQLField)), (
+                            '{}.{} must be an instance of GraphQLField.'.format(type, field_name)
                         )
-                        assert is_input_type(arg.type), (
-                            '{}.{}({}:) argument type must be Input Type but got: {}.'.format(type, field_name, arg_name,
-                                                                                              arg.type)
+                        assert is_output_type(field.type), (
+                            '{}.{} field type must be Output Type but got: {}.'.format(type, field_name, field.type)
                         )
-                        reduced_map = cls.reducer(reduced_map, arg.type)
+                    for arg_name, arg in field.args.items():
+                        if check:
+                            assert isinstance(arg, (GraphQLArgument, GraphQLArgument)), (
+                                '{}.{}({}:) argument must be an instance of GraphQLArgument.'.format(
+                                    type, field_name, arg_name)
+                            )
+                            assert is_input_type(arg.type), (
+                                '{}.{}({}:) argument type must be Input Type but got: {}.'.format(
+                                    type, field_name, arg_name, arg.type)
+                            )
+                        referenced_types.append(arg.type)
 
-                reduced_map = cls.reducer(reduced_map, getattr(field, 'type', None))
+                referenced_types.append(getattr(field, 'type', None))
 
-        return reduced_map
+        return referenced_types
+
+    @classmethod
+    def collect_types(cls, types, check=False):
+        """Collects the named types reachable from the given types, in the same
+        order as `reducer`, checking them as well if `check` is set. Unlike
+        `reducer`, it doesn't recurse, so long chains of references between
+        types can't exceed the recursion limit."""
+        map = OrderedDict()
+        stack = list(reversed(types))
+        while stack:
+            type = stack.pop()
+            while isinstance(type, (GraphQLList, GraphQLNonNull)):
+                type = type.of_type
+
+            if not type:
+                continue
+
+            if type.name in map:
+                if check:
+                    assert map[type.name] == type, (
+                        'Schema must contain unique named types but contains multiple types named "{}".'
+                    ).format(type.name)
+                continue
+
+            map[type.name] = type
+            stack.extend(reversed(cls.get_referenced_types(type, check=check)))
+
+        return map
 
     @classmethod
     def assert_object_implements_interface(cls, schema, object, interface):
@@ -142,3 +198,95 @@ class GraphQLTypeMap(OrderedDict):
                         '"{}" but is not also provided by the '
                         'interface {}.{}.'
                     ).format(object, field_name, arg_name, object_arg.type, interface, field_name)
+
+
+class GraphQLLazyTypeMap(GraphQLTypeMap):
+    """A type map that checks each type the first time it's used, rather than
+    walking every type, field and argument up front.
+
+    Only the given types are known at first, so every type that may be
+    looked up by name or that implements an interface should be given.
+    Looking up an unknown name, or calling `materialize`, walks and checks
+    all the reachable types, as GraphQLTypeMap does."""
+
+    def __init__(self, types):
+        OrderedDict.__init__(self)
+        self._possible_type_map = {}
+        self._implementations = {}
+        self._checked_types = set()
+        self._materialized = False
+        self._types = types
+
+        for type in types:
+            self.add_type(type)
+
+    def add_type(self, type):
+        """Adds a type to the map, if it isn't known yet, and returns the named
+        type."""
+        while isinstance(type, (GraphQLList, GraphQLNonNull)):
+            type = type.of_type
+
+        if not type:
+            return type
+
+        existing_type = OrderedDict.get(self, type.name)
+        if existing_type is not None:
+            assert existing_type == type, (
+                'Schema must contain unique named types but contains multiple types named "{}".'
+            ).format(type.name)
+            return type
+
+        self[type.name] = type
+        if isinstance(type, GraphQLObjectType):
+            for interface in type.interfaces:
+                self._implementations.setdefault(interface.name, []).append(type)
+                # The implementations of the interface changed.
+                self._possible_type_map.pop(interface.name, None)
+
+        return type
+
+    def check_type(self, type):
+        """Checks the fields of a type and the interfaces it implements, and
+        adds the types they refer to, the first time it's called."""
+        if type.name in self._checked_types:
+            return
+
+        self._checked_types.add(type.name)
+        for referenced_type in self.get_referenced_types(type, check=True):
+            referenced_type = self.add_type(referenced_type)
+            # Input objects are checked along with the fields using them.
+            if isinstance(referenced_type, GraphQLInputObjectType):
+                self.check_type(referenced_type)
+
+        if isinstance(type, GraphQLObjectType):
+            for interface in type.interfaces:
+                self.assert_object_implements_interface(self, type, interface)
+
+    def materialize(self):
+        """Checks all the reachable types."""
+        if self._materialized:
+            return
+
+        checked = 0
+        while checked < len(self):
+            # Checking a type may add others at the end of the map.
+            for type in list(self.values())[checked:]:
+                self.check_type(type)
+                checked += 1
+
+        # Order the types as GraphQLTypeMap does.
+        types = self.collect_types(self._types)
+        self.clear()
+        self.update(types)
+        self._materialized = True
+
+    def get_possible_types(self, abstract_type):
+        if not self._materialized and isinstance(abstract_type, GraphQLInterfaceType) and \
+                abstract_type.name not in self._implementations:
+            self.materialize()
+        return super(GraphQLLazyTypeMap, self).get_possible_types(abstract_type)
+
+    def get(self, name, default=None):
+        if not self._materialized and name not in self:
+            self.materialize()
+        return OrderedDict.get(self, name, default)
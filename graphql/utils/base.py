@@ -15,6 +15,17 @@ from .build_client_schema import build_client_schema
 # Build a GraphQLSchema from a parsed GraphQL Schema language AST.
 from .build_ast_schema import build_ast_schema
 
+# Snapshot a GraphQLSchema, and restore it without building it again.
+from .schema_snapshot import (
+    get_schema_snapshot,
+    build_schema_from_snapshot,
+    dump_schema_snapshot,
+    load_schema_snapshot
+)
+
+# Fingerprint the structure of a GraphQLSchema, for cache keys.
+from .schema_fingerprint import get_schema_fingerprint, get_type_fingerprints
+
 # Extends an existing GraphQLSchema from a parsed GraphQL Schema language AST.
 from .extend_schema import extend_schema
 
@@ -62,6 +73,12 @@ __all__ = [
     'get_operation_ast',
     'build_client_schema',
     'build_ast_schema',
+    'get_schema_snapshot',
+    'build_schema_from_snapshot',
+    'dump_schema_snapshot',
+    'load_schema_snapshot',
+    'get_schema_fingerprint',
+    'get_type_fingerprints',
     'extend_schema',
     'print_introspection_schema',
     'print_schema',
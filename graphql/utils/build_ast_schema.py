@@ -49,7 +49,7 @@ def _none(*_):
     return None
 
 
-def build_ast_schema(document):
+def build_ast_schema(document, lazy=False):
     assert isinstance(document, ast.Document), 'must pass in Document ast.'
 
     schema_def = None
@@ -276,7 +276,7 @@ def build_ast_schema(document):
     if types:
         schema_kwargs['types'] = types
 
-    return GraphQLSchema(**schema_kwargs)
+    return GraphQLSchema(lazy=lazy, **schema_kwargs)
 
 
 def get_deprecation_reason(directives):
@@ -1,3 +1,7 @@
+import json
+
+from six import binary_type, string_types
+
 from ..language.parser import parse_value
 from ..pyutils.ordereddict import OrderedDict
 from ..type import (GraphQLArgument, GraphQLBoolean, GraphQLEnumType,
@@ -26,10 +30,35 @@ def no_execution(root, info, **args):
     raise Exception('Client Schema cannot be used for execution.')
 
 
-def build_client_schema(introspection):
-    schema_introspection = introspection['__schema']
+def load_introspection(introspection):
+    """Returns the parsed result of an introspection query, given either
+    parsed, as JSON, or as a file to read the JSON from."""
+    if hasattr(introspection, 'read'):
+        introspection = json.load(introspection)
+    elif isinstance(introspection, (string_types, binary_type)):
+        if isinstance(introspection, binary_type):
+            introspection = introspection.decode('utf-8')
+        introspection = json.loads(introspection)
+
+    # The whole response of a server, rather than its data.
+    if '__schema' not in introspection and 'data' in introspection:
+        introspection = introspection['data']
+    return introspection
+
+
+def build_client_schema(introspection, assume_valid=False):
+    """Builds a schema from the result of an introspection query, which may
+    be given parsed, as JSON, or as a file to read the JSON from.
+
+    The types are created in one pass over the result, and the wrapping
+    types and default values they share are only built once. When the
+    result comes from a trusted server, `assume_valid=True` skips the
+    checks of the types, which makes building a large schema much faster.
 
-    type_introspection_map = {t['name']: t for t in schema_introspection['types']}
+    The schema can be validated against, but not executed."""
+    schema_introspection = load_introspection(introspection)['__schema']
+
+    type_introspection_map = OrderedDict((t['name'], t) for t in schema_introspection['types'])
 
     type_def_cache = {
         'String': GraphQLString,
@@ -48,57 +77,68 @@ def build_client_schema(introspection):
 
     }
 
-    def get_type(type_ref):
-        kind = type_ref.get('kind')
-
-        if kind == TypeKind.LIST:
-            item_ref = type_ref.get('ofType')
-
-            if not item_ref:
-                raise Exception('Decorated type deeper than introspection query.')
+    # The list and non null types, by kind and wrapped type.
+    wrapped_types = {}
 
-            return GraphQLList(get_type(item_ref))
+    # The parsed default values, by their literal.
+    default_value_asts = {}
 
-        elif kind == TypeKind.NON_NULL:
-            nullable_ref = type_ref.get('ofType')
-            if not nullable_ref:
-                raise Exception('Decorated type deeper than introspection query.')
-
-            return GraphQLNonNull(get_type(nullable_ref))
-
-        return get_named_type(type_ref['name'])
+    def get_type(type_ref):
+        kind = type_ref.get('kind')
+        if kind != TypeKind.LIST and kind != TypeKind.NON_NULL:
+            return get_named_type(type_ref['name'])
+
+        of_type_ref = type_ref.get('ofType')
+        if not of_type_ref:
+            raise Exception('Decorated type deeper than introspection query.')
+
+        of_type = get_type(of_type_ref)
+        type = wrapped_types.get((kind, of_type))
+        if type is None:
+            type = wrapped_types[kind, of_type] = (
+                GraphQLList(of_type) if kind == TypeKind.LIST else GraphQLNonNull(of_type)
+            )
+        return type
 
     def get_named_type(type_name):
-        if type_name in type_def_cache:
-            return type_def_cache[type_name]
-
-        type_introspection = type_introspection_map.get(type_name)
-        if not type_introspection:
+        type_def = type_def_cache.get(type_name)
+        if type_def is None:
             raise Exception(
                 'Invalid or incomplete schema, unknown type: {}. Ensure that a full introspection query '
                 'is used in order to build a client schema.'.format(type_name)
             )
 
-        type_def = type_def_cache[type_name] = build_type(type_introspection)
         return type_def
 
     def get_input_type(type_ref):
         input_type = get_type(type_ref)
+        if assume_valid:
+            return input_type
+
         assert is_input_type(input_type), 'Introspection must provide input type for arguments.'
         return input_type
 
     def get_output_type(type_ref):
         output_type = get_type(type_ref)
+        if assume_valid:
+            return output_type
+
         assert is_output_type(output_type), 'Introspection must provide output type for fields.'
         return output_type
 
     def get_object_type(type_ref):
         object_type = get_type(type_ref)
+        if assume_valid:
+            return object_type
+
         assert isinstance(object_type, GraphQLObjectType), 'Introspection must provide object type for possibleTypes.'
         return object_type
 
     def get_interface_type(type_ref):
         interface_type = get_type(type_ref)
+        if assume_valid:
+            return interface_type
+
         assert isinstance(interface_type, GraphQLInterfaceType), \
             'Introspection must provide interface type for interfaces.'
         return interface_type
@@ -127,7 +167,7 @@ def build_client_schema(introspection):
         return GraphQLObjectType(
             name=object_introspection['name'],
             description=object_introspection.get('description'),
-            interfaces=[get_interface_type(i) for i in object_introspection.get('interfaces', [])],
+            interfaces=lambda: [get_interface_type(i) for i in object_introspection.get('interfaces', [])],
             fields=lambda: build_field_def_map(object_introspection)
         )
 
@@ -143,7 +183,7 @@ def build_client_schema(introspection):
         return GraphQLUnionType(
             name=union_introspection['name'],
             description=union_introspection.get('description'),
-            types=[get_object_type(t) for t in union_introspection.get('possibleTypes', [])],
+            types=lambda: [get_object_type(t) for t in union_introspection.get('possibleTypes', [])],
             resolve_type=no_execution
         )
 
@@ -187,12 +227,16 @@ def build_client_schema(introspection):
             for f in type_introspection.get('fields', [])
         ])
 
-    def build_default_value(f):
+    def build_default_value(f, input_type):
         default_value = f.get('defaultValue')
         if default_value is None:
             return None
 
-        return value_from_ast(parse_value(default_value), get_input_type(f['type']))
+        default_value_ast = default_value_asts.get(default_value)
+        if default_value_ast is None:
+            default_value_ast = default_value_asts[default_value] = parse_value(default_value)
+
+        return value_from_ast(default_value_ast, input_type)
 
     def build_input_value_def_map(input_value_introspection, argument_type):
         return OrderedDict([
@@ -200,10 +244,11 @@ def build_client_schema(introspection):
         ])
 
     def build_input_value(input_value_introspection, argument_type):
+        input_type = get_input_type(input_value_introspection['type'])
         input_value = argument_type(
             description=input_value_introspection['description'],
-            type=get_input_type(input_value_introspection['type']),
-            default_value=build_default_value(input_value_introspection)
+            type=input_type,
+            default_value=build_default_value(input_value_introspection, input_type)
         )
         return input_value
 
@@ -228,9 +273,14 @@ def build_client_schema(introspection):
             locations=locations
         )
 
-    # Iterate through all types, getting the type definition for each, ensuring
-    # that any type not directly referenced by a field will get created.
-    types = [get_named_type(type_introspection_name) for type_introspection_name in type_introspection_map.keys()]
+    # Create every type in one pass. The types they refer to are bound
+    # lazily, so they are looked up by name once all of them exist.
+    types = []
+    for type_name, type_introspection in type_introspection_map.items():
+        type_def = type_def_cache.get(type_name)
+        if type_def is None:
+            type_def = type_def_cache[type_name] = build_type(type_introspection)
+        types.append(type_def)
 
     query_type = get_object_type(schema_introspection['queryType'])
     mutation_type = get_object_type(
@@ -246,5 +296,6 @@ def build_client_schema(introspection):
         mutation=mutation_type,
         subscription=subscription_type,
         directives=directives,
-        types=types
+        types=types,
+        assume_valid=assume_valid,
     )
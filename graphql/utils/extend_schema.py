@@ -1,4 +1,5 @@
 from collections import defaultdict
+from weakref import WeakKeyDictionary
 
 from ..error import GraphQLError
 from ..language import ast
@@ -8,27 +9,33 @@ from ..type.definition import (GraphQLArgument, GraphQLEnumType,
                                GraphQLInputObjectField, GraphQLInputObjectType,
                                GraphQLInterfaceType, GraphQLList,
                                GraphQLNonNull, GraphQLObjectType,
-                               GraphQLScalarType, GraphQLUnionType)
+                               GraphQLScalarType, GraphQLUnionType,
+                               get_named_type)
 from ..type.introspection import (__Directive, __DirectiveLocation,
                                   __EnumValue, __Field, __InputValue, __Schema,
                                   __Type, __TypeKind)
 from ..type.scalars import (GraphQLBoolean, GraphQLFloat, GraphQLID,
                             GraphQLInt, GraphQLString)
 from ..type.schema import GraphQLSchema
+from ..type.typemap import GraphQLTypeMap
 from .value_from_ast import value_from_ast
 
+# The names of the types referring to each type, by schema.
+_schema_referrers = WeakKeyDictionary()
+
 
 def extend_schema(schema, documentAST=None):
     """Produces a new schema given an existing schema and a document which may
     contain GraphQL type extensions and definitions. The original schema will
     remain unaltered.
 
-    Because a schema represents a graph of references, a schema cannot be
-    extended without effectively making an entire copy. We do not know until it's
-    too late if subgraphs remain unchanged.
+    Because a schema represents a graph of references, the extended types
+    and every type referring to them, directly or not, are copied while
+    applying the extensions. The other types are shared with the original
+    schema, so extending a large schema with a few fields is cheap.
 
-    This algorithm copies the provided schema, applying extensions while
-    producing the copy. The original schema remains unaltered."""
+    The existing fields keep their resolvers, while the fields added by the
+    extensions can't be executed."""
 
     assert isinstance(
         schema, GraphQLSchema), 'Must provide valid GraphQLSchema'
@@ -107,6 +114,11 @@ def extend_schema(schema, documentAST=None):
 
         existing_type = schema.get_type(typeName)
         if existing_type:
+            if typeName not in rebuilt_type_names:
+                # Nothing this type refers to changes, so it's shared.
+                type_def_cache[typeName] = existing_type
+                return existing_type
+
             type_def = extend_type(existing_type)
             type_def_cache[typeName] = type_def
             return type_def
@@ -134,6 +146,7 @@ def extend_schema(schema, documentAST=None):
             description=type.description,
             interfaces=lambda: extend_implemented_interfaces(type),
             fields=lambda: extend_field_map(type),
+            is_type_of=type.is_type_of,
         )
 
     def extend_interface_type(type):
@@ -141,7 +154,7 @@ def extend_schema(schema, documentAST=None):
             name=type.name,
             description=type.description,
             fields=lambda: extend_field_map(type),
-            resolve_type=cannot_execute_client_schema,
+            resolve_type=extend_resolve_type(type.resolve_type),
         )
 
     def extend_union_type(type):
@@ -149,9 +162,23 @@ def extend_schema(schema, documentAST=None):
             name=type.name,
             description=type.description,
             types=list(map(get_type_from_def, type.types)),
-            resolve_type=cannot_execute_client_schema,
+            resolve_type=extend_resolve_type(type.resolve_type),
         )
 
+    def extend_resolve_type(resolve_type):
+        if not resolve_type:
+            return resolve_type
+
+        # The original type resolver returns the types of the original schema,
+        # which may have been copied.
+        def resolve_extended_type(*args, **kwargs):
+            runtime_type = resolve_type(*args, **kwargs)
+            if isinstance(runtime_type, GraphQLObjectType):
+                return _get_named_type(runtime_type.name) or runtime_type
+            return runtime_type
+
+        return resolve_extended_type
+
     def extend_implemented_interfaces(type):
         interfaces = list(map(get_type_from_def, type.interfaces))
 
@@ -180,7 +207,7 @@ def extend_schema(schema, documentAST=None):
                 description=field.description,
                 deprecation_reason=field.deprecation_reason,
                 args=field.args,
-                resolver=cannot_execute_client_schema,
+                resolver=field.resolver,
             )
 
         # If there are any extensions to the fields, apply those here.
@@ -224,10 +251,14 @@ def extend_schema(schema, documentAST=None):
             return func(type_ast)
 
     def build_object_type(type_ast):
+        # The fields of new types can't be executed, so they don't need to be
+        # resolvable from the interfaces they implement, which may be shared
+        # and rely on the is_type_of of their implementations.
         return GraphQLObjectType(
             type_ast.name.value,
             interfaces=lambda: build_implemented_interfaces(type_ast),
             fields=lambda: build_field_map(type_ast),
+            is_type_of=is_not_type_of_client_schema,
         )
 
     def build_interface_type(type_ast):
@@ -303,6 +334,8 @@ def extend_schema(schema, documentAST=None):
     if not type_extensions_map and not type_definition_map:
         return schema
 
+    rebuilt_type_names = get_rebuilt_type_names(schema, type_extensions_map)
+
     # A cache to use to store the actual GraphQLType definition objects by name.
     # Initialize to the GraphQL built in scalars and introspection types. All
     # functions below are inline so that this type def cache is within the scope
@@ -342,16 +375,64 @@ def extend_schema(schema, documentAST=None):
     # Do the same with new types, appending to the list of defined types.
     types += [get_type_from_AST(_def) for _def in type_definition_map.values()]
 
-    # Then produce and return a Schema with these types.
-    return GraphQLSchema(
+    # Then produce and return a Schema with these types. The shared types were
+    # checked by the original schema, so only the others are checked here.
+    extended_schema = GraphQLSchema(
         query=query_type,
         mutation=mutationType,
         subscription=subscription_type,
         # Copy directives.
         directives=schema.get_directives(),
-        types=types
+        types=types,
+        assume_valid=True,
     )
 
+    type_map = extended_schema.get_type_map()
+    for type_name in list(rebuilt_type_names) + list(type_definition_map):
+        new_type = type_map.get(type_name)
+        if not new_type:
+            continue
+
+        GraphQLTypeMap.get_referenced_types(new_type, check=True)
+        if isinstance(new_type, GraphQLObjectType):
+            for interface in new_type.interfaces:
+                GraphQLTypeMap.assert_object_implements_interface(type_map, new_type, interface)
+
+    return extended_schema
+
+
+def get_rebuilt_type_names(schema, extended_type_names):
+    """Returns the names of the extended types and of the types referring to
+    them, directly or not. Abstract types with a type resolver refer to their
+    possible types, which their resolver returns."""
+    referrers = _schema_referrers.get(schema)
+    if referrers is None:
+        referrers = defaultdict(set)
+        for type in schema.get_type_map().values():
+            for referenced_type in GraphQLTypeMap.get_referenced_types(type):
+                referrers[get_named_type(referenced_type).name].add(type.name)
+            if isinstance(type, GraphQLObjectType):
+                for interface in type.interfaces:
+                    if interface.resolve_type:
+                        referrers[type.name].add(interface.name)
+
+        referrers = _schema_referrers[schema] = dict(referrers)
+
+    rebuilt_type_names = set()
+    stack = list(extended_type_names)
+    while stack:
+        type_name = stack.pop()
+        if type_name not in rebuilt_type_names:
+            rebuilt_type_names.add(type_name)
+            stack.extend(referrers.get(type_name, ()))
+
+    return rebuilt_type_names
+
 
 def cannot_execute_client_schema(*args, **kwargs):
     raise Exception('Client Schema cannot be used for execution.')
+
+
+def is_not_type_of_client_schema(*args, **kwargs):
+    # Values resolved by the original schema are never of the new types.
+    return False
@@ -9,6 +9,10 @@ def get_field_def(schema, parent_type, field_ast):
     statically evaluated environment we do not always have an Object type,
     and need to handle Interface and Union types."""
     name = field_ast.name.value
+    field_defs = schema.get_field_defs(parent_type)
+    if field_defs is not None:
+        return field_defs.get(name)
+
     if name == '__schema' and schema.get_query_type() == parent_type:
         return SchemaMetaFieldDef
 
@@ -0,0 +1,41 @@
+import inspect
+from functools import partial
+
+from promise import Promise
+
+iscoroutinefunction = getattr(inspect, 'iscoroutinefunction', lambda fn: False)
+isasyncgenfunction = getattr(inspect, 'isasyncgenfunction', lambda fn: False)
+
+
+class ResolverKind(object):
+    # A plain function: its result has to be inspected to know whether it's thenable.
+    FUNCTION = 'FUNCTION'
+    # `async def` resolvers, which always return a coroutine.
+    COROUTINE_FUNCTION = 'COROUTINE_FUNCTION'
+    # `async def` resolvers with `yield`, used for subscriptions.
+    ASYNC_GENERATOR_FUNCTION = 'ASYNC_GENERATOR_FUNCTION'
+    # Resolvers annotated as returning a Promise (`def resolve(...) -> Promise`).
+    PROMISE_FUNCTION = 'PROMISE_FUNCTION'
+
+
+def get_resolver_kind(resolver):
+    """Statically classifies a resolver, without calling it."""
+    while isinstance(resolver, partial):
+        resolver = resolver.func
+
+    if resolver is None:
+        return ResolverKind.FUNCTION
+
+    fn = getattr(resolver, '__func__', resolver)
+    if iscoroutinefunction(fn):
+        return ResolverKind.COROUTINE_FUNCTION
+
+    if isasyncgenfunction(fn):
+        return ResolverKind.ASYNC_GENERATOR_FUNCTION
+
+    annotations = getattr(fn, '__annotations__', None)
+    return_annotation = annotations.get('return') if annotations else None
+    if isinstance(return_annotation, type) and issubclass(return_annotation, Promise):
+        return ResolverKind.PROMISE_FUNCTION
+
+    return ResolverKind.FUNCTION
@@ -0,0 +1,59 @@
+import json
+from hashlib import sha256
+from weakref import WeakKeyDictionary
+
+from .schema_snapshot import get_schema_snapshot
+
+__all__ = ['get_schema_fingerprint', 'get_type_fingerprints']
+
+_schema_fingerprints = WeakKeyDictionary()
+
+
+def _hash(data):
+    encoded = json.dumps(data, sort_keys=True, separators=(',', ':'), default=_not_serializable)
+    return sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _not_serializable(value):
+    # The repr of most objects changes between processes, so values that
+    # can't be serialized have no stable fingerprint.
+    raise TypeError('The schema can\'t be fingerprinted, as {!r} is not serializable as JSON.'.format(value))
+
+
+def _get_fingerprints(schema):
+    fingerprints = _schema_fingerprints.get(schema)
+    if fingerprints is None:
+        snapshot = get_schema_snapshot(schema)
+        type_fingerprints = {type['name']: _hash(type) for type in snapshot['types']}
+        schema_fingerprint = _hash([
+            snapshot['query'],
+            snapshot['mutation'],
+            snapshot['subscription'],
+            sorted(type_fingerprints.items()),
+            snapshot['directives'],
+        ])
+        fingerprints = _schema_fingerprints[schema] = schema_fingerprint, type_fingerprints
+
+    return fingerprints
+
+
+def get_schema_fingerprint(schema):
+    """Returns a fingerprint of the structure of the schema: its root types,
+    the types with their fields, arguments, values and descriptions, and its
+    directives.
+
+    Schemas with the same structure have the same fingerprint, in any
+    process, so it can be part of the key of caches shared between
+    processes and deploys. Resolvers and other functions are not part of
+    it. The fingerprint is computed once per schema.
+
+    As for snapshots, the internal values of enums and the default values
+    must be serializable as JSON, or a TypeError is raised."""
+    return _get_fingerprints(schema)[0]
+
+
+def get_type_fingerprints(schema):
+    """Returns the fingerprint of each type defined by the schema, by type
+    name, to invalidate what depends on some types only. Specified scalars
+    and introspection types are not included."""
+    return dict(_get_fingerprints(schema)[1])
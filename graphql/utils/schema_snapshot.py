@@ -0,0 +1,316 @@
+import json
+
+from ..pyutils.ordereddict import OrderedDict
+from ..type import (GraphQLArgument, GraphQLBoolean, GraphQLEnumType,
+                    GraphQLEnumValue, GraphQLField, GraphQLFloat, GraphQLID,
+                    GraphQLInputObjectField, GraphQLInputObjectType,
+                    GraphQLInt, GraphQLInterfaceType, GraphQLList,
+                    GraphQLNonNull, GraphQLObjectType, GraphQLScalarType,
+                    GraphQLSchema, GraphQLString, GraphQLUnionType)
+from ..type.directives import GraphQLDirective, specified_directives
+from ..type.introspection import (TypeKind, __Directive, __DirectiveLocation,
+                                  __EnumValue, __Field, __InputValue, __Schema,
+                                  __Type, __TypeKind)
+
+__all__ = ['get_schema_snapshot', 'build_schema_from_snapshot', 'dump_schema_snapshot', 'load_schema_snapshot']
+
+SNAPSHOT_VERSION = 1
+
+_builtin_types = OrderedDict((type.name, type) for type in [
+    GraphQLString,
+    GraphQLInt,
+    GraphQLFloat,
+    GraphQLBoolean,
+    GraphQLID,
+    __Schema,
+    __Directive,
+    __DirectiveLocation,
+    __Type,
+    __Field,
+    __InputValue,
+    __EnumValue,
+    __TypeKind,
+])
+
+_specified_directives = {directive.name: directive for directive in specified_directives}
+
+
+def _false(*_):
+    return False
+
+
+def _none(*_):
+    return None
+
+
+def get_schema_snapshot(schema):
+    """Returns a snapshot of the schema: plain data, ready to be serialized
+    as JSON, from which `build_schema_from_snapshot` restores the schema.
+
+    Resolvers and other functions (type resolvers, scalar parsing and
+    serialization, input object containers) are not part of the snapshot,
+    they are bound again by name when the schema is restored. Enum values
+    and default values are kept as they are, so they must be serializable
+    as well."""
+    return {
+        'version': SNAPSHOT_VERSION,
+        'query': schema.get_query_type().name,
+        'mutation': _get_type_name(schema.get_mutation_type()),
+        'subscription': _get_type_name(schema.get_subscription_type()),
+        'types': [
+            _get_type_snapshot(schema, type) for name, type in schema.get_type_map().items()
+            if _builtin_types.get(name) is not type
+        ],
+        'directives': [
+            directive.name if _specified_directives.get(directive.name) is directive
+            else _get_directive_snapshot(directive)
+            for directive in schema.get_directives()
+        ],
+    }
+
+
+def _get_type_name(type):
+    return type.name if type else None
+
+
+def _get_type_snapshot(schema, type):
+    # The fields, interfaces and possible types are those the schema shows,
+    # which may be fewer than the type has in a schema view.
+    if isinstance(type, GraphQLObjectType):
+        snapshot = {
+            'kind': TypeKind.OBJECT,
+            'fields': [_get_field_snapshot(name, field) for name, field in schema.get_fields(type).items()],
+            'interfaces': [interface.name for interface in schema.get_interfaces(type)],
+        }
+    elif isinstance(type, GraphQLInterfaceType):
+        snapshot = {
+            'kind': TypeKind.INTERFACE,
+            'fields': [_get_field_snapshot(name, field) for name, field in schema.get_fields(type).items()],
+        }
+    elif isinstance(type, GraphQLUnionType):
+        snapshot = {
+            'kind': TypeKind.UNION,
+            'types': [possible_type.name for possible_type in schema.get_possible_types(type)],
+        }
+    elif isinstance(type, GraphQLEnumType):
+        snapshot = {
+            'kind': TypeKind.ENUM,
+            'values': [_get_enum_value_snapshot(value) for value in type.values],
+        }
+    elif isinstance(type, GraphQLInputObjectType):
+        snapshot = {
+            'kind': TypeKind.INPUT_OBJECT,
+            'fields': [_get_input_value_snapshot(name, field) for name, field in type.fields.items()],
+        }
+    else:
+        assert isinstance(type, GraphQLScalarType), 'Unknown type {}.'.format(type)
+        snapshot = {'kind': TypeKind.SCALAR}
+
+    snapshot['name'] = type.name
+    if type.description:
+        snapshot['description'] = type.description
+    return snapshot
+
+
+def _get_field_snapshot(name, field):
+    snapshot = {'name': name, 'type': str(field.type)}
+    if field.args:
+        snapshot['args'] = [_get_input_value_snapshot(arg_name, arg) for arg_name, arg in field.args.items()]
+    if field.deprecation_reason is not None:
+        snapshot['deprecation_reason'] = field.deprecation_reason
+    if field.description:
+        snapshot['description'] = field.description
+    return snapshot
+
+
+def _get_input_value_snapshot(name, input_value):
+    snapshot = {'name': name, 'type': str(input_value.type)}
+    if input_value.default_value is not None:
+        snapshot['default_value'] = input_value.default_value
+    if input_value.out_name:
+        snapshot['out_name'] = input_value.out_name
+    if input_value.description:
+        snapshot['description'] = input_value.description
+    return snapshot
+
+
+def _get_enum_value_snapshot(enum_value):
+    snapshot = {'name': enum_value.name}
+    if enum_value.value != enum_value.name:
+        snapshot['value'] = enum_value.value
+    if enum_value.deprecation_reason is not None:
+        snapshot['deprecation_reason'] = enum_value.deprecation_reason
+    if enum_value.description:
+        snapshot['description'] = enum_value.description
+    return snapshot
+
+
+def _get_directive_snapshot(directive):
+    snapshot = {
+        'name': directive.name,
+        'locations': list(directive.locations),
+        'args': [_get_input_value_snapshot(name, arg) for name, arg in directive.args.items()],
+    }
+    if directive.description:
+        snapshot['description'] = directive.description
+    return snapshot
+
+
+def build_schema_from_snapshot(snapshot, resolvers=None, type_resolvers=None, scalars=None):
+    """Restores a schema from a snapshot made by `get_schema_snapshot`.
+
+    The schema was validated when the snapshot was taken, so it's not
+    validated again: restoring a snapshot is much faster than building the
+    schema from its definition.
+
+    - `resolvers` maps type names to the resolvers of their fields, by
+      field name.
+    - `type_resolvers` maps the names of interface and union types to their
+      `resolve_type` function.
+    - `scalars` maps the names of custom scalars to the GraphQLScalarType
+      to use for them.
+
+    As with `build_ast_schema`, the other functions are defaults that don't
+    resolve anything."""
+    assert snapshot.get('version') == SNAPSHOT_VERSION, (
+        'Schema snapshot version {} is not supported.'.format(snapshot.get('version'))
+    )
+    resolvers = resolvers or {}
+    type_resolvers = type_resolvers or {}
+    scalars = scalars or {}
+
+    types = OrderedDict(_builtin_types)
+    wrapped_types = {}
+
+    def get_type(type_ref):
+        type = types.get(type_ref) or wrapped_types.get(type_ref)
+        if type is None:
+            if type_ref.endswith('!'):
+                type = GraphQLNonNull(get_type(type_ref[:-1]))
+            else:
+                assert type_ref.startswith('[') and type_ref.endswith(']'), 'Unknown type {}.'.format(type_ref)
+                type = GraphQLList(get_type(type_ref[1:-1]))
+            wrapped_types[type_ref] = type
+        return type
+
+    def make_fields(type_snapshot):
+        field_resolvers = resolvers.get(type_snapshot['name'], {})
+        return OrderedDict(
+            (field['name'], GraphQLField(
+                type=get_type(field['type']),
+                args=make_input_values(field.get('args', ()), GraphQLArgument),
+                resolver=field_resolvers.get(field['name']),
+                deprecation_reason=field.get('deprecation_reason'),
+                description=field.get('description'),
+            ))
+            for field in type_snapshot['fields']
+        )
+
+    def make_input_values(input_values, cls):
+        return OrderedDict(
+            (input_value['name'], cls(
+                type=get_type(input_value['type']),
+                default_value=input_value.get('default_value'),
+                description=input_value.get('description'),
+                out_name=input_value.get('out_name'),
+            ))
+            for input_value in input_values
+        )
+
+    def make_type(type_snapshot):
+        kind = type_snapshot['kind']
+        name = type_snapshot['name']
+        description = type_snapshot.get('description')
+
+        # Fields and possible types are bound lazily, as they may refer to
+        # types that are restored later.
+        if kind == TypeKind.OBJECT:
+            return GraphQLObjectType(
+                name=name,
+                fields=lambda: make_fields(type_snapshot),
+                interfaces=lambda: [types[interface] for interface in type_snapshot['interfaces']],
+                description=description,
+            )
+
+        if kind == TypeKind.INTERFACE:
+            return GraphQLInterfaceType(
+                name=name,
+                fields=lambda: make_fields(type_snapshot),
+                resolve_type=type_resolvers.get(name, _none),
+                description=description,
+            )
+
+        if kind == TypeKind.UNION:
+            return GraphQLUnionType(
+                name=name,
+                types=lambda: [types[possible_type] for possible_type in type_snapshot['types']],
+                resolve_type=type_resolvers.get(name, _none),
+                description=description,
+            )
+
+        if kind == TypeKind.ENUM:
+            return GraphQLEnumType(
+                name=name,
+                values=OrderedDict(
+                    (value['name'], GraphQLEnumValue(
+                        value=value.get('value'),
+                        deprecation_reason=value.get('deprecation_reason'),
+                        description=value.get('description'),
+                    ))
+                    for value in type_snapshot['values']
+                ),
+                description=description,
+            )
+
+        if kind == TypeKind.INPUT_OBJECT:
+            return GraphQLInputObjectType(
+                name=name,
+                fields=lambda: make_input_values(type_snapshot['fields'], GraphQLInputObjectField),
+                description=description,
+            )
+
+        assert kind == TypeKind.SCALAR, 'Unknown type kind {}.'.format(kind)
+        if name in scalars:
+            return scalars[name]
+
+        return GraphQLScalarType(
+            name=name,
+            description=description,
+            serialize=_none,
+            # As in build_ast_schema, literals of custom scalars are valid.
+            parse_literal=_false,
+            parse_value=_false,
+        )
+
+    for type_snapshot in snapshot['types']:
+        types[type_snapshot['name']] = make_type(type_snapshot)
+
+    directives = [
+        _specified_directives[directive] if not isinstance(directive, dict) else GraphQLDirective(
+            name=directive['name'],
+            description=directive.get('description'),
+            args=make_input_values(directive['args'], GraphQLArgument),
+            locations=directive['locations'],
+        )
+        for directive in snapshot['directives']
+    ]
+
+    return GraphQLSchema(
+        query=types[snapshot['query']],
+        mutation=types[snapshot['mutation']] if snapshot.get('mutation') else None,
+        subscription=types[snapshot['subscription']] if snapshot.get('subscription') else None,
+        directives=directives,
+        types=[types[type_snapshot['name']] for type_snapshot in snapshot['types']],
+        assume_valid=True,
+    )
+
+
+def dump_schema_snapshot(schema, file):
+    """Writes a snapshot of the schema to a file, as compact JSON."""
+    json.dump(get_schema_snapshot(schema), file, separators=(',', ':'), sort_keys=True)
+
+
+def load_schema_snapshot(file, **kwargs):
+    """Restores a schema from a file written by `dump_schema_snapshot`. The
+    keyword arguments are those of `build_schema_from_snapshot`."""
+    return build_schema_from_snapshot(json.load(file), **kwargs)
@@ -1,4 +1,4 @@
-from collections import OrderedDict
+from weakref import WeakKeyDictionary
 
 
 def suggestion_list(inp, options):
@@ -6,16 +6,120 @@ def suggestion_list(inp, options):
      Given an invalid input string and a list of valid options, returns a filtered
      list of valid options sorted based on their similarity with the input.
     '''
-    options_by_distance = OrderedDict()
-    input_threshold = len(inp) / 2
+    return SuggestionIndex(options).suggest(inp)
 
-    for option in options:
-        distance = lexical_distance(inp, option)
-        threshold = max(input_threshold, len(option) / 2, 1)
-        if distance <= threshold:
-            options_by_distance[option] = distance
 
-    return sorted(list(options_by_distance.keys()), key=lambda k: options_by_distance[k])
+class SuggestionIndex(object):
+    '''
+     The options of `suggestion_list`, grouped by length so that a suggestion
+     only computes the distance to options of a length that can be close
+     enough to the input, and stops as soon as an option is too far.
+
+     Options that don't share enough characters with the input are skipped
+     without computing the distance, as each missing character takes an edit.
+    '''
+    __slots__ = 'options_by_length',
+
+    def __init__(self, options):
+        self.options_by_length = {}
+        seen = set()
+        for position, option in enumerate(options):
+            if option not in seen:
+                seen.add(option)
+                self.options_by_length.setdefault(len(option), []).append(
+                    (position, option, count_chars(option))
+                )
+
+    def suggest(self, inp):
+        input_threshold = len(inp) / 2
+        input_chars = count_chars(inp).items()
+        suggestions = []
+
+        for length, options in self.options_by_length.items():
+            threshold = max(input_threshold, length / 2, 1)
+            # The distance is at least the difference in length.
+            if abs(length - len(inp)) > threshold:
+                continue
+
+            max_length = max(length, len(inp))
+            for position, option, option_chars in options:
+                common = 0
+                for char, count in input_chars:
+                    common += min(count, option_chars.get(char, 0))
+                if max_length - common > threshold:
+                    continue
+
+                distance = bounded_lexical_distance(inp, option, threshold)
+                if distance is not None:
+                    suggestions.append((distance, position, option))
+
+        # Closest options first, then in the order they were given.
+        suggestions.sort()
+        return [option for _, _, option in suggestions]
+
+
+def count_chars(s):
+    counts = {}
+    for char in s:
+        counts[char] = counts.get(char, 0) + 1
+    return counts
+
+
+_schema_suggestion_indexes = WeakKeyDictionary()
+
+
+def get_suggestion_index(schema, graphql_type=None):
+    '''
+     Returns the index of the type names of the schema or, if a type is given,
+     of its field names. Indexes are built on first use and kept as long as
+     the schema.
+    '''
+    indexes = _schema_suggestion_indexes.get(schema)
+    if indexes is None:
+        indexes = _schema_suggestion_indexes.setdefault(schema, {})
+
+    index = indexes.get(graphql_type)
+    if index is None:
+        if graphql_type is None:
+            options = schema.get_type_map().keys()
+        else:
+            options = schema.get_fields(graphql_type).keys()
+        index = indexes[graphql_type] = SuggestionIndex(options)
+
+    return index
+
+
+def bounded_lexical_distance(a, b, bound):
+    '''
+     Computes the same distance as `lexical_distance`, one row of edits at a
+     time, giving up as soon as it must be greater than `bound`.
+     @returns distance in number of edits, or None if it's greater than bound
+    '''
+    if a == b:
+        return 0
+
+    b_len = len(b)
+    previous = list(range(b_len + 1))
+    for i, a_char in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j in range(1, b_len + 1):
+            distance = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (a_char != b[j - 1])
+            )
+            current.append(distance)
+            if distance < row_min:
+                row_min = distance
+
+        # Distances never decrease from one row to the next.
+        if row_min > bound:
+            return None
+        previous = current
+
+    distance = previous[b_len]
+    return distance if distance <= bound else None
 
 
 def lexical_distance(a, b):
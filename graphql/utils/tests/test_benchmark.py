@@ -0,0 +1,143 @@
+import json
+
+from pytest import fixture
+
+from graphql import parse
+from graphql.utils.build_ast_schema import build_ast_schema
+from graphql.utils.build_client_schema import build_client_schema
+from graphql.utils.schema_snapshot import (build_schema_from_snapshot,
+                                           get_schema_snapshot)
+
+# Worker startup: building a schema from its definition, compared to
+# restoring it from a snapshot.
+
+
+def make_sdl(size):
+    definitions = [
+        'schema { query: Query }',
+        'interface Node { id: ID! name(upper: Boolean): String }',
+        'enum Color { RED GREEN BLUE }',
+        'input Filter { name: String color: Color = RED limit: Int = 10 }',
+    ]
+    definitions.extend(
+        'type T{0} implements Node {{ id: ID! name(upper: Boolean): String color: Color '
+        'next(filter: Filter, first: Int = 10): [T{1}!]! count: Int score: Float }}'.format(i, (i + 1) % size)
+        for i in range(size)
+    )
+    definitions.append('type Query { node(id: ID!): Node ' + ' '.join(
+        't{0}: T{0}'.format(i) for i in range(size)) + ' }')
+    return '\n'.join(definitions)
+
+
+sdl = make_sdl(100)
+
+
+def test_build_schema_from_sdl(benchmark):
+    @benchmark
+    def schema():
+        return build_ast_schema(parse(sdl))
+
+    assert len(schema.get_type_map()) > 100
+
+
+def test_build_schema_from_snapshot(benchmark):
+    data = json.dumps(get_schema_snapshot(build_ast_schema(parse(sdl))))
+
+    @benchmark
+    def schema():
+        return build_schema_from_snapshot(json.loads(data))
+
+    assert len(schema.get_type_map()) > 100
+
+
+# Gateway reloads: building a schema from the introspection result of a
+# remote schema with 10k types.
+
+
+def make_type_ref(type_ref):
+    if type_ref.endswith('!'):
+        return {'kind': 'NON_NULL', 'name': None, 'ofType': make_type_ref(type_ref[:-1])}
+    if type_ref.startswith('['):
+        return {'kind': 'LIST', 'name': None, 'ofType': make_type_ref(type_ref[1:-1])}
+    kind = 'SCALAR' if type_ref in ('ID', 'String', 'Boolean', 'Int', 'Float') else {
+        'Node': 'INTERFACE', 'Color': 'ENUM', 'Filter': 'INPUT_OBJECT'}.get(type_ref, 'OBJECT')
+    return {'kind': kind, 'name': type_ref, 'ofType': None}
+
+
+def make_input_value(name, type_ref, default_value=None):
+    return {'name': name, 'description': None, 'type': make_type_ref(type_ref), 'defaultValue': default_value}
+
+
+def make_field(name, type_ref, args=()):
+    return {'name': name, 'description': None, 'args': list(args), 'type': make_type_ref(type_ref),
+            'isDeprecated': False, 'deprecationReason': None}
+
+
+def make_type(kind, name, fields=None, interfaces=None, possible_types=None, enum_values=None, input_fields=None):
+    return {'kind': kind, 'name': name, 'description': None, 'fields': fields, 'inputFields': input_fields,
+            'interfaces': interfaces, 'enumValues': enum_values, 'possibleTypes': possible_types}
+
+
+def make_introspection(size):
+    # Types like those of make_sdl, without executing the introspection
+    # query on a schema of that size. Each type refers to the next one, so
+    # the types form a chain of 10k references.
+    def node_fields():
+        return [make_field('id', 'ID!'), make_field('name', 'String', [make_input_value('upper', 'Boolean')])]
+
+    types = [
+        make_type('OBJECT', 'Query', interfaces=[], fields=[
+            make_field('node', 'Node', [make_input_value('id', 'ID!')]),
+        ] + [make_field('t{}'.format(i), 'T{}'.format(i)) for i in range(size)]),
+        make_type('INTERFACE', 'Node', fields=node_fields(),
+                  possible_types=[make_type_ref('T{}'.format(i)) for i in range(size)]),
+        make_type('ENUM', 'Color', enum_values=[
+            {'name': name, 'description': None, 'isDeprecated': False, 'deprecationReason': None}
+            for name in ['RED', 'GREEN', 'BLUE']
+        ]),
+        make_type('INPUT_OBJECT', 'Filter', input_fields=[
+            make_input_value('name', 'String'),
+            make_input_value('color', 'Color', 'RED'),
+            make_input_value('limit', 'Int', '10'),
+        ]),
+    ]
+    types.extend(
+        make_type('OBJECT', 'T{}'.format(i), interfaces=[make_type_ref('Node')], fields=node_fields() + [
+            make_field('color', 'Color'),
+            make_field('next', '[T{}!]!'.format((i + 1) % size), [
+                make_input_value('filter', 'Filter'),
+                make_input_value('first', 'Int', '10'),
+            ]),
+            make_field('count', 'Int'),
+            make_field('score', 'Float'),
+        ])
+        for i in range(size)
+    )
+    return {'__schema': {
+        'queryType': {'name': 'Query'},
+        'mutationType': None,
+        'subscriptionType': None,
+        'types': types,
+        'directives': [],
+    }}
+
+
+@fixture(scope='module')
+def introspection():
+    return make_introspection(10000)
+
+
+def test_build_client_schema(benchmark, introspection):
+    @benchmark
+    def schema():
+        return build_client_schema(introspection)
+
+    assert len(schema.get_type_map()) > 10000
+
+
+def test_build_client_schema_assume_valid(benchmark, introspection):
+    @benchmark
+    def schema():
+        return build_client_schema(introspection, assume_valid=True)
+
+    assert len(schema.get_type_map()) > 10000
@@ -1,6 +1,6 @@
 from pytest import raises
 
-from graphql import GraphQLInt, parse
+from graphql import GraphQLInt, GraphQLString, parse
 from graphql.utils.build_ast_schema import build_ast_schema
 from graphql.utils.schema_printer import print_schema
 
@@ -789,3 +789,75 @@ fragment Foo on Type { field } '''
         build_ast_schema(doc)
 
     assert 'Specified query type "Foo" not found in document' in str(excinfo.value)
+
+
+lazy_body = '''
+schema {
+  query: Query
+}
+
+directive @cached(ttl: Int = 60) on FIELD
+
+interface Named {
+  name(upper: Boolean = false): String
+}
+
+type Dog implements Named {
+  name(upper: Boolean = false): String
+  color: Color
+}
+
+type Cat implements Named {
+  name(upper: Boolean = false): String
+}
+
+union Pet = Dog | Cat
+
+enum Color {
+  RED
+  GREEN
+}
+
+input Filter {
+  color: Color = RED
+  limit: Int
+}
+
+type Query {
+  pets(filter: Filter): [Pet]
+  named: Named
+}
+'''
+
+
+def test_lazy_schema_prints_like_a_checked_schema():
+    ast = parse(lazy_body)
+    assert print_schema(build_ast_schema(ast, lazy=True)) == print_schema(build_ast_schema(ast))
+
+
+def test_lazy_schema_checks_types_when_used():
+    body = '''
+schema {
+  query: Query
+}
+
+type Query {
+  str: String
+  invalid: Invalid
+}
+
+type Invalid implements Named {
+  str: String
+}
+
+interface Named {
+  name: String
+}
+'''
+    schema = build_ast_schema(parse(body), lazy=True)
+    assert schema.get_field_defs(schema.get_query_type())['str'].type == GraphQLString
+
+    with raises(AssertionError) as excinfo:
+        schema.get_field_defs(schema.get_type('Invalid'))
+
+    assert str(excinfo.value) == '"Named" expects field "name" but "Invalid" does not provide it.'
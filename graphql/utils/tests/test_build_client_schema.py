@@ -1,6 +1,8 @@
+import json
 from collections import OrderedDict
 
 from pytest import raises
+from six import StringIO
 
 from graphql import graphql
 from graphql.error import format_error
@@ -577,6 +579,58 @@ def test_cannot_use_client_schema_for_general_execution():
     ]
 
 
+def make_schema_with_interface():
+    NamedType = GraphQLInterfaceType(
+        name='Named',
+        fields={
+            'name': GraphQLField(GraphQLString),
+        },
+    )
+    DogType = GraphQLObjectType(
+        name='Dog',
+        interfaces=[NamedType],
+        is_type_of=lambda *_: True,
+        fields=OrderedDict([
+            ('name', GraphQLField(GraphQLString)),
+            ('friends', GraphQLField(GraphQLNonNull(GraphQLList(GraphQLNonNull(NamedType))))),
+            ('enemies', GraphQLField(GraphQLNonNull(GraphQLList(GraphQLNonNull(NamedType))))),
+        ])
+    )
+    return GraphQLSchema(
+        query=GraphQLObjectType(
+            name='Query',
+            fields={
+                'dogs': GraphQLField(
+                    GraphQLList(DogType),
+                    args={'first': GraphQLArgument(GraphQLInt, default_value=10)},
+                ),
+            }
+        ),
+        types=[DogType],
+    )
+
+
+def test_builds_a_schema_from_json():
+    introspection = graphql(make_schema_with_interface(), introspection_query)
+    data = json.dumps(introspection.data)
+
+    for source in [data, data.encode('utf-8'), StringIO(data), {'data': introspection.data}]:
+        client_schema = build_client_schema(source)
+        assert graphql(client_schema, introspection_query).data == introspection.data
+
+
+def test_builds_a_trusted_schema_without_checking_it():
+    introspection = graphql(make_schema_with_interface(), introspection_query)
+    client_schema = build_client_schema(introspection.data, assume_valid=True)
+
+    assert graphql(client_schema, introspection_query).data == introspection.data
+    dog_type = client_schema.get_type('Dog')
+    assert client_schema.is_possible_type(client_schema.get_type('Named'), dog_type)
+
+    # Wrapping types are built once.
+    assert dog_type.fields['friends'].type is dog_type.fields['enemies'].type
+
+
 def test_throws_when_given_empty_types():
     incomplete_introspection = {
         '__schema': {
@@ -117,6 +117,125 @@ def test_cannot_be_used_for_execution():
                ) == 'Client Schema cannot be used for execution.'
 
 
+def test_shares_types_not_referring_to_extended_types():
+    ast = parse('''
+      extend type Biz {
+        newField: String
+      }
+    ''')
+    extended_schema = extend_schema(test_schema, ast)
+    original_type_map = test_schema.get_type_map()
+    extended_type_map = extended_schema.get_type_map()
+
+    # Biz, the union of Foo and Biz, and the query type referring to the
+    # union are copied.
+    for name in ['Biz', 'SomeUnion', 'Query']:
+        assert extended_type_map[name] is not original_type_map[name]
+    for name in ['Foo', 'Bar', 'SomeInterface', 'SomeEnum', 'String']:
+        assert extended_type_map[name] is original_type_map[name]
+
+    assert extended_type_map['SomeUnion'].types == [original_type_map['Foo'], extended_type_map['Biz']]
+    assert extended_schema.get_query_type().fields['foo'].type is FooType
+    assert 'newField' not in BizType.fields
+
+
+def test_keeps_resolvers_of_existing_fields():
+    QueryType = GraphQLObjectType(
+        name='Query',
+        fields={
+            'hello': GraphQLField(GraphQLString, resolver=lambda *_: 'world'),
+        }
+    )
+    schema = GraphQLSchema(query=QueryType)
+    ast = parse('''
+      extend type Query {
+        newField: String
+      }
+    ''')
+    extended_schema = extend_schema(schema, ast)
+
+    result = execute(extended_schema, parse('{ hello newField }'))
+    assert result.data == {'hello': 'world', 'newField': None}
+    assert str(result.errors[0]) == 'Client Schema cannot be used for execution.'
+
+
+def test_resolves_abstract_types_to_extended_types():
+    NamedType = GraphQLInterfaceType(
+        name='Named',
+        fields={
+            'name': GraphQLField(GraphQLString),
+        },
+        resolve_type=lambda *_: DogType,
+    )
+    DogType = GraphQLObjectType(
+        name='Dog',
+        interfaces=[NamedType],
+        fields={
+            'name': GraphQLField(GraphQLString, resolver=lambda *_: 'Rex'),
+        }
+    )
+    schema = GraphQLSchema(
+        query=GraphQLObjectType(
+            name='Query',
+            fields={
+                'pet': GraphQLField(NamedType, resolver=lambda *_: object()),
+            }
+        ),
+        types=[DogType],
+    )
+    ast = parse('''
+      extend type Dog {
+        barks: Boolean
+      }
+    ''')
+    extended_schema = extend_schema(schema, ast)
+    assert extended_schema.get_type('Named') is not NamedType
+
+    result = execute(extended_schema, parse('{ pet { name ... on Dog { barks } } }'))
+    assert result.data == {'pet': {'name': 'Rex', 'barks': None}}
+    assert str(result.errors[0]) == 'Client Schema cannot be used for execution.'
+
+
+def test_adds_types_implementing_interfaces_without_type_resolver():
+    NamedType = GraphQLInterfaceType(
+        name='Named',
+        fields={
+            'name': GraphQLField(GraphQLString),
+        },
+    )
+    DogType = GraphQLObjectType(
+        name='Dog',
+        interfaces=[NamedType],
+        fields={
+            'name': GraphQLField(GraphQLString, resolver=lambda *_: 'Rex'),
+        },
+        is_type_of=lambda *_: True,
+    )
+    schema = GraphQLSchema(
+        query=GraphQLObjectType(
+            name='Query',
+            fields={
+                'pet': GraphQLField(NamedType, resolver=lambda *_: object()),
+            }
+        ),
+        types=[DogType],
+    )
+    ast = parse('''
+      type Cat implements Named {
+        name: String
+      }
+    ''')
+    extended_schema = extend_schema(schema, ast)
+    assert extended_schema.get_type('Named') is NamedType
+    assert extended_schema.get_type('Cat').interfaces == [NamedType]
+    assert not extended_schema.get_type('Cat').is_type_of(object(), None)
+
+    # The existing types are still resolved by their is_type_of.
+    result = execute(extended_schema, parse('{ pet { name ... on Dog { name } } }'))
+    assert not result.errors
+    assert result.data == {'pet': {'name': 'Rex'}}
+
+
 def test_extends_objects_by_adding_new_fields():
     ast = parse('''
       extend type Foo {
@@ -785,3 +904,15 @@ def test_does_not_allow_extending_a_scalar():
         extend_schema(test_schema, ast)
 
     assert str(exc_info.value) == 'Cannot extend non-object type "String".'
+
+
+def test_does_not_allow_implementing_an_interface_incorrectly():
+    ast = parse('''
+      extend type Biz implements SomeInterface {
+        name: String
+      }
+    ''')
+    with raises(Exception) as exc_info:
+        extend_schema(test_schema, ast)
+
+    assert str(exc_info.value) == '"SomeInterface" expects field "some" but "Biz" does not provide it.'
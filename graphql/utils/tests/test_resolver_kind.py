@@ -0,0 +1,42 @@
+from functools import partial
+
+from promise import Promise
+
+from graphql.type import (GraphQLField, GraphQLObjectType, GraphQLSchema,
+                          GraphQLString)
+from graphql.utils.resolver_kind import ResolverKind, get_resolver_kind
+
+
+def resolve_plain(root, info):
+    return 'plain'
+
+
+def resolve_promise(root, info):
+    return Promise.resolve('promise')
+
+
+resolve_promise.__annotations__ = {'return': Promise}
+
+
+def test_classifies_plain_functions():
+    assert get_resolver_kind(resolve_plain) == ResolverKind.FUNCTION
+    assert get_resolver_kind(lambda root, info: None) == ResolverKind.FUNCTION
+    assert get_resolver_kind(None) == ResolverKind.FUNCTION
+
+
+def test_classifies_promise_annotated_functions():
+    assert get_resolver_kind(resolve_promise) == ResolverKind.PROMISE_FUNCTION
+    assert get_resolver_kind(partial(resolve_promise, None)) == ResolverKind.PROMISE_FUNCTION
+
+
+def test_schema_classifies_field_resolvers():
+    query = GraphQLObjectType('Query', {
+        'plain': GraphQLField(GraphQLString, resolver=resolve_plain),
+        'promise': GraphQLField(GraphQLString, resolver=resolve_promise),
+        'default': GraphQLField(GraphQLString),
+    })
+    schema = GraphQLSchema(query)
+
+    assert schema.get_resolver_kind(query.fields['plain']) == ResolverKind.FUNCTION
+    assert schema.get_resolver_kind(query.fields['promise']) == ResolverKind.PROMISE_FUNCTION
+    assert schema.get_resolver_kind(query.fields['default']) == ResolverKind.FUNCTION
@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+
+from pytest import raises
+
+import graphql
+from graphql import parse
+from graphql.type import (GraphQLEnumType, GraphQLEnumValue, GraphQLField,
+                          GraphQLObjectType, GraphQLSchema, GraphQLString)
+from graphql.utils.build_ast_schema import build_ast_schema
+from graphql.utils.schema_fingerprint import (get_schema_fingerprint,
+                                              get_type_fingerprints)
+
+sdl = '''
+schema { query: Query }
+directive @cached(ttl: Int = 60) on FIELD
+type Query { dog: Dog cat: Cat }
+type Dog { name(upper: Boolean = false): String color: Color }
+type Cat { name: String }
+enum Color { RED GREEN }
+'''
+
+
+def test_same_structure_same_fingerprint():
+    schema = build_ast_schema(parse(sdl))
+
+    assert get_schema_fingerprint(schema) == get_schema_fingerprint(build_ast_schema(parse(sdl)))
+    assert get_type_fingerprints(schema) == get_type_fingerprints(build_ast_schema(parse(sdl)))
+    assert sorted(get_type_fingerprints(schema)) == ['Cat', 'Color', 'Dog', 'Query']
+
+
+def test_fingerprint_ignores_resolvers():
+    schema = GraphQLSchema(GraphQLObjectType('Query', {'a': GraphQLField(GraphQLString)}))
+    resolved_schema = GraphQLSchema(GraphQLObjectType('Query', {
+        'a': GraphQLField(GraphQLString, resolver=lambda *_: 'a'),
+    }))
+
+    assert get_schema_fingerprint(schema) == get_schema_fingerprint(resolved_schema)
+
+
+def test_changes_change_the_fingerprints_of_their_types():
+    schema = build_ast_schema(parse(sdl))
+    type_fingerprints = get_type_fingerprints(schema)
+
+    for changed_sdl, changed_type in [
+        (sdl.replace('upper: Boolean = false', 'upper: Boolean = true'), 'Dog'),
+        (sdl.replace('RED GREEN', 'RED GREEN BLUE'), 'Color'),
+        (sdl.replace('type Cat { name: String }', 'type Cat { name: String! }'), 'Cat'),
+        (sdl.replace('ttl: Int = 60', 'ttl: Int = 30'), None),
+    ]:
+        changed_schema = build_ast_schema(parse(changed_sdl))
+        changed_type_fingerprints = get_type_fingerprints(changed_schema)
+
+        assert get_schema_fingerprint(changed_schema) != get_schema_fingerprint(schema)
+        assert [
+            name for name in type_fingerprints if changed_type_fingerprints[name] != type_fingerprints[name]
+        ] == ([changed_type] if changed_type else [])
+
+
+def test_fingerprint_is_stable_across_processes():
+    code = (
+        'from graphql import parse; '
+        'from graphql.utils.build_ast_schema import build_ast_schema; '
+        'from graphql.utils.schema_fingerprint import get_schema_fingerprint; '
+        'print(get_schema_fingerprint(build_ast_schema(parse({!r}))))'
+    ).format(sdl)
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(graphql.__file__)))
+    output = subprocess.check_output([sys.executable, '-c', code], env=env)
+
+    assert output.decode('utf-8').strip() == get_schema_fingerprint(build_ast_schema(parse(sdl)))
+
+
+def test_values_that_are_not_serializable_have_no_fingerprint():
+    # The repr of the value would change between processes.
+    color = GraphQLEnumType('Color', {'RED': GraphQLEnumValue(object())})
+    schema = GraphQLSchema(GraphQLObjectType('Query', {'color': GraphQLField(color)}))
+
+    with raises(TypeError):
+        get_schema_fingerprint(schema)
@@ -0,0 +1,157 @@
+import json
+
+from pytest import raises
+from six import StringIO
+
+from graphql import graphql, parse
+from graphql.type import (GraphQLArgument, GraphQLEnumType, GraphQLEnumValue,
+                          GraphQLField, GraphQLInputObjectField,
+                          GraphQLInputObjectType, GraphQLInt,
+                          GraphQLObjectType, GraphQLScalarType, GraphQLSchema,
+                          GraphQLString)
+from graphql.utils.build_ast_schema import build_ast_schema
+from graphql.utils.schema_printer import print_schema
+from graphql.utils.schema_snapshot import (build_schema_from_snapshot,
+                                           dump_schema_snapshot,
+                                           get_schema_snapshot,
+                                           load_schema_snapshot)
+
+sdl = '''
+schema {
+  query: Query
+  mutation: Mutation
+}
+
+directive @cached(ttl: Int = 60) on FIELD_DEFINITION | FIELD
+
+interface Named {
+  name: String
+}
+
+type Dog implements Named {
+  name: String
+  barks(loudly: Boolean = true, times: [Int!] = [1, 2]): [String!]!
+  color: Color @deprecated(reason: "Use colors")
+  colors: [Color]
+}
+
+type Cat implements Named {
+  name: String
+  owner: Person
+}
+
+type Person {
+  name: String
+  pets(filter: PetFilter = {color: RED, limit: 3}): [Pet]
+  custom: Custom
+}
+
+union Pet = Dog | Cat
+
+enum Color {
+  RED
+  GREEN
+  BLUE @deprecated
+}
+
+input PetFilter {
+  color: Color
+  limit: Int
+}
+
+scalar Custom
+
+type Query {
+  dog: Dog
+  pet: Pet
+  named: Named
+  person: Person
+}
+
+type Mutation {
+  adopt(name: String!): Pet
+}
+'''
+
+
+def restore(schema, **kwargs):
+    # Go through JSON, as a snapshot read from disk would.
+    return build_schema_from_snapshot(json.loads(json.dumps(get_schema_snapshot(schema))), **kwargs)
+
+
+def test_restores_a_schema_built_from_sdl():
+    schema = build_ast_schema(parse(sdl))
+    restored = restore(schema)
+
+    assert print_schema(restored) == print_schema(schema)
+    assert restored.get_directive('cached').args['ttl'].default_value == 60
+    assert restored.get_directive('skip') is schema.get_directive('skip')
+    assert restored.get_type('Person').fields['pets'].args['filter'].default_value == {'color': 'RED', 'limit': 3}
+
+
+def test_restores_introspection():
+    schema = build_ast_schema(parse(sdl))
+    query = '{ __schema { types { name fields { name args { name defaultValue } } } } }'
+
+    assert graphql(restore(schema), query).data == graphql(schema, query).data
+
+
+def test_keeps_enum_values_descriptions_and_out_names():
+    schema = GraphQLSchema(GraphQLObjectType('Query', {
+        'number': GraphQLField(
+            GraphQLEnumType('Number', {'ONE': GraphQLEnumValue(1), 'TWO': GraphQLEnumValue(2, description='Two')}),
+            args={'input': GraphQLArgument(GraphQLInputObjectType('Input', {
+                'some_value': GraphQLInputObjectField(GraphQLInt, out_name='someValue'),
+            }))},
+            description='A number',
+            resolver=lambda *_: 2,
+        ),
+    }, description='The root'))
+    restored = restore(schema)
+
+    number_type = restored.get_type('Number')
+    assert [(value.name, value.value, value.description) for value in number_type.values] == [
+        ('ONE', 1, None), ('TWO', 2, 'Two')
+    ]
+    assert restored.get_query_type().description == 'The root'
+    assert restored.get_query_type().fields['number'].description == 'A number'
+    assert restored.get_type('Input').fields['some_value'].out_name == 'someValue'
+
+
+def test_binds_resolvers_by_name():
+    schema = build_ast_schema(parse(sdl))
+    date_type = GraphQLScalarType('Custom', serialize=lambda value: 'custom:' + value)
+    restored = restore(
+        schema,
+        resolvers={
+            'Query': {'pet': lambda *_: {'name': 'Rex'}, 'person': lambda *_: {}},
+            'Dog': {'name': lambda dog, *_: dog['name']},
+            'Person': {'custom': lambda *_: 'value'},
+        },
+        type_resolvers={'Pet': lambda *_: restored.get_type('Dog')},
+        scalars={'Custom': date_type},
+    )
+
+    result = graphql(restored, '{ pet { ... on Dog { name } } person { custom } }')
+    assert not result.errors
+    assert result.data == {'pet': {'name': 'Rex'}, 'person': {'custom': 'custom:value'}}
+    assert restored.get_type('Custom') is date_type
+
+
+def test_dumps_and_loads_snapshots():
+    schema = build_ast_schema(parse(sdl))
+    file = StringIO()
+    dump_schema_snapshot(schema, file)
+    file.seek(0)
+
+    assert print_schema(load_schema_snapshot(file)) == print_schema(schema)
+
+
+def test_rejects_unknown_snapshot_versions():
+    snapshot = get_schema_snapshot(GraphQLSchema(GraphQLObjectType('Query', {'a': GraphQLField(GraphQLString)})))
+    snapshot['version'] = 0
+
+    with raises(AssertionError) as excinfo:
+        build_schema_from_snapshot(snapshot)
+
+    assert str(excinfo.value) == 'Schema snapshot version 0 is not supported.'
@@ -1,4 +1,8 @@
-from graphql.utils.suggestion_list import suggestion_list
+from graphql.type import (GraphQLField, GraphQLObjectType, GraphQLSchema,
+                          GraphQLString)
+from graphql.utils.suggestion_list import (bounded_lexical_distance,
+                                           get_suggestion_index,
+                                           lexical_distance, suggestion_list)
 
 
 def test_returns_results_when_input_is_empty():
@@ -13,3 +17,39 @@ def test_returns_options_sorted_based_on_similarity():
     assert suggestion_list('abc', ['a', 'ab', 'abc']) == ['abc', 'ab']
 
     assert suggestion_list('csutomer', ['customer', 'stomer', 'store']) == ['customer', 'stomer', 'store']
+
+
+def test_returns_options_in_the_order_given_when_equally_similar():
+    assert suggestion_list('ab', ['ba', 'xb', 'ab', 'ax', 'xb']) == ['ab', 'xb', 'ax']
+
+
+def test_matches_the_lexical_distance_of_all_options():
+    options = ['customer', 'customers', 'Customer', 'stomer', 'store', 'cost', 'c', '', 'customerOrders',
+               'CustomerOrderLineItem', 'csutomer', 'mustcore']
+    for inp in ['', 'c', 'cus', 'custmer', 'customerorder', 'CustomerOrderLine', 'xyz']:
+        expected = [
+            option for option in options
+            if lexical_distance(inp, option) <= max(len(inp) / 2, len(option) / 2, 1)
+        ]
+        expected.sort(key=lambda option: lexical_distance(inp, option))
+        assert suggestion_list(inp, options) == expected
+
+
+def test_bounded_lexical_distance():
+    assert bounded_lexical_distance('kitten', 'sitting', 3) == 3
+    assert bounded_lexical_distance('kitten', 'sitting', 2) is None
+    assert bounded_lexical_distance('', 'abc', 3) == 3
+    assert bounded_lexical_distance('abc', 'abc', 0) == 0
+
+
+def test_suggestion_indexes_are_built_once_per_schema():
+    query = GraphQLObjectType('Query', {
+        'customer': GraphQLField(GraphQLString),
+        'customers': GraphQLField(GraphQLString),
+    })
+    schema = GraphQLSchema(query)
+
+    index = get_suggestion_index(schema, query)
+    assert get_suggestion_index(schema, query) is index
+    assert index.suggest('custmer') == ['customer', 'customers']
+    assert get_suggestion_index(schema).suggest('Quer') == ['Query']
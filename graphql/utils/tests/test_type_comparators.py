@@ -5,7 +5,8 @@ from graphql.type import (GraphQLField, GraphQLFloat, GraphQLInt,
                           GraphQLObjectType, GraphQLSchema, GraphQLString,
                           GraphQLUnionType)
 
-from ..type_comparators import is_equal_type, is_type_sub_type_of
+from ..type_comparators import (do_types_overlap, get_type_relations,
+                                is_equal_type, is_type_sub_type_of)
 
 
 def _test_schema(field_type):
@@ -113,3 +114,79 @@ def test_is_type_sub_type_of_implementation_is_subtype_of_interface():
     )
     schema = _test_schema(impl)
     assert is_type_sub_type_of(schema, impl, iface)
+
+
+def test_is_type_sub_type_of_unwraps_both_types():
+    schema = _test_schema(GraphQLString)
+    assert is_type_sub_type_of(
+        schema,
+        GraphQLNonNull(GraphQLList(GraphQLNonNull(GraphQLInt))),
+        GraphQLList(GraphQLInt)
+    )
+    assert not is_type_sub_type_of(
+        schema,
+        GraphQLList(GraphQLList(GraphQLInt)),
+        GraphQLList(GraphQLNonNull(GraphQLList(GraphQLInt)))
+    )
+
+
+def _abstract_types_schema():
+    iface = GraphQLInterfaceType(
+        name='Interface',
+        fields={
+            'field': GraphQLField(GraphQLString)
+        }
+    )
+
+    def make_object(name, interfaces=None):
+        return GraphQLObjectType(
+            name=name,
+            is_type_of=lambda *_: True,
+            interfaces=interfaces,
+            fields={
+                'field': GraphQLField(GraphQLString)
+            }
+        )
+
+    impl = make_object('Impl', [iface])
+    other = make_object('Other')
+    last = make_object('Last')
+    union = GraphQLUnionType(name='Union', types=[impl, other])
+    other_union = GraphQLUnionType(name='OtherUnion', types=[other, last])
+    schema = GraphQLSchema(
+        query=GraphQLObjectType(
+            name='Query',
+            fields=OrderedDict([
+                ('iface', GraphQLField(iface)),
+                ('union', GraphQLField(union)),
+                ('otherUnion', GraphQLField(other_union)),
+            ])
+        ),
+        types=[impl],
+    )
+    return schema, iface, impl, union, other_union
+
+
+def test_do_types_overlap():
+    schema, iface, impl, union, other_union = _abstract_types_schema()
+    assert do_types_overlap(schema, impl, impl)
+    assert do_types_overlap(schema, iface, impl)
+    assert do_types_overlap(schema, impl, union)
+    assert not do_types_overlap(schema, impl, other_union)
+    assert do_types_overlap(schema, iface, union)
+    assert do_types_overlap(schema, union, other_union)
+    assert not do_types_overlap(schema, iface, other_union)
+    assert not do_types_overlap(schema, other_union, iface)
+
+
+def test_do_types_overlap_keeps_the_relations_of_the_schema():
+    schema, iface, impl, union, other_union = _abstract_types_schema()
+    relations = get_type_relations(schema)
+    assert get_type_relations(schema) is relations
+
+    assert not do_types_overlap(schema, iface, other_union)
+    assert relations.overlaps == {('Interface', 'OtherUnion'): False, ('OtherUnion', 'Interface'): False}
+    assert relations.possible_type_names == {
+        'Interface': frozenset(['Impl']),
+        'OtherUnion': frozenset(['Other', 'Last']),
+    }
@@ -0,0 +1,56 @@
+from graphql import parse
+from graphql.type import (GraphQLField, GraphQLInt, GraphQLList,
+                          GraphQLNonNull, GraphQLObjectType, GraphQLSchema,
+                          GraphQLString)
+
+from .. import type_from_ast as type_from_ast_module
+from ..type_from_ast import get_wrapped_type, type_from_ast
+
+
+def make_schema():
+    return GraphQLSchema(
+        query=GraphQLObjectType(
+            name='Query',
+            fields={
+                'field': GraphQLField(GraphQLString),
+                'count': GraphQLField(GraphQLInt),
+            }
+        )
+    )
+
+
+def get_variable_type_ast(type_ref):
+    document = parse('query Q($v: {}) {{ field }}'.format(type_ref))
+    return document.definitions[0].variable_definitions[0].type
+
+
+def test_returns_named_types_of_the_schema():
+    schema = make_schema()
+    assert type_from_ast(schema, get_variable_type_ast('String')) is GraphQLString
+    assert type_from_ast(schema, get_variable_type_ast('Unknown')) is None
+    assert type_from_ast(schema, get_variable_type_ast('[Unknown!]')) is None
+
+
+def test_returns_the_same_wrapping_types_for_a_schema():
+    schema = make_schema()
+    type = type_from_ast(schema, get_variable_type_ast('[Int!]!'))
+    assert isinstance(type, GraphQLNonNull)
+    assert str(type) == '[Int!]!'
+
+    assert type_from_ast(schema, get_variable_type_ast('[Int!]!')) is type
+    assert type_from_ast(schema, get_variable_type_ast('[Int!]')) is type.of_type
+    assert get_wrapped_type(schema, GraphQLNonNull, GraphQLInt) is type.of_type.of_type
+
+    # Each schema has its own wrapping types.
+    assert type_from_ast(make_schema(), get_variable_type_ast('[Int!]!')) is not type
+
+
+def test_stops_keeping_wrapping_types_past_the_limit(monkeypatch):
+    monkeypatch.setattr(type_from_ast_module, 'MAX_WRAPPED_TYPES', 1)
+    schema = make_schema()
+    list_type = get_wrapped_type(schema, GraphQLList, GraphQLInt)
+    assert get_wrapped_type(schema, GraphQLList, GraphQLInt) is list_type
+
+    non_null_type = get_wrapped_type(schema, GraphQLNonNull, GraphQLInt)
+    assert str(non_null_type) == 'Int!'
+    assert get_wrapped_type(schema, GraphQLNonNull, GraphQLInt) is not non_null_type
@@ -1,7 +1,51 @@
+from weakref import WeakKeyDictionary
+
 from ..type.definition import (GraphQLInterfaceType, GraphQLList,
                                GraphQLNonNull, GraphQLObjectType,
                                GraphQLUnionType, is_abstract_type)
 
+# The relations between the abstract types of each schema.
+_schema_type_relations = WeakKeyDictionary()
+
+
+class TypeRelations(object):
+    """The names of the possible types of each abstract type of a schema, and
+    whether pairs of abstract types overlap, as they are first needed."""
+    __slots__ = 'possible_type_names', 'overlaps'
+
+    def __init__(self):
+        self.possible_type_names = {}
+        self.overlaps = {}
+
+    def get_possible_type_names(self, schema, abstract_type):
+        possible_type_names = self.possible_type_names.get(abstract_type.name)
+        if possible_type_names is None:
+            possible_type_names = self.possible_type_names[abstract_type.name] = frozenset(
+                possible_type.name for possible_type in schema.get_possible_types(abstract_type) or ())
+        return possible_type_names
+
+    def do_abstract_types_overlap(self, schema, t1, t2):
+        key = (t1.name, t2.name)
+        overlap = self.overlaps.get(key)
+        if overlap is None:
+            overlap = not self.get_possible_type_names(schema, t1).isdisjoint(
+                self.get_possible_type_names(schema, t2))
+            self.overlaps[key] = self.overlaps[t2.name, t1.name] = overlap
+        return overlap
+
+
+def get_type_relations(schema):
+    try:
+        relations = _schema_type_relations.get(schema)
+    except TypeError:
+        # Type maps, which check interface implementations with themselves as
+        # the schema, can't be hashed: their relations aren't kept.
+        return TypeRelations()
+
+    if relations is None:
+        relations = _schema_type_relations[schema] = TypeRelations()
+    return relations
+
 
 def is_equal_type(type_a, type_b):
     if type_a is type_b:
@@ -17,23 +61,28 @@ def is_equal_type(type_a, type_b):
 
 
 def is_type_sub_type_of(schema, maybe_subtype, super_type):
-    if maybe_subtype is super_type:
+    # Unwrap both types together, rather than recursing.
+    while maybe_subtype is not super_type:
+        if isinstance(super_type, GraphQLNonNull):
+            if not isinstance(maybe_subtype, GraphQLNonNull):
+                return False
+            super_type = super_type.of_type
+            maybe_subtype = maybe_subtype.of_type
+        elif isinstance(maybe_subtype, GraphQLNonNull):
+            maybe_subtype = maybe_subtype.of_type
+        elif isinstance(super_type, GraphQLList):
+            if not isinstance(maybe_subtype, GraphQLList):
+                return False
+            super_type = super_type.of_type
+            maybe_subtype = maybe_subtype.of_type
+        elif isinstance(maybe_subtype, GraphQLList):
+            return False
+        else:
+            break
+    else:
         return True
 
-    if isinstance(super_type, GraphQLNonNull):
-        if isinstance(maybe_subtype, GraphQLNonNull):
-            return is_type_sub_type_of(schema, maybe_subtype.of_type, super_type.of_type)
-        return False
-    elif isinstance(maybe_subtype, GraphQLNonNull):
-        return is_type_sub_type_of(schema, maybe_subtype.of_type, super_type)
-
-    if isinstance(super_type, GraphQLList):
-        if isinstance(maybe_subtype, GraphQLList):
-            return is_type_sub_type_of(schema, maybe_subtype.of_type, super_type.of_type)
-        return False
-    elif isinstance(maybe_subtype, GraphQLList):
-        return False
-
+    # The possible types of the schema are kept as sets, so this is a lookup.
     if is_abstract_type(super_type) and isinstance(
             maybe_subtype, GraphQLObjectType) and schema.is_possible_type(
             super_type, maybe_subtype):
@@ -43,27 +92,19 @@ def is_type_sub_type_of(schema, maybe_subtype, super_type):
 
 
 def do_types_overlap(schema, t1, t2):
-    # print 'do_types_overlap', t1, t2
-    if t1 == t2:
-        # print '1'
+    if t1 is t2:
         return True
 
     if isinstance(t1, (GraphQLInterfaceType, GraphQLUnionType)):
         if isinstance(t2, (GraphQLInterfaceType, GraphQLUnionType)):
             # If both types are abstract, then determine if there is any intersection
-            # between possible concrete types of each.
-            s = any([schema.is_possible_type(t2, type) for type in schema.get_possible_types(t1)])
-            # print '2',s
-            return s
+            # between possible concrete types of each. The result is kept for the
+            # schema, as fragment heavy documents ask again for the same pairs.
+            return get_type_relations(schema).do_abstract_types_overlap(schema, t1, t2)
         # Determine if the latter type is a possible concrete type of the former.
-        r = schema.is_possible_type(t1, t2)
-        # print '3', r
-        return r
+        return schema.is_possible_type(t1, t2)
 
     if isinstance(t2, (GraphQLInterfaceType, GraphQLUnionType)):
-        t = schema.is_possible_type(t2, t1)
-        # print '4', t
-        return t
+        return schema.is_possible_type(t2, t1)
 
-    # print '5'
     return False
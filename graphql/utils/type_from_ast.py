@@ -1,19 +1,48 @@
+from weakref import WeakKeyDictionary
+
 from ..language import ast
 from ..type.definition import GraphQLList, GraphQLNonNull
 
+# The list and non null types built for each schema, by wrapper and wrapped
+# type.
+_schema_wrapped_types = WeakKeyDictionary()
+
+# Past this many wrapping types for a schema, new ones are built without
+# being kept, so documents nesting lists ever deeper can't grow the cache
+# without bound.
+MAX_WRAPPED_TYPES = 10000
+
+
+def get_wrapped_type(schema, wrapper, of_type):
+    """Returns the canonical `wrapper(of_type)` of the schema, where wrapper
+    is GraphQLList or GraphQLNonNull, so the same wrapping type is only built
+    once and can be compared by identity."""
+    wrapped_types = _schema_wrapped_types.get(schema)
+    if wrapped_types is None:
+        wrapped_types = _schema_wrapped_types.setdefault(schema, {})
+
+    key = (wrapper, of_type)
+    wrapped_type = wrapped_types.get(key)
+    if wrapped_type is None:
+        wrapped_type = wrapper(of_type)
+        if len(wrapped_types) < MAX_WRAPPED_TYPES:
+            wrapped_type = wrapped_types.setdefault(key, wrapped_type)
+
+    return wrapped_type
+
 
 def type_from_ast(schema, input_type_ast):
     if isinstance(input_type_ast, ast.ListType):
         inner_type = type_from_ast(schema, input_type_ast.type)
         if inner_type:
-            return GraphQLList(inner_type)
+            return get_wrapped_type(schema, GraphQLList, inner_type)
         else:
             return None
 
     if isinstance(input_type_ast, ast.NonNullType):
         inner_type = type_from_ast(schema, input_type_ast.type)
         if inner_type:
-            return GraphQLNonNull(inner_type)
+            return get_wrapped_type(schema, GraphQLNonNull, inner_type)
         else:
             return None
 
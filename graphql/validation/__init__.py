@@ -1,4 +1,5 @@
 from .validation import validate
 from .rules import specified_rules
+from .validation_cache import ValidationCache
 
-__all__ = ['validate', 'specified_rules']
+__all__ = ['validate', 'specified_rules', 'ValidationCache']
@@ -7,6 +7,10 @@ from .known_directives import KnownDirectives
 from .known_fragment_names import KnownFragmentNames
 from .known_type_names import KnownTypeNames
 from .lone_anonymous_operation import LoneAnonymousOperation
+from .max_aliases import MaxAliases
+from .max_field_count import MaxFieldCount
+from .max_query_depth import MaxQueryDepth
+from .max_root_fields import MaxRootFields
 from .no_fragment_cycles import NoFragmentCycles
 from .no_undefined_variables import NoUndefinedVariables
 from .no_unused_fragments import NoUnusedFragments
@@ -60,6 +64,10 @@ __all__ = [
     'KnownFragmentNames',
     'KnownTypeNames',
     'LoneAnonymousOperation',
+    'MaxAliases',
+    'MaxFieldCount',
+    'MaxQueryDepth',
+    'MaxRootFields',
     'NoFragmentCycles',
     'UniqueVariableNames',
     'NoUndefinedVariables',
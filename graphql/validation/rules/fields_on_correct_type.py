@@ -5,7 +5,7 @@ from ...pyutils.ordereddict import OrderedDict
 from ...type.definition import (GraphQLInterfaceType, GraphQLObjectType,
                                 GraphQLUnionType)
 from ...utils.quoted_or_list import quoted_or_list
-from ...utils.suggestion_list import suggestion_list
+from ...utils.suggestion_list import get_suggestion_index
 from .base import ValidationRule
 
 try:
@@ -74,14 +74,14 @@ def get_suggested_type_names(schema, output_type, field_name):
         suggested_object_types = []
         interface_usage_count = OrderedDict()
         for possible_type in schema.get_possible_types(output_type):
-            if not possible_type.fields.get(field_name):
+            if not schema.get_fields(possible_type).get(field_name):
                 return
 
             # This object type defines this field.
             suggested_object_types.append(possible_type.name)
 
-            for possible_interface in possible_type.interfaces:
-                if not possible_interface.fields.get(field_name):
+            for possible_interface in schema.get_interfaces(possible_type):
+                if not schema.get_fields(possible_interface).get(field_name):
                     continue
 
                 # This interface type defines this field.
@@ -105,9 +105,7 @@ def get_suggested_field_names(schema, graphql_type, field_name):
     that may be the result of a typo.'''
 
     if isinstance(graphql_type, (GraphQLInterfaceType, GraphQLObjectType)):
-        possible_field_names = list(graphql_type.fields.keys())
-
-        return suggestion_list(field_name, possible_field_names)
+        return get_suggestion_index(schema, graphql_type).suggest(field_name)
 
     # Otherwise, must be a Union type, which does not define fields.
     return []
@@ -1,6 +1,6 @@
 from ...error import GraphQLError
 from ...utils.quoted_or_list import quoted_or_list
-from ...utils.suggestion_list import suggestion_list
+from ...utils.suggestion_list import get_suggestion_index
 from .base import ValidationRule
 
 
@@ -36,7 +36,7 @@ class KnownTypeNames(ValidationRule):
                 GraphQLError(
                     _unknown_type_message(
                         type_name,
-                        suggestion_list(type_name, list(schema.get_type_map().keys()))
+                        get_suggestion_index(schema).suggest(type_name)
                     ),
                     [node]
                 )
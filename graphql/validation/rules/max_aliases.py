@@ -0,0 +1,65 @@
+from ...error import GraphQLError
+from ...language import ast
+from ...language.visitor import BREAK
+from .base import ValidationRule
+
+
+class MaxAliases(ValidationRule):
+    """Limits the number of aliased fields in an operation.
+
+    The aliased fields of a fragment count each time the fragment is
+    spread. The limit is set by subclassing:
+
+        class MyMaxAliases(MaxAliases):
+            max_aliases = 10
+    """
+    __slots__ = 'fragment_aliases',
+
+    max_aliases = 30
+
+    def __init__(self, context):
+        super(MaxAliases, self).__init__(context)
+        self.fragment_aliases = {}
+
+    def enter_Document(self, node, key, parent, path, ancestors):
+        # The whole document is checked at once, before the other rules run.
+        for definition in node.definitions:
+            if isinstance(definition, ast.OperationDefinition) and \
+                    self.count_aliases(definition.selection_set) > self.max_aliases:
+                self.context.report_error(GraphQLError(self.max_aliases_message(self.max_aliases), [definition]))
+        return BREAK
+
+    def count_aliases(self, selection_set):
+        """Counts the aliased fields of a selection set with its fragment spreads
+        expanded, stopping once past the limit."""
+        aliases = 0
+        selection_sets = [selection_set]
+        while selection_sets:
+            for selection in selection_sets.pop().selections:
+                if isinstance(selection, ast.FragmentSpread):
+                    aliases += self.count_fragment_aliases(selection.name.value)
+                else:
+                    if isinstance(selection, ast.Field) and selection.alias:
+                        aliases += 1
+                    if selection.selection_set:
+                        selection_sets.append(selection.selection_set)
+
+                if aliases > self.max_aliases:
+                    return aliases
+        return aliases
+
+    def count_fragment_aliases(self, fragment_name):
+        aliases = self.fragment_aliases.get(fragment_name)
+        if aliases is None:
+            # A fragment spreading itself adds nothing while it is counted.
+            self.fragment_aliases[fragment_name] = 0
+            fragment = self.context.get_fragment(fragment_name)
+            # Unknown fragments are reported by another rule.
+            aliases = self.fragment_aliases[fragment_name] = \
+                self.count_aliases(fragment.selection_set) if fragment else 0
+
+        return aliases
+
+    @staticmethod
+    def max_aliases_message(max_aliases):
+        return 'Operation has more than the maximum of {} aliased fields.'.format(max_aliases)
@@ -0,0 +1,73 @@
+from ...error import GraphQLError
+from ...language import ast
+from ...language.visitor import BREAK
+from .base import ValidationRule
+
+
+class MaxFieldCount(ValidationRule):
+    """Limits the number of fields an operation selects, counting the fields
+    of a fragment once for every place it's spread in.
+
+    The limit is set by subclassing:
+
+        class MyMaxFieldCount(MaxFieldCount):
+            max_fields = 500
+    """
+    __slots__ = 'fragment_field_counts',
+
+    max_fields = 1000
+
+    def __init__(self, context):
+        super(MaxFieldCount, self).__init__(context)
+        self.fragment_field_counts = {}
+
+    def enter_Document(self, node, key, parent, path, ancestors):
+        # The whole document is checked at once, before the other rules run.
+        for definition in node.definitions:
+            if isinstance(definition, ast.OperationDefinition):
+                if self.count_fields(definition.selection_set, set()) > self.max_fields:
+                    self.context.report_error(GraphQLError(
+                        self.max_fields_message(definition.name and definition.name.value, self.max_fields),
+                        [definition]
+                    ))
+        return BREAK
+
+    def count_fields(self, selection_set, visited_fragments):
+        """Counts the fields of a selection set with its fragment spreads
+        expanded, stopping once past the limit."""
+        count = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                count += 1
+                if selection.selection_set:
+                    count += self.count_fields(selection.selection_set, visited_fragments)
+            elif isinstance(selection, ast.InlineFragment):
+                count += self.count_fields(selection.selection_set, visited_fragments)
+            else:
+                count += self.count_fragment_fields(selection.name.value, visited_fragments)
+
+            if count > self.max_fields:
+                return count
+
+        return count
+
+    def count_fragment_fields(self, fragment_name, visited_fragments):
+        count = self.fragment_field_counts.get(fragment_name)
+        if count is None:
+            fragment = self.context.get_fragment(fragment_name)
+            # Unknown fragments and cycles are reported by other rules.
+            if not fragment or fragment_name in visited_fragments:
+                return 0
+
+            visited_fragments.add(fragment_name)
+            count = self.fragment_field_counts[fragment_name] = self.count_fields(
+                fragment.selection_set, visited_fragments)
+            visited_fragments.discard(fragment_name)
+
+        return count
+
+    @staticmethod
+    def max_fields_message(operation_name, max_fields):
+        if operation_name:
+            return 'Operation "{}" selects more than the maximum of {} fields.'.format(operation_name, max_fields)
+        return 'Anonymous operation selects more than the maximum of {} fields.'.format(max_fields)
@@ -0,0 +1,72 @@
+from ...error import GraphQLError
+from ...language import ast
+from ...language.visitor import BREAK
+from .base import ValidationRule
+
+
+class MaxQueryDepth(ValidationRule):
+    """Limits how deeply the fields of an operation are nested, following
+    fragment spreads. The fields of the root selection set have a depth of 1.
+
+    The limit is set by subclassing:
+
+        class MyMaxQueryDepth(MaxQueryDepth):
+            max_depth = 10
+    """
+    __slots__ = 'fragment_depths',
+
+    max_depth = 15
+
+    def __init__(self, context):
+        super(MaxQueryDepth, self).__init__(context)
+        self.fragment_depths = {}
+
+    def enter_Document(self, node, key, parent, path, ancestors):
+        # The whole document is checked at once, before the other rules run.
+        for definition in node.definitions:
+            if isinstance(definition, ast.OperationDefinition):
+                if self.get_depth(definition.selection_set, set()) > self.max_depth:
+                    self.context.report_error(GraphQLError(
+                        self.max_depth_message(definition.name and definition.name.value, self.max_depth),
+                        [definition]
+                    ))
+        return BREAK
+
+    def get_depth(self, selection_set, visited_fragments):
+        depth = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                selection_depth = 1
+                if selection.selection_set:
+                    selection_depth += self.get_depth(selection.selection_set, visited_fragments)
+            elif isinstance(selection, ast.InlineFragment):
+                selection_depth = self.get_depth(selection.selection_set, visited_fragments)
+            else:
+                selection_depth = self.get_fragment_depth(selection.name.value, visited_fragments)
+
+            depth = max(depth, selection_depth)
+            # No need to look further once the limit is exceeded.
+            if depth > self.max_depth:
+                break
+
+        return depth
+
+    def get_fragment_depth(self, fragment_name, visited_fragments):
+        depth = self.fragment_depths.get(fragment_name)
+        if depth is None:
+            fragment = self.context.get_fragment(fragment_name)
+            # Unknown fragments and cycles are reported by other rules.
+            if not fragment or fragment_name in visited_fragments:
+                return 0
+
+            visited_fragments.add(fragment_name)
+            depth = self.fragment_depths[fragment_name] = self.get_depth(fragment.selection_set, visited_fragments)
+            visited_fragments.discard(fragment_name)
+
+        return depth
+
+    @staticmethod
+    def max_depth_message(operation_name, max_depth):
+        if operation_name:
+            return 'Operation "{}" exceeds the maximum query depth of {}.'.format(operation_name, max_depth)
+        return 'Anonymous operation exceeds the maximum query depth of {}.'.format(max_depth)
@@ -0,0 +1,52 @@
+from ...error import GraphQLError
+from ...language import ast
+from ...language.visitor import BREAK
+from .base import ValidationRule
+
+
+class MaxRootFields(ValidationRule):
+    """Limits the number of fields in the root selection set of an operation,
+    including those of the fragments it spreads.
+
+    The limit is set by subclassing:
+
+        class MyMaxRootFields(MaxRootFields):
+            max_root_fields = 5
+    """
+    __slots__ = ()
+
+    max_root_fields = 20
+
+    def enter_Document(self, node, key, parent, path, ancestors):
+        # The whole document is checked at once, before the other rules run.
+        for definition in node.definitions:
+            if isinstance(definition, ast.OperationDefinition):
+                if self.count_root_fields(definition.selection_set, set()) > self.max_root_fields:
+                    self.context.report_error(GraphQLError(
+                        self.max_root_fields_message(definition.name and definition.name.value,
+                                                     self.max_root_fields),
+                        [definition]
+                    ))
+        return BREAK
+
+    def count_root_fields(self, selection_set, visited_fragments):
+        count = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                count += 1
+            elif isinstance(selection, ast.InlineFragment):
+                count += self.count_root_fields(selection.selection_set, visited_fragments)
+            elif selection.name.value not in visited_fragments:
+                visited_fragments.add(selection.name.value)
+                fragment = self.context.get_fragment(selection.name.value)
+                if fragment:
+                    count += self.count_root_fields(fragment.selection_set, visited_fragments)
+
+        return count
+
+    @staticmethod
+    def max_root_fields_message(operation_name, max_root_fields):
+        if operation_name:
+            return 'Operation "{}" has more than the maximum of {} root fields.'.format(
+                operation_name, max_root_fields)
+        return 'Anonymous operation has more than the maximum of {} root fields.'.format(max_root_fields)
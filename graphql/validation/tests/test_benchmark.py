@@ -0,0 +1,78 @@
+from graphql import parse
+from graphql.utils.build_ast_schema import build_ast_schema
+from graphql.validation import validate
+from graphql.validation.rules import (OverlappingFieldsCanBeMerged,
+                                      PossibleFragmentSpreads)
+
+from .utils import test_schema
+
+# Pathological documents for OverlappingFieldsCanBeMerged, whose cost grows
+# with the square of the fields sharing a response name.
+
+
+def validate_overlapping_fields(benchmark, query):
+    ast = parse(query)
+
+    @benchmark
+    def b():
+        return validate(test_schema, ast, [OverlappingFieldsCanBeMerged])
+
+    assert not b
+
+
+def test_many_repeated_fields(benchmark):
+    validate_overlapping_fields(
+        benchmark,
+        '{ dog { ' + ' '.join('name(surname: true)' for _ in range(300)) + ' } }'
+    )
+
+
+def test_many_repeated_fields_with_selections(benchmark):
+    validate_overlapping_fields(
+        benchmark,
+        '{ ' + ' '.join('dog { name barkVolume }' for _ in range(200)) + ' }'
+    )
+
+
+def test_many_aliased_fields(benchmark):
+    validate_overlapping_fields(
+        benchmark,
+        '{ dog { ' + ' '.join('a{}: name'.format(i) for i in range(1000)) + ' } }'
+    )
+
+
+def test_fragments_spread_through_many_paths(benchmark):
+    depth = 20
+    fragments = ''.join('''
+    fragment F{0} on Dog {{ name ...G{1} ...H{1} }}
+    fragment G{1} on Dog {{ barkVolume ...F{1} }}
+    fragment H{1} on Dog {{ nickname ...F{1} }}
+    '''.format(i, i + 1) for i in range(depth))
+    validate_overlapping_fields(
+        benchmark,
+        '{{ dog {{ ...F0 }} }}{}fragment F{} on Dog {{ name }}'.format(fragments, depth)
+    )
+
+
+def test_many_abstract_fragment_spreads(benchmark):
+    # Spreads between abstract types with many possible types.
+    size = 1000
+    schema = build_ast_schema(parse('''
+      schema {{ query: Query }}
+      interface Node {{ id: ID }}
+      interface Named {{ name: String }}
+      {}
+      union Everything = {}
+      type Query {{ node: Node }}
+    '''.format(
+        '\n'.join('type T{} implements Node, Named {{ id: ID name: String }}'.format(i) for i in range(size)),
+        ' | '.join('T{}'.format(i) for i in range(size)),
+    )))
+    ast = parse('{ node { ' + ' '.join(
+        '...on Everything {{ ...on Named {{ n{0}: name }} }}'.format(i) for i in range(100)) + ' } }')
+
+    @benchmark
+    def b():
+        return validate(schema, ast, [PossibleFragmentSpreads])
+
+    assert not b
@@ -0,0 +1,108 @@
+from graphql.language.location import SourceLocation
+from graphql.validation.rules import MaxAliases
+
+from .utils import expect_fails_rule, expect_passes_rule
+
+
+class MaxAliases2(MaxAliases):
+    max_aliases = 2
+
+
+def too_many_aliases(line, column):
+    return {
+        'message': MaxAliases.max_aliases_message(2),
+        'locations': [SourceLocation(line, column)]
+    }
+
+
+def test_operations_within_the_limit():
+    expect_passes_rule(MaxAliases2, '''
+      {
+        a: dog {
+          name
+          barkVolume
+        }
+        dog {
+          b: name
+        }
+      }
+      query Other {
+        a: dog { ...dogFields }
+      }
+      fragment dogFields on Dog {
+        b: name
+      }
+      fragment unusedFields on Dog {
+        c: name
+        d: name
+        e: name
+      }
+    ''')
+
+
+def test_too_many_aliases_in_nested_selection_sets():
+    expect_fails_rule(MaxAliases2, '''
+      {
+        a: dog {
+          name
+          ... on Dog {
+            b: name
+          }
+        }
+        dog {
+          c: name
+        }
+      }
+    ''', [too_many_aliases(2, 7)])
+
+
+def test_too_many_aliases_in_fragments_spread_several_times():
+    expect_fails_rule(MaxAliases2, '''
+      query Once {
+        dog { ...dogFields }
+      }
+      query Twice {
+        dog { ...dogFields }
+        pet { ... on Dog { ...dogFields } }
+      }
+      fragment dogFields on Dog {
+        a: name
+        b: nickname
+      }
+    ''', [too_many_aliases(5, 7)])
+
+
+def test_counts_fragments_spread_through_many_paths_once():
+    # Each fragment spreads the next one twice, which would be counted
+    # 2 ** 30 times without keeping the count of each fragment.
+    depth = 30
+    fragments = ''.join('''
+      fragment F{0} on Dog {{ ...F{1} ...F{1} }}
+    '''.format(i, i + 1) for i in range(depth))
+    expect_fails_rule(MaxAliases2, '''
+      {{
+        dog {{ ...F0 }}
+      }}
+      {}
+      fragment F{} on Dog {{ a: name }}
+    '''.format(fragments, depth), [too_many_aliases(2, 7)])
+
+
+def test_fragments_spreading_themselves():
+    expect_passes_rule(MaxAliases2, '''
+      {
+        dog { ...dogFields }
+      }
+      fragment dogFields on Dog {
+        a: name
+        ...dogFields
+      }
+    ''')
+
+
+def test_ignores_unknown_fragments():
+    expect_passes_rule(MaxAliases2, '''
+      {
+        dog { ...unknownFields a: name }
+      }
+    ''')
@@ -0,0 +1,131 @@
+from graphql.language.location import SourceLocation
+from graphql.validation.rules import MaxFieldCount
+
+from .utils import expect_fails_rule, expect_passes_rule
+
+
+class MaxFieldCount4(MaxFieldCount):
+    max_fields = 4
+
+
+def too_many_fields(operation_name, line, column):
+    return {
+        'message': MaxFieldCount.max_fields_message(operation_name, 4),
+        'locations': [SourceLocation(line, column)]
+    }
+
+
+def test_operations_within_the_limit():
+    expect_passes_rule(MaxFieldCount4, '''
+      query Foo {
+        dog {
+          name
+          ... on Dog {
+            barkVolume
+          }
+        }
+      }
+      query Bar {
+        human {
+          ...humanFields
+        }
+      }
+      fragment humanFields on Human {
+        name
+        iq
+      }
+    ''')
+
+
+def test_too_many_fields():
+    expect_fails_rule(MaxFieldCount4, '''
+      {
+        dog {
+          name
+          nickname
+          barkVolume
+          ... on Dog {
+            isHousetrained
+          }
+        }
+      }
+    ''', [too_many_fields(None, 2, 7)])
+
+
+def test_counts_fragments_for_every_spread():
+    expect_passes_rule(MaxFieldCount4, '''
+      query Foo {
+        dog {
+          ...dogFields
+        }
+        otherDog: dog {
+          ...dogFields
+        }
+      }
+      fragment dogFields on Dog {
+        name
+      }
+    ''')
+    expect_fails_rule(MaxFieldCount4, '''
+      query Foo {
+        dog {
+          ...dogFields
+        }
+        otherDog: dog {
+          ...dogFields
+        }
+      }
+      fragment dogFields on Dog {
+        name
+        nickname
+      }
+    ''', [too_many_fields('Foo', 2, 7)])
+
+
+def test_ignores_unknown_fragments_and_cycles():
+    expect_passes_rule(MaxFieldCount4, '''
+      {
+        dog {
+          ...unknownFields
+          ...dogFields
+        }
+      }
+      fragment dogFields on Dog {
+        name
+        ...dogFields
+      }
+    ''')
+
+
+def test_stops_counting_once_past_the_limit():
+    counted_fragments = []
+
+    class RecordingMaxFieldCount(MaxFieldCount4):
+        def count_fragment_fields(self, fragment_name, visited_fragments):
+            counted_fragments.append(fragment_name)
+            return super(RecordingMaxFieldCount, self).count_fragment_fields(fragment_name, visited_fragments)
+
+    expect_fails_rule(RecordingMaxFieldCount, '''
+      {
+        dog {
+          ...dogFields
+        }
+        otherDog: dog {
+          ...dogFields
+        }
+      }
+      fragment dogFields on Dog {
+        name
+        nickname
+        barkVolume
+        isHousetrained
+        doesKnowCommand
+        owner {
+          ...humanFields
+        }
+      }
+      fragment humanFields on Human {
+        name
+      }
+    ''', [too_many_fields(None, 2, 7)])
+    assert counted_fragments == ['dogFields']
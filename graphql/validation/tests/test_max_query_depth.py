@@ -0,0 +1,104 @@
+from graphql.language.location import SourceLocation
+from graphql.validation.rules import MaxQueryDepth
+
+from .utils import expect_fails_rule, expect_passes_rule
+
+
+class MaxQueryDepth2(MaxQueryDepth):
+    max_depth = 2
+
+
+def too_deep(operation_name, line, column):
+    return {
+        'message': MaxQueryDepth.max_depth_message(operation_name, 2),
+        'locations': [SourceLocation(line, column)]
+    }
+
+
+def test_operations_within_the_limit():
+    expect_passes_rule(MaxQueryDepth2, '''
+      query Foo {
+        dog {
+          name
+        }
+        ... on QueryRoot {
+          human {
+            ...humanFields
+          }
+        }
+      }
+      fragment humanFields on Human {
+        name
+      }
+    ''')
+
+
+def test_too_deep_named_operation():
+    expect_fails_rule(MaxQueryDepth2, '''
+      query Foo {
+        dog {
+          owner {
+            name
+          }
+        }
+      }
+    ''', [too_deep('Foo', 2, 7)])
+
+
+def test_too_deep_anonymous_operation():
+    expect_fails_rule(MaxQueryDepth2, '''
+      {
+        ... on QueryRoot {
+          human {
+            pets {
+              name
+            }
+          }
+        }
+      }
+    ''', [too_deep(None, 2, 7)])
+
+
+def test_follows_fragment_spreads():
+    expect_fails_rule(MaxQueryDepth2, '''
+      query Foo {
+        dog {
+          name
+        }
+      }
+      query Bar {
+        human {
+          ...humanFields
+        }
+      }
+      fragment humanFields on Human {
+        pets {
+          ...petFields
+        }
+      }
+      fragment petFields on Pet {
+        name
+      }
+    ''', [too_deep('Bar', 7, 7)])
+
+
+def test_ignores_fragment_cycles():
+    expect_passes_rule(MaxQueryDepth2, '''
+      {
+        dog {
+          ...dogFields
+        }
+      }
+      fragment dogFields on Dog {
+        ...dogFields
+      }
+    ''')
+
+
+def test_default_limit():
+    selection_set = '{ ' + 'a { ' * 14 + 'b' + ' }' * 15
+    expect_passes_rule(MaxQueryDepth, '\n  query Deep ' + selection_set)
+    expect_fails_rule(MaxQueryDepth, '\n  query Deep { a ' + selection_set + ' }', [{
+        'message': MaxQueryDepth.max_depth_message('Deep', 15),
+        'locations': [SourceLocation(2, 3)]
+    }])
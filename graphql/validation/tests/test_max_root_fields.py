@@ -0,0 +1,68 @@
+from graphql.language.location import SourceLocation
+from graphql.validation.rules import MaxRootFields
+
+from .utils import expect_fails_rule, expect_passes_rule
+
+
+class MaxRootFields2(MaxRootFields):
+    max_root_fields = 2
+
+
+def too_many_root_fields(operation_name, line, column):
+    return {
+        'message': MaxRootFields.max_root_fields_message(operation_name, 2),
+        'locations': [SourceLocation(line, column)]
+    }
+
+
+def test_operations_within_the_limit():
+    expect_passes_rule(MaxRootFields2, '''
+      query Foo {
+        dog {
+          name
+          nickname
+          barkVolume
+        }
+        human {
+          name
+        }
+      }
+    ''')
+
+
+def test_too_many_root_fields():
+    expect_fails_rule(MaxRootFields2, '''
+      {
+        dog {
+          name
+        }
+        human {
+          name
+        }
+        pet {
+          name
+        }
+      }
+    ''', [too_many_root_fields(None, 2, 7)])
+
+
+def test_follows_fragments():
+    expect_fails_rule(MaxRootFields2, '''
+      query Foo {
+        dog {
+          name
+        }
+        ... on QueryRoot {
+          ...rootFields
+        }
+      }
+      fragment rootFields on QueryRoot {
+        human {
+          name
+        }
+        pet {
+          name
+        }
+        ...rootFields
+      }
+    ''', [too_many_root_fields('Foo', 2, 7)])
@@ -779,3 +779,58 @@ def test_error_message_contains_hint_for_alias_conflict():
         'if this was intentional.'
     )
     assert error == hint
+
+
+def test_compares_fragments_spread_through_many_paths_once():
+    # Each fragment spreads the next one twice, through two other fragments,
+    # which would take 2 ** 30 comparisons without memoization.
+    depth = 30
+    fragments = ''.join('''
+    fragment F{0} on Dog {{ name ...G{1} ...H{1} }}
+    fragment G{1} on Dog {{ barkVolume ...F{1} }}
+    fragment H{1} on Dog {{ nickname ...F{1} }}
+    '''.format(i, i + 1) for i in range(depth))
+    expect_passes_rule(OverlappingFieldsCanBeMerged, '''
+    {{
+        dog {{ ...F0 }}
+    }}
+    {}
+    fragment F{} on Dog {{ name }}
+    '''.format(fragments, depth))
+
+
+def test_reports_when_the_comparison_budget_is_exceeded():
+    class BoundedOverlappingFieldsCanBeMerged(OverlappingFieldsCanBeMerged):
+        max_comparisons = 10
+
+    expect_passes_rule(BoundedOverlappingFieldsCanBeMerged, '''
+    {
+        dog { name name name name name }
+    }
+    ''')
+    expect_fails_rule(BoundedOverlappingFieldsCanBeMerged, '''
+    {
+        dog { name name name name name name }
+    }
+    ''', [{
+        'message': OverlappingFieldsCanBeMerged.too_many_comparisons_message(10),
+        'locations': [L(3, 13)],
+    }])
+
+
+def test_reports_conflicts_with_shared_fragments_in_each_operation():
+    expect_fails_rule(OverlappingFieldsCanBeMerged, '''
+    query A { ...P dog { ...G } }
+    query B { ...P dog { ...G } }
+    fragment P on QueryRoot { dog { d: name } }
+    fragment G on Dog { d: barkVolume }
+    ''', [
+        fields_conflict(
+            'dog', [['d', 'name and barkVolume are different fields']],
+            L(2, 20), L(4, 37), L(4, 31), L(5, 25)
+        ),
+        fields_conflict(
+            'dog', [['d', 'name and barkVolume are different fields']],
+            L(3, 20), L(4, 37), L(4, 31), L(5, 25)
+        ),
+    ], sort_list=False)
@@ -1,6 +1,7 @@
-from graphql import parse, validate
+from graphql import graphql, parse, validate
 from graphql.utils.type_info import TypeInfo
-from graphql.validation.rules import specified_rules
+from graphql.validation.rules import MaxRootFields, specified_rules
+from graphql.validation.rules.base import ValidationRule
 from graphql.validation.validation import visit_using_rules
 
 from .utils import test_schema
@@ -53,3 +54,52 @@ def test_validates_using_a_custom_type_info():
     assert errors[0].message == 'Cannot query field "catOrDog" on type "QueryRoot". Did you mean "catOrDog"?'
     assert errors[1].message == 'Cannot query field "furColor" on type "Cat". Did you mean "furColor"?'
     assert errors[2].message == 'Cannot query field "isHousetrained" on type "Dog". Did you mean "isHousetrained"?'
+
+
+def test_stops_after_max_errors():
+    ast = parse('{ dog { a b c } cat { d } }')
+
+    assert len(validate(test_schema, ast)) == 4
+    errors = validate(test_schema, ast, max_errors=2)
+    assert [error.message for error in errors] == [
+        'Cannot query field "a" on type "Dog".',
+        'Cannot query field "b" on type "Dog".',
+    ]
+
+
+def test_fails_fast_before_visiting_the_rest_of_the_document():
+    visited = []
+
+    class VisitedFields(ValidationRule):
+        def enter_Field(self, node, *args):
+            visited.append(node.name.value)
+
+    ast = parse('{ dog { unknown } cat { name } }')
+    errors = validate(test_schema, ast, specified_rules + [VisitedFields], max_errors=1)
+
+    assert len(errors) == 1
+    assert visited == ['dog', 'unknown']
+
+
+def test_limiting_rules_fail_fast_without_a_traversal():
+    visited = []
+
+    class VisitedFields(ValidationRule):
+        def enter_Field(self, node, *args):
+            visited.append(node.name.value)
+
+    class MaxRootField(MaxRootFields):
+        max_root_fields = 1
+
+    errors = validate(test_schema, parse('{ dog { name } cat { name } }'),
+                      [MaxRootField, VisitedFields], max_errors=1)
+
+    assert len(errors) == 1
+    assert visited == []
+
+
+def test_graphql_limits_validation_errors():
+    result = graphql(test_schema, '{ dog { a b } }', max_validation_errors=1)
+
+    assert result.invalid
+    assert len(result.errors) == 1
@@ -0,0 +1,89 @@
+import gc
+
+from graphql import graphql
+from graphql.language.parser import parse
+from graphql.type import (GraphQLField, GraphQLObjectType, GraphQLSchema,
+                          GraphQLString)
+from graphql.validation import ValidationCache, specified_rules
+from graphql.validation.rules import NoUnusedFragments
+
+from .utils import test_schema
+
+
+def test_caches_validation_errors_per_document():
+    cache = ValidationCache()
+    errors = cache.validate(test_schema, parse('{ dog { unknown } }'))
+
+    assert len(errors) == 1
+    assert cache.validate(test_schema, parse('{ dog { unknown } }')) == errors
+    assert cache.validate(test_schema, parse('{ dog { name } }')) == []
+    assert cache.validate(test_schema, parse('{ dog { name } }')) == []
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+
+def test_returned_errors_do_not_alter_the_cache():
+    cache = ValidationCache()
+    cache.validate(test_schema, parse('{ dog { name } }')).append('error')
+
+    assert cache.validate(test_schema, parse('{ dog { name } }')) == []
+
+
+def test_keys_by_rules():
+    cache = ValidationCache()
+    ast = parse('{ dog { name } } fragment f on Dog { name }')
+
+    assert len(cache.validate(test_schema, ast)) == 1
+    assert cache.validate(test_schema, ast, [r for r in specified_rules if r is not NoUnusedFragments]) == []
+    assert cache.misses == 2
+
+
+def test_keys_documents_without_source_by_their_printed_form():
+    cache = ValidationCache()
+    cache.validate(test_schema, parse('{ dog { name } }', no_location=True))
+    cache.validate(test_schema, parse('{dog{name}}', no_location=True))
+
+    assert cache.hits == 1
+
+
+def test_evicts_least_recently_used_results():
+    cache = ValidationCache(max_size=2)
+    for query in ['{ dog { name } }', '{ cat { name } }', '{ dog { name } }', '{ human { name } }']:
+        cache.validate(test_schema, parse(query))
+
+    assert len(cache.schemas[test_schema]) == 2
+    cache.validate(test_schema, parse('{ dog { name } }'))
+    assert cache.hits == 2
+
+
+def test_results_are_dropped_with_their_schema():
+    cache = ValidationCache()
+    schema = GraphQLSchema(GraphQLObjectType('Query', {'a': GraphQLField(GraphQLString)}))
+    cache.validate(schema, parse('{ a }'))
+    cache.validate(test_schema, parse('{ a }'))
+    assert len(cache.schemas) == 2
+
+    del schema
+    gc.collect()
+    assert len(cache.schemas) == 1
+
+
+def test_graphql_uses_the_validation_cache():
+    cache = ValidationCache()
+
+    for _ in range(3):
+        result = graphql(test_schema, '{ dog { unknown } }', validation_cache=cache)
+        assert result.invalid
+        assert len(result.errors) == 1
+
+    assert cache.hits == 2
+    assert cache.misses == 1
+
+
+def test_keys_by_max_errors():
+    cache = ValidationCache()
+    ast = parse('{ dog { a b } }')
+
+    assert len(cache.validate(test_schema, ast)) == 2
+    assert len(cache.validate(test_schema, ast, max_errors=1)) == 1
+    assert cache.misses == 2
@@ -1,24 +1,58 @@
 from ..language.ast import (FragmentDefinition, FragmentSpread,
                             OperationDefinition)
-from ..language.visitor import ParallelVisitor, TypeInfoVisitor, Visitor, visit
+from ..language.visitor import (BREAK, ParallelVisitor, TypeInfoVisitor,
+                                Visitor, visit)
 from ..type import GraphQLSchema
 from ..utils.type_info import TypeInfo
 from .rules import specified_rules
 
 
-def validate(schema, ast, rules=specified_rules):
+def validate(schema, ast, rules=specified_rules, max_errors=None):
+    """Returns the errors of the document, validated against the schema.
+
+    With `max_errors`, validation stops as soon as that many errors were
+    reported: `max_errors=1` fails fast, when it only matters whether the
+    document is valid."""
     assert schema, 'Must provide schema'
     assert ast, 'Must provide document'
     assert isinstance(schema, GraphQLSchema)
+    assert max_errors is None or max_errors > 0, 'max_errors must be a positive number.'
     type_info = TypeInfo(schema)
-    return visit_using_rules(schema, type_info, ast, rules)
+    return visit_using_rules(schema, type_info, ast, rules, max_errors)
+
+
+def visit_using_rules(schema, type_info, ast, rules, max_errors=None):
+    context = ValidationContext(schema, ast, type_info, max_errors)
+    # The variable usages are collected along the way, before the rules
+    # leave the definition they belong to.
+    visitors = [DefinitionUsageVisitor(context, type_info)] + [rule(context) for rule in rules]
+    visitor = ParallelVisitor(visitors)
+    if max_errors is not None:
+        visitor = ErrorBudgetVisitor(context, visitor)
+    visit(ast, TypeInfoVisitor(type_info, visitor))
+    return context.get_errors()
 
 
-def visit_using_rules(schema, type_info, ast, rules):
-    context = ValidationContext(schema, ast, type_info)
-    visitors = [rule(context) for rule in rules]
-    visit(ast, TypeInfoVisitor(type_info, ParallelVisitor(visitors)))
-    return context.get_errors()
+class ErrorBudgetVisitor(Visitor):
+    """Stops the traversal once the context reached its maximum number of
+    errors."""
+    __slots__ = 'context', 'visitor'
+
+    def __init__(self, context, visitor):
+        self.context = context
+        self.visitor = visitor
+
+    def enter(self, node, key, parent, path, ancestors):
+        result = self.visitor.enter(node, key, parent, path, ancestors)
+        if self.context.is_done():
+            return BREAK
+        return result
+
+    def leave(self, node, key, parent, path, ancestors):
+        result = self.visitor.leave(node, key, parent, path, ancestors)
+        if self.context.is_done():
+            return BREAK
+        return result
 
 
 class VariableUsage(object):
@@ -44,15 +78,35 @@ class UsageVisitor(Visitor):
         self.usages.append(usage)
 
 
+class DefinitionUsageVisitor(UsageVisitor):
+    """Collects the variable usages of operations and fragments during the
+    validation pass, so that the context doesn't visit them again."""
+    __slots__ = 'context',
+
+    def __init__(self, context, type_info):
+        super(DefinitionUsageVisitor, self).__init__([], type_info)
+        self.context = context
+
+    def enter_OperationDefinition(self, node, key, parent, path, ancestors):
+        self.usages = []
+
+    def leave_OperationDefinition(self, node, key, parent, path, ancestors):
+        self.context.set_variable_usages(node, self.usages)
+
+    enter_FragmentDefinition = enter_OperationDefinition
+    leave_FragmentDefinition = leave_OperationDefinition
+
+
 class ValidationContext(object):
-    __slots__ = ('_schema', '_ast', '_type_info', '_errors', '_fragments', '_fragment_spreads',
+    __slots__ = ('_schema', '_ast', '_type_info', '_errors', '_max_errors', '_fragments', '_fragment_spreads',
                  '_recursively_referenced_fragments', '_variable_usages', '_recursive_variable_usages')
 
-    def __init__(self, schema, ast, type_info):
+    def __init__(self, schema, ast, type_info, max_errors=None):
         self._schema = schema
         self._ast = ast
         self._type_info = type_info
         self._errors = []
+        self._max_errors = max_errors
         self._fragments = None
         self._fragment_spreads = {}
         self._recursively_referenced_fragments = {}
@@ -60,7 +114,12 @@ class ValidationContext(object):
         self._recursive_variable_usages = {}
 
     def report_error(self, error):
-        self._errors.append(error)
+        # Errors past the budget, reported before the traversal stops, are dropped.
+        if not self.is_done():
+            self._errors.append(error)
+
+    def is_done(self):
+        return self._max_errors is not None and len(self._errors) >= self._max_errors
 
     def get_errors(self):
         return self._errors
@@ -78,11 +137,14 @@ class ValidationContext(object):
 
         return usages
 
+    def set_variable_usages(self, node, usages):
+        self._variable_usages.setdefault(node, usages)
+
     def get_recursive_variable_usages(self, operation):
         assert isinstance(operation, OperationDefinition)
         usages = self._recursive_variable_usages.get(operation)
         if usages is None:
-            usages = self.get_variable_usages(operation)
+            usages = list(self.get_variable_usages(operation))
             fragments = self.get_recursively_referenced_fragments(operation)
             for fragment in fragments:
                 usages.extend(self.get_variable_usages(fragment))
@@ -93,7 +155,7 @@ class ValidationContext(object):
     def get_recursively_referenced_fragments(self, operation):
         assert isinstance(operation, OperationDefinition)
         fragments = self._recursively_referenced_fragments.get(operation)
-        if not fragments:
+        if fragments is None:
             fragments = []
             collected_names = set()
             nodes_to_visit = [operation.selection_set]
@@ -113,7 +175,7 @@ class ValidationContext(object):
 
     def get_fragment_spreads(self, node):
         spreads = self._fragment_spreads.get(node)
-        if not spreads:
+        if spreads is None:
             spreads = []
             sets_to_visit = [node]
             while sets_to_visit:
@@ -0,0 +1,71 @@
+from threading import Lock
+from weakref import WeakKeyDictionary
+
+from ..language.printer import print_ast
+from ..pyutils.ordereddict import OrderedDict
+from .rules import specified_rules
+from .validation import validate
+
+__all__ = ['ValidationCache']
+
+
+def get_document_key(ast):
+    loc = ast.loc
+    if loc is not None and loc.source is not None:
+        return loc.source.body
+    # Documents parsed without their source are keyed by their printed form.
+    return print_ast(ast)
+
+
+class ValidationCache(object):
+    """Caches the validation errors of documents, per schema.
+
+    Results are keyed by the document (its source body, or its printed form
+    if it was parsed without a source), the rules it was validated with and
+    the maximum number of errors, and kept in a bounded LRU for each schema.
+    A schema's results go away with the schema, so replacing a schema by a
+    new one (for example with `extend_schema`) never reuses stale results.
+    Schemas must not be mutated in place once they are used with the cache.
+
+    Example:
+
+        validation_cache = ValidationCache(max_size=500)
+        graphql(schema, request_string, validation_cache=validation_cache)
+    """
+
+    def __init__(self, max_size=1000):
+        assert max_size > 0, 'ValidationCache must hold at least one result.'
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+        self.schemas = WeakKeyDictionary()
+
+    def validate(self, schema, ast, rules=specified_rules, max_errors=None):
+        key = (get_document_key(ast), tuple(rules), max_errors)
+        with self.lock:
+            results = self.schemas.get(schema)
+            if results is None:
+                results = self.schemas[schema] = OrderedDict()
+
+            errors = results.pop(key, None)
+            if errors is not None:
+                # Re-insert the result so it's the most recently used.
+                results[key] = errors
+                self.hits += 1
+                return list(errors)
+            self.misses += 1
+
+        errors = validate(schema, ast, rules, max_errors)
+
+        with self.lock:
+            results[key] = list(errors)
+            while len(results) > self.max_size:
+                results.popitem(last=False)
+        return errors
+
+    def clear(self):
+        with self.lock:
+            self.schemas.clear()
+            self.hits = 0
+            self.misses = 0
@@ -24,6 +24,9 @@ sys.path[:] = path_copy
 install_requires = [
     'six>=1.10.0',
     'promise>=2.1',
+]
+
+rx_requires = [
     'rx>=1.6.0',
 ]
 
@@ -36,7 +39,7 @@ tests_requires = [
     'six>=1.10.0',
     'pytest-benchmark==3.0.0',
     'pytest-mock==1.2',
-]
+] + rx_requires
 
 
 class PyTest(TestCommand):
@@ -86,6 +89,7 @@ setup(
         'gevent': [
             'gevent==1.1rc1'
         ],
+        'rx': rx_requires,
         'test': tests_requires
     }
 )
@@ -89,3 +89,34 @@ def test_asyncio_py35_executor_with_error():
     formatted_errors = list(map(format_error, result.errors))
     assert formatted_errors == [{'locations': [{'line': 1, 'column': 20}], 'message': 'resolver_2 failed!'}]
     assert result.data == {'a': 'hey', 'b': None}
+
+
+def test_asyncio_py35_schema_classifies_async_resolvers():
+    from graphql.utils.resolver_kind import ResolverKind
+
+    ast = parse('query Example { a, b }')
+
+    async def resolver(context, *_):
+        await asyncio.sleep(0.001)
+        return 'hey'
+
+    async def resolver_gen(context, *_):
+        yield 'hey'
+
+    def resolver_2(context, *_):
+        return 'hey2'
+
+    Type = GraphQLObjectType('Type', {
+        'a': GraphQLField(GraphQLString, resolver=resolver),
+        'b': GraphQLField(GraphQLString, resolver=resolver_2),
+        'c': GraphQLField(GraphQLString, resolver=resolver_gen),
+    })
+    schema = GraphQLSchema(Type)
+
+    assert schema.get_resolver_kind(Type.fields['a']) == ResolverKind.COROUTINE_FUNCTION
+    assert schema.get_resolver_kind(Type.fields['b']) == ResolverKind.FUNCTION
+    assert schema.get_resolver_kind(Type.fields['c']) == ResolverKind.ASYNC_GENERATOR_FUNCTION
+
+    result = execute(schema, ast, executor=AsyncioExecutor())
+    assert not result.errors
+    assert result.data == {'a': 'hey', 'b': 'hey2'}
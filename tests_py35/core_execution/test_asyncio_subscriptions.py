@@ -0,0 +1,216 @@
+# flake8: noqa
+import asyncio
+
+from graphql import parse, subscribe
+from graphql.execution.executors.asyncio import AsyncioExecutor
+from graphql.execution.executors.asyncio_iterators import (OverflowPolicy,
+                                                           SubscriptionOverflowError)
+from graphql.type import (GraphQLField, GraphQLInt, GraphQLObjectType,
+                          GraphQLSchema, GraphQLString)
+
+
+class Counter(object):
+    """An async iterable (compatible with Python 3.5) counting up to `stop`."""
+
+    def __init__(self, stop, error=None):
+        self.current = 0
+        self.stop = stop
+        self.error = error
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        if self.current == self.stop:
+            if self.error:
+                raise self.error
+            raise StopAsyncIteration
+        self.current += 1
+        return self.current
+
+    async def aclose(self):
+        self.closed = True
+
+
+def make_schema(counter):
+    Query = GraphQLObjectType('Query', {'a': GraphQLField(GraphQLString)})
+    Subscription = GraphQLObjectType('Subscription', {
+        'count': GraphQLField(GraphQLInt, resolver=lambda root, info: counter),
+    })
+    return GraphQLSchema(query=Query, subscription=Subscription)
+
+
+async def collect(iterator, delay=0):
+    results = []
+    async for result in iterator:
+        results.append(result)
+        await asyncio.sleep(delay)
+    return results
+
+
+def run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def test_subscribe_returns_an_async_iterator_of_results():
+    counter = Counter(3)
+    result = subscribe(make_schema(counter), parse('subscription { count }'), executor=AsyncioExecutor())
+
+    results = run(collect(result))
+    assert [r.data for r in results] == [{'count': 1}, {'count': 2}, {'count': 3}]
+    assert all(not r.errors for r in results)
+
+
+def test_subscribe_reports_source_errors():
+    counter = Counter(1, error=Exception('boom'))
+    result = subscribe(make_schema(counter), parse('subscription { count }'))
+
+    results = run(collect(result))
+    assert [r.data for r in results] == [{'count': 1}, {'count': None}]
+    assert str(results[1].errors[0]) == 'boom'
+
+
+def test_buffer_drops_oldest_results():
+    counter = Counter(10)
+    result = subscribe(make_schema(counter), parse('subscription { count }'),
+                       buffer_size=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+
+    async def slow_consumer():
+        first = await result.__anext__()
+        await asyncio.sleep(0.05)
+        return [first] + await collect(result)
+
+    results = run(slow_consumer())
+    assert [r.data['count'] for r in results] == [1, 9, 10]
+    assert result.dropped == 7
+
+
+def test_buffer_coalesces_latest_result():
+    counter = Counter(10)
+    result = subscribe(make_schema(counter), parse('subscription { count }'),
+                       buffer_size=1, overflow_policy=OverflowPolicy.COALESCE_LATEST)
+
+    async def slow_consumer():
+        first = await result.__anext__()
+        await asyncio.sleep(0.05)
+        return [first] + await collect(result)
+
+    results = run(slow_consumer())
+    assert [r.data['count'] for r in results] == [1, 10]
+
+
+def test_buffer_disconnects_on_overflow():
+    counter = Counter(10)
+    result = subscribe(make_schema(counter), parse('subscription { count }'),
+                       buffer_size=2, overflow_policy=OverflowPolicy.DISCONNECT)
+
+    async def slow_consumer():
+        await result.__anext__()
+        await asyncio.sleep(0.05)
+        try:
+            await result.__anext__()
+        except SubscriptionOverflowError as e:
+            return e
+
+    error = run(slow_consumer())
+    assert str(error) == 'Subscription buffer of 2 items overflowed.'
+    assert counter.closed
+
+
+def test_closing_the_iterator_closes_the_source():
+    counter = Counter(10)
+    result = subscribe(make_schema(counter), parse('subscription { count }'), buffer_size=5)
+
+    async def consume_one():
+        await result.__anext__()
+        await result.aclose()
+
+    run(consume_one())
+    assert counter.closed
+
+
+def test_merges_multiple_root_fields_into_one_stream():
+    first, second = Counter(2), Counter(3)
+    Query = GraphQLObjectType('Query', {'a': GraphQLField(GraphQLString)})
+    Subscription = GraphQLObjectType('Subscription', {
+        'first': GraphQLField(GraphQLInt, resolver=lambda root, info: first),
+        'second': GraphQLField(GraphQLInt, resolver=lambda root, info: second),
+    })
+    schema = GraphQLSchema(query=Query, subscription=Subscription)
+
+    result = subscribe(schema, parse('subscription { first second }'))
+    results = run(collect(result))
+
+    data = [r.data for r in results]
+    assert len(data) == 5
+    assert [d['first'] for d in data if 'first' in d] == [1, 2]
+    assert [d['second'] for d in data if 'second' in d] == [1, 2, 3]
+
+
+def test_event_window_coalesces_source_events():
+    from graphql.execution import EventWindow
+
+    counter = Counter(7)
+    result = subscribe(make_schema(counter), parse('subscription { count }'),
+                       event_window=EventWindow(count=3))
+
+    results = run(collect(result))
+    assert [r.data for r in results] == [{'count': 3}, {'count': 6}, {'count': 7}]
+
+
+def test_event_window_batches_by_time():
+    from graphql.execution import EventWindow
+
+    counter = Counter(4)
+    result = subscribe(make_schema(counter), parse('subscription { count }'),
+                       event_window=EventWindow(time=10, batch=True))
+
+    results = run(collect(result))
+    assert [r.data for r in results] == [{'count': [1, 2, 3, 4]}]
+
+
+def test_hub_shares_async_iterator_subscriptions():
+    from graphql.execution import SubscriptionHub
+
+    counter = Counter(3)
+    schema = make_schema(counter)
+    document = parse('subscription { count }')
+    hub = SubscriptionHub()
+
+    first = hub.subscribe(schema, document)
+    second = hub.subscribe(schema, document)
+    assert len(hub.groups) == 1
+
+    async def collect_both():
+        return await asyncio.gather(collect(first), collect(second))
+
+    first_results, second_results = run(collect_both())
+    assert [r.data for r in first_results] == [{'count': 1}, {'count': 2}, {'count': 3}]
+    assert [a is b for a, b in zip(first_results, second_results)] == [True] * 3
+    assert not hub.groups
+
+
+def test_hub_closes_the_source_when_the_last_subscriber_leaves():
+    from graphql.execution import SubscriptionHub
+
+    counter = Counter(10)
+    schema = make_schema(counter)
+    document = parse('subscription { count }')
+    hub = SubscriptionHub()
+
+    first = hub.subscribe(schema, document)
+    second = hub.subscribe(schema, document)
+
+    async def consume():
+        await first.__anext__()
+        await first.aclose()
+        assert not counter.closed
+        result = await second.__anext__()
+        await second.aclose()
+        return result
+
+    assert run(consume()).data == {'count': 1}
+    assert counter.closed
+    assert not hub.groups